@@ -0,0 +1,475 @@
+"""
+GoBot - Production Server
+ASGI entry point with bounded concurrency
+
+Usage:
+    python asgi.py --port 5000
+    uvicorn asgi:application
+
+Routes and request/response contracts are exactly those of server.py; the
+Flask app runs on a bounded thread pool so the event loop never blocks, and
+resume parsing itself is done by the parse worker processes in server.py.
+Frontend files are answered from memory on the event loop, so page loads
+never wait behind API requests for a thread.
+
+One server process is the default. Score sessions, job profile IDs, pool
+IDs and the parse cache live in the memory of the process that created
+them, so with several processes a follow-up call can land on one that has
+never seen its ID. Parsing and batch scoring already use every core
+through their own worker processes. Run more than one only behind a proxy
+that routes each client to the same process.
+
+Requests are admitted per traffic class. Uploads, batch routes and large
+bodies are 'bulk'; everything else is 'interactive'. Each class has its own
+share of the threads and its own bounded queue, so bulk imports cannot delay
+interactive calls. A request that does not fit its class's queue is
+answered 429 with a Retry-After estimate. The most expensive routes also
+keep their own concurrency cap, so one of them cannot take every bulk slot.
+"""
+
+import argparse
+import asyncio
+import io
+import math
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from server import app, metrics, static_assets
+
+# Configuration
+THREADS = int(os.environ.get('GOBOT_THREADS', 32))  # Flask handlers running at once, per worker
+MAX_PENDING = int(os.environ.get('GOBOT_MAX_PENDING', 1024))  # Connections in flight before shedding with 503
+BULK_SHARE = float(os.environ.get('GOBOT_BULK_SHARE', 0.125))  # Fraction of THREADS bulk requests may hold
+MAX_BULK_SHARE = 0.5  # Whatever BULK_SHARE says, interactive requests keep at least the other half
+QUEUED_COST = {'interactive': 512, 'bulk': 4096}  # Cost units each class may have waiting
+BULK_ROUTES = {
+    '/api/upload-resume',
+    '/api/extract-keywords/batch',
+    '/api/parse-text/batch',
+    '/api/rank',
+    '/api/score-matrix',
+    '/api/index/resumes'
+}
+BULK_COST = 16  # Requests estimated at this many cost units or more are bulk on any route
+COST_BYTES = 64 * 1024  # Bytes of JSON body that count as one cost unit
+FILE_COSTS = {'pdf': 4, 'docx': 2, 'doc': 2, 'txt': 1}  # Cost of an uploaded file's bytes relative to JSON
+ENDPOINT_LIMITS = {
+    # Expensive routes get their own cap so they cannot take every bulk thread
+    '/api/upload-resume': max(2, app.config['PARSE_WORKERS'] * 2),
+    '/api/extract-keywords/batch': 4,
+    '/api/parse-text/batch': 4,
+    '/api/rank': 4,
+    '/api/score-matrix': 2,
+    '/api/index/resumes': 4,
+    '/api/index/match': 8
+}
+
+
+class ClientDisconnected(Exception):
+    """The client went away before its request body was read"""
+
+
+def traffic_classes(threads, bulk_share):
+    """Split the handler threads between the classes: name -> (running at once, cost allowed to queue)"""
+    bulk = max(1, min(int(threads * bulk_share), int(threads * MAX_BULK_SHARE)))
+    return {
+        'interactive': (max(1, threads - bulk), QUEUED_COST['interactive']),
+        'bulk': (bulk, QUEUED_COST['bulk'])
+    }
+
+
+class TrafficClass:
+    """Admission for one class of requests: a fixed number running, a bounded cost waiting
+
+    Waiters are admitted in arrival order, and a finishing request hands its
+    slot straight to the next one. A request on a capped route holds its place
+    in the queue while it waits for the route, so it is counted and shed like
+    any other waiter.
+    """
+
+    def __init__(self, name, concurrency, max_queued_cost):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queued_cost = max_queued_cost
+        self.running = 0
+        self.waiting = deque()  # Futures of queued requests waiting for a slot
+        self.queued = 0  # Requests waiting, for a slot or for their route
+        self.queued_cost = 0
+        self.rejected = 0
+        self.seconds_per_cost = 0.01  # Moving average of handler time per cost unit
+
+    def has_room(self, cost, limit=None):
+        """True if the request can start now or fits in the queue"""
+        if self.running < self.concurrency and not self.waiting and (limit is None or not limit.locked()):
+            return True
+        return self.queued_cost + cost <= self.max_queued_cost
+
+    def retry_after(self):
+        """Seconds until the work queued now should have drained"""
+        return max(1, math.ceil(self.queued_cost * self.seconds_per_cost / self.concurrency))
+
+    async def acquire(self, cost, limit=None):
+        """Wait for a slot, and for the route's limit if it has one; False, without waiting, if the queue is full"""
+        if not self.has_room(cost, limit):
+            self.rejected += 1
+            return False
+
+        self.queued += 1
+        self.queued_cost += cost
+        try:
+            if limit is not None:
+                await limit.acquire()
+            try:
+                await self.take_slot()
+            except asyncio.CancelledError:
+                if limit is not None:
+                    limit.release()
+                raise
+        finally:
+            self.queued -= 1
+            self.queued_cost -= cost
+        return True
+
+    async def take_slot(self):
+        if self.running < self.concurrency and not self.waiting:
+            self.running += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self.waiting.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future in self.waiting:
+                self.waiting.remove(future)
+            elif not future.cancelled():
+                self.release()  # Handed a slot just as the client went away
+            raise
+
+    def release(self, limit=None):
+        if limit is not None:
+            limit.release()
+        while self.waiting:
+            future = self.waiting.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.running -= 1
+
+    def record(self, cost, seconds):
+        self.seconds_per_cost += 0.1 * (seconds / cost - self.seconds_per_cost)
+
+
+class GoBotASGI:
+    """Serve a WSGI app over ASGI with per-class admission control"""
+
+    FILENAME_PATTERN = re.compile(rb'filename="[^"]*\.(\w+)"')
+
+    def __init__(self, wsgi_app, threads, max_pending, traffic_classes, bulk_routes, endpoint_limits=None,
+                 assets=None, metrics=None):
+        self.wsgi_app = wsgi_app
+        self.assets = assets
+        self.executor = ThreadPoolExecutor(threads, thread_name_prefix='gobot')
+        self.max_pending = max_pending
+        self.pending = 0
+        self.classes = {name: TrafficClass(name, *limits) for name, limits in traffic_classes.items()}
+        self.bulk_routes = bulk_routes
+        self.limits = {path: asyncio.Semaphore(limit) for path, limit in (endpoint_limits or {}).items()}
+        self.metrics = metrics
+        self.wait_seconds = None
+
+    def register_metrics(self):
+        """Expose queue depth, running requests, waits and rejections per class
+
+        Done at startup rather than in __init__: the instance that serves is
+        the one uvicorn imports, not the one built when running asgi.py.
+        """
+        metrics = self.metrics
+        classes = self.classes.values()
+        metrics.gauge('gobot_admission_queue_depth', 'Requests waiting for admission',
+                      lambda: {(c.name,): c.queued for c in classes}, ('class',))
+        metrics.gauge('gobot_admission_queued_cost', 'Estimated cost units waiting for admission',
+                      lambda: {(c.name,): c.queued_cost for c in classes}, ('class',))
+        metrics.gauge('gobot_admission_running', 'Requests admitted and running',
+                      lambda: {(c.name,): c.running for c in classes}, ('class',))
+        metrics.gauge('gobot_admission_rejected_total', 'Requests shed with 429',
+                      lambda: {(c.name,): c.rejected for c in classes}, ('class',), kind='counter')
+        self.wait_seconds = metrics.histogram('gobot_admission_wait_seconds',
+                                              'Time requests waited for admission', ('class',))
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        if self.assets is not None and scope['method'] in ('GET', 'HEAD') and await self.send_asset(scope, send):
+            return
+
+        if self.pending >= self.max_pending:
+            await self.send_error(send, 503, 'Server busy, please retry shortly', retry_after=1)
+            return
+
+        self.pending += 1
+        try:
+            # Shed from the declared length before reading a body that could not be queued anyway
+            length = self.header(scope, b'content-length')
+            if length and length.isdigit():
+                cost = self.estimate_cost(int(length))
+                traffic_class = self.classify(scope['path'], cost)
+                if not traffic_class.has_room(cost, self.limits.get(scope['path'])):
+                    traffic_class.rejected += 1
+                    await self.send_overloaded(send, traffic_class)
+                    return
+
+            try:
+                body = await self.read_body(receive)
+            except ClientDisconnected:
+                return
+            if body is None:
+                await self.send_error(send, 413, 'Request too large')
+                return
+
+            disconnected = asyncio.Event()
+            watcher = asyncio.ensure_future(self.watch_disconnect(receive, disconnected))
+            try:
+                await self.admit(scope, body, send, disconnected)
+            finally:
+                watcher.cancel()
+        finally:
+            self.pending -= 1
+
+    @staticmethod
+    async def watch_disconnect(receive, disconnected):
+        """Set disconnected once the client goes away"""
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+        disconnected.set()
+
+    async def admit(self, scope, body, send, disconnected):
+        """Queue the request in its traffic class, then handle it
+
+        A request whose client left while it was queued is dropped unrun.
+        """
+        file_type = None
+        if (self.header(scope, b'content-type') or '').startswith('multipart/'):
+            match = self.FILENAME_PATTERN.search(body)
+            file_type = match.group(1).decode('latin-1').lower() if match else None
+        cost = self.estimate_cost(len(body), file_type)
+        traffic_class = self.classify(scope['path'], cost)
+
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        # Waiting for the route's cap first means a queued request never holds a class slot
+        limit = self.limits.get(scope['path'])
+        if not await traffic_class.acquire(cost, limit):
+            await self.send_overloaded(send, traffic_class)
+            return
+        try:
+            if disconnected.is_set():
+                return
+            started = loop.time()
+            if self.wait_seconds is not None:
+                self.metrics.observe(self.wait_seconds, (traffic_class.name,), started - queued_at)
+            await self.handle(scope, body, send, disconnected)
+            traffic_class.record(cost, loop.time() - started)
+        finally:
+            traffic_class.release(limit)
+
+    @staticmethod
+    def estimate_cost(length, file_type=None):
+        """Expected work for a request body, in units of a small JSON call"""
+        return 1 + length * FILE_COSTS.get(file_type, 1) // COST_BYTES
+
+    def classify(self, path, cost):
+        if path in self.bulk_routes or cost >= BULK_COST:
+            return self.classes['bulk']
+        return self.classes['interactive']
+
+    @staticmethod
+    def header(scope, name):
+        for key, value in scope['headers']:
+            if key == name:
+                return value.decode('latin-1')
+        return None
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                if self.metrics is not None and self.wait_seconds is None:
+                    self.register_metrics()
+                if self.assets is not None:
+                    await asyncio.get_running_loop().run_in_executor(self.executor, self.assets.ensure_loaded)
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def read_body(self, receive):
+        """Read the whole request body, or None if it exceeds MAX_CONTENT_LENGTH
+
+        Raises ClientDisconnected if the client goes away first.
+        """
+        max_length = self.wsgi_app.config['MAX_CONTENT_LENGTH']
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                raise ClientDisconnected()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if max_length and size > max_length:
+                return None
+            chunks.append(chunk)
+            if not message.get('more_body'):
+                return b''.join(chunks)
+
+    async def handle(self, scope, body, send, disconnected=None):
+        """Run the Flask app in the thread pool and relay its response
+
+        A streaming response stops being pulled once the client disconnects.
+        """
+        loop = asyncio.get_running_loop()
+        response, result, chunks, first = await loop.run_in_executor(
+            self.executor, self.start_wsgi, self.build_environ(scope, body)
+        )
+        try:
+            await send({'type': 'http.response.start', 'status': response['status'],
+                        'headers': response['headers']})
+            response['sent'] = True
+            chunk = first
+            while chunk is not None:
+                if disconnected is not None and disconnected.is_set():
+                    return
+                if chunk:
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                # Streaming bodies are pulled in the pool, one chunk at a time
+                chunk = await loop.run_in_executor(self.executor, next, chunks, None)
+            await send({'type': 'http.response.body', 'body': b''})
+        finally:
+            if hasattr(result, 'close'):
+                await loop.run_in_executor(self.executor, result.close)
+
+    async def send_asset(self, scope, send):
+        """Serve a frontend file from memory; False if the path is not one"""
+        path = scope['path'].lstrip('/') or 'index.html'
+        request_headers = {}
+        for name, value in scope['headers']:
+            if name in (b'accept-encoding', b'if-none-match'):
+                value = value.decode('latin-1')
+                request_headers[name] = f'{request_headers[name]},{value}' if name in request_headers else value
+        result = self.assets.respond(path, request_headers.get(b'accept-encoding'),
+                                     request_headers.get(b'if-none-match'))
+        if result is None:
+            return False
+
+        status, headers, body = result
+        headers = [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+        headers.append((b'content-length', str(len(body)).encode()))
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': b'' if scope['method'] == 'HEAD' else body})
+        return True
+
+    def start_wsgi(self, environ):
+        """Call the WSGI app and produce its first body chunk
+
+        Returns the response's status and headers, with 'sent' set by handle
+        once they have gone out, the app's iterable, an iterator over it and
+        the first chunk, which includes anything passed to write().
+        """
+        response = {'sent': False}
+        written = []
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info:
+                try:
+                    # Too late to replace the response; the error can only abort it
+                    if response['sent']:
+                        raise exc_info[1].with_traceback(exc_info[2])
+                finally:
+                    exc_info = None
+            elif 'status' in response:
+                raise AssertionError('start_response called twice without exc_info')
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                                   for name, value in headers]
+            return written.append
+
+        result = self.wsgi_app(environ, start_response)
+        chunks = iter(result)
+        first = next(chunks, None)
+        if written:
+            first = b''.join(written) + (first or b'')
+        return response, result, chunks, first
+
+    @staticmethod
+    def build_environ(scope, body):
+        """Translate an ASGI HTTP scope into a PEP 3333 environ"""
+        server = scope.get('server') or ('localhost', 80)
+        client = scope.get('client') or ('', 0)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+            'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+            'QUERY_STRING': scope['query_string'].decode('latin-1'),
+            'SERVER_NAME': server[0],
+            'SERVER_PORT': str(server[1]),
+            'REMOTE_ADDR': client[0],
+            'SERVER_PROTOCOL': f'HTTP/{scope["http_version"]}',
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': True,
+            'wsgi.run_once': False
+        }
+        for name, value in scope['headers']:
+            name = name.decode('latin-1').upper().replace('-', '_')
+            value = value.decode('latin-1')
+            if name in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+                key = name
+            else:
+                key = f'HTTP_{name}'
+            environ[key] = f'{environ[key]},{value}' if key in environ else value
+        return environ
+
+    async def send_overloaded(self, send, traffic_class):
+        await self.send_error(send, 429, f'Too many {traffic_class.name} requests queued, please retry shortly',
+                              retry_after=traffic_class.retry_after())
+
+    @staticmethod
+    async def send_error(send, status, message, retry_after=None):
+        body = ('{"success": false, "error": "%s"}' % message).encode('utf-8')
+        headers = [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+        if retry_after is not None:
+            headers.append((b'retry-after', str(retry_after).encode()))
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+
+application = GoBotASGI(app, THREADS, MAX_PENDING, traffic_classes(THREADS, BULK_SHARE), BULK_ROUTES,
+                        ENDPOINT_LIMITS, static_assets, metrics)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run GoBot in production mode')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Server processes; more than one needs sticky routing, see above')
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError:
+        sys.exit('Production mode requires uvicorn. Install with: pip install uvicorn')
+
+    uvicorn.run('asgi:application', host=args.host, port=args.port, workers=args.workers,
+                log_level='warning')
@@ -0,0 +1,99 @@
+"""
+GoBot - Hot path micro-benchmarks
+
+Times keyword extraction, parsing (text, PDF, DOCX), scoring and optimization
+on the synthetic corpus at several resume sizes.
+
+Usage:
+    python benchmarks/bench_core.py [--json results.json] [--baseline old.json]
+
+--json saves the results; --baseline prints each benchmark's speed relative
+to a previously saved run, e.g. one taken on the parent commit.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import corpus  # noqa: E402
+import report  # noqa: E402
+from server import ATSScoring, KeywordExtractor, ResumeOptimizer, ResumeParser  # noqa: E402
+
+# Resume shapes: (jobs, bullets per job)
+SIZES = {
+    'small': (1, 3),
+    'medium': (4, 6),
+    'large': (12, 10)
+}
+JOB_SIZES = {
+    'small': 1,
+    'medium': 4,
+    'large': 16
+}
+
+
+def measure(func, items, min_time):
+    """Call func on each item in turn until min_time has passed, timing every call"""
+    latencies = []
+    start = time.perf_counter()
+    while True:
+        for item in items:
+            call_start = time.perf_counter()
+            func(item)
+            latencies.append(time.perf_counter() - call_start)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return report.summarize(latencies, elapsed)
+
+
+def build_cases(count):
+    """Benchmark name -> (function, inputs)"""
+    cases = {}
+    job_keywords = KeywordExtractor.extract_from_job_description(corpus.job_descriptions(1, seed=99)[0])
+
+    for size, paragraphs in JOB_SIZES.items():
+        jobs = corpus.job_descriptions(count, seed=1, paragraphs=paragraphs)
+        cases[f'extract_keywords[{size}]'] = (KeywordExtractor.extract_from_job_description, jobs)
+
+    for size, (jobs, bullets) in SIZES.items():
+        texts = corpus.resume_texts(count, seed=2, jobs=jobs, bullets=bullets)
+        resumes = corpus.resumes(count, seed=3, jobs=jobs, bullets=bullets)
+        pdfs = [corpus.resume_pdf(text) for text in texts]
+        docxs = [corpus.resume_docx(text) for text in texts]
+
+        cases[f'parse_text[{size}]'] = (ResumeParser.parse_text, texts)
+        cases[f'parse_pdf[{size}]'] = (ResumeParser.parse_pdf, pdfs)
+        cases[f'parse_docx[{size}]'] = (ResumeParser.parse_docx, docxs)
+        cases[f'calculate_score[{size}]'] = (lambda r: ATSScoring.calculate_score(r, job_keywords), resumes)
+        cases[f'optimize[{size}]'] = (lambda r: ResumeOptimizer.optimize(r, job_keywords), resumes)
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=50, help='Distinct inputs per benchmark')
+    parser.add_argument('--min-time', type=float, default=1.0, help='Seconds spent on each benchmark')
+    parser.add_argument('--filter', help='Only run benchmarks whose name contains this')
+    parser.add_argument('--json', metavar='FILE', help='Save results as JSON')
+    parser.add_argument('--baseline', metavar='FILE', help='Compare against saved JSON results')
+    args = parser.parse_args()
+
+    results = {}
+    for name, (func, items) in build_cases(args.count).items():
+        if args.filter and args.filter not in name:
+            continue
+        func(items[0])  # warm up caches and lazy imports
+        results[name] = measure(func, items, args.min_time)
+
+    report.print_table(results, args.baseline)
+    if args.json:
+        report.write_results(args.json, 'core', results, ROOT, vars(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+GoBot - API load driver
+
+Runs concurrent clients against every /api/* route through Flask's test
+client (no network, no server process) and reports per-route throughput and
+p50/p95/p99 latency.
+
+Usage:
+    python benchmarks/bench_http.py [--clients 8] [--duration 10] [--json results.json]
+
+Uploads bypass the parse cache unless --parse-cache is given, so they
+measure real parsing. The resume index lives in a temporary database.
+"""
+
+import argparse
+import collections
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Keep benchmark writes out of the real resume index
+os.environ.setdefault('GOBOT_RESUME_INDEX_DB', os.path.join(tempfile.mkdtemp(prefix='gobot-bench-'), 'index.db'))
+
+import corpus  # noqa: E402
+import report  # noqa: E402
+import server  # noqa: E402
+
+
+class Scenario:
+    """One client's walk through every API route, with its own inputs"""
+
+    def __init__(self, client, seed, batch_size):
+        self.client = client
+        self.seed = seed
+        self.batch_size = batch_size
+        self.resumes = corpus.resumes(batch_size, seed=seed, jobs=4, bullets=6)
+        self.jobs = corpus.job_descriptions(8, seed=seed)
+        texts = corpus.resume_texts(4, seed=seed, jobs=4, bullets=6)
+        self.texts = texts
+        self.text = texts[0]
+        self.pdf = corpus.resume_pdf(texts[1])
+        self.docx = corpus.resume_docx(texts[2])
+        self.step = 0
+
+    def requests(self):
+        """Yield (route name, response) pairs for one pass over the API"""
+        client = self.client
+        self.step += 1
+        resume = self.resumes[self.step % len(self.resumes)]
+        job = self.jobs[self.step % len(self.jobs)]
+
+        yield 'GET /api/health', client.get('/api/health')
+        yield 'GET /api/taxonomy', client.get('/api/taxonomy')
+
+        response = client.post('/api/extract-keywords', json={'jobDescription': job})
+        profile_id = response.get_json()['profileId']
+        yield 'POST /api/extract-keywords', response
+
+        yield 'POST /api/extract-keywords/batch', client.post(
+            '/api/extract-keywords/batch', json={'jobDescriptions': self.jobs})
+        yield 'POST /api/calculate-score', client.post(
+            '/api/calculate-score', json={'resumeData': resume, 'jobProfileId': profile_id})
+
+        response = client.post('/api/score-sessions', json={'resumeData': resume, 'jobProfileId': profile_id})
+        session_id = response.get_json()['sessionId']
+        yield 'POST /api/score-sessions', response
+        yield 'PATCH /api/score-sessions/<id>', client.patch(
+            f'/api/score-sessions/{session_id}',
+            json={'patch': [{'op': 'add', 'path': '/experience/0/bullets/-', 'value': 'Led a team of 5 engineers'}]})
+        yield 'DELETE /api/score-sessions/<id>', client.delete(f'/api/score-sessions/{session_id}')
+
+        yield 'POST /api/rank', client.post(
+            '/api/rank', json={'resumes': self.resumes, 'jobProfileId': profile_id, 'topK': 5})
+        yield 'POST /api/score-matrix', client.post(
+            '/api/score-matrix', json={'resumes': self.resumes, 'jobDescriptions': self.jobs[:4]})
+
+        resume_id = f'bench-{self.seed}-{self.step}'
+        yield 'POST /api/index/resumes', client.post(
+            '/api/index/resumes', json={'resumes': [{'id': resume_id, 'resumeData': resume}]})
+        yield 'POST /api/index/match', client.post(
+            '/api/index/match', json={'jobProfileId': profile_id, 'topK': 5})
+        yield 'DELETE /api/index/resumes/<id>', client.delete(f'/api/index/resumes/{resume_id}')
+
+        yield 'POST /api/optimize-resume', client.post(
+            '/api/optimize-resume', json={'resumeData': resume, 'jobProfileId': profile_id})
+        yield 'POST /api/parse-text', client.post('/api/parse-text', json={'text': self.text})
+        yield 'POST /api/parse-text/batch', client.post(
+            '/api/parse-text/batch', json={'texts': self.texts})
+        yield 'POST /api/suggestions', client.post(
+            '/api/suggestions', json={'resumeSkills': ['Python', 'SQL'], 'jobProfileId': profile_id})
+
+        for name, content in (('resume.txt', self.text.encode('utf-8')), ('resume.pdf', self.pdf),
+                              ('resume.docx', self.docx)):
+            yield f'POST /api/upload-resume [{name.rsplit(".", 1)[1]}]', client.post(
+                '/api/upload-resume', data={'file': (io.BytesIO(content), name)},
+                content_type='multipart/form-data')
+
+        yield 'POST /api/analyze [text]', client.post(
+            '/api/analyze', json={'text': self.text, 'jobProfileId': profile_id})
+        yield 'POST /api/analyze [pdf]', client.post(
+            '/api/analyze', data={'file': (io.BytesIO(self.pdf), 'resume.pdf'), 'jobProfileId': profile_id},
+            content_type='multipart/form-data')
+        yield 'GET /api/metrics', client.get('/api/metrics')
+
+
+def run_client(seed, args, deadline, latencies, errors, lock):
+    scenario = Scenario(server.app.test_client(), seed, args.batch_size)
+    local_latencies = collections.defaultdict(list)
+    local_errors = collections.Counter()
+    while time.perf_counter() < deadline:
+        requests = scenario.requests()
+        while True:
+            start = time.perf_counter()
+            try:
+                name, response = next(requests)
+            except StopIteration:
+                break
+            local_latencies[name].append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                local_errors[name] += 1
+
+    with lock:
+        for name, values in local_latencies.items():
+            latencies[name].extend(values)
+        errors.update(local_errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=8, help='Concurrent client threads')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds to run')
+    parser.add_argument('--batch-size', type=int, default=25, help='Resumes per rank/score-matrix request')
+    parser.add_argument('--parse-cache', action='store_true', help='Let repeated uploads hit the parse cache')
+    parser.add_argument('--json', metavar='FILE', help='Save results as JSON')
+    parser.add_argument('--baseline', metavar='FILE', help='Compare against saved JSON results')
+    args = parser.parse_args()
+
+    if not args.parse_cache:
+        server.parse_cache.max_bytes = 0
+
+    latencies = collections.defaultdict(list)
+    errors = collections.Counter()
+    lock = threading.Lock()
+    start = time.perf_counter()
+    deadline = start + args.duration
+    clients = [threading.Thread(target=run_client, args=(seed, args, deadline, latencies, errors, lock))
+               for seed in range(args.clients)]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    results = {name: report.summarize(values, elapsed, errors[name]) for name, values in latencies.items()}
+    results['total'] = report.summarize([v for values in latencies.values() for v in values], elapsed,
+                                        sum(errors.values()))
+    report.print_table(results, args.baseline)
+    if args.json:
+        report.write_results(args.json, 'http', results, ROOT, vars(args))
+    os._exit(0)  # don't wait on idle parse and batch worker pools
+
+
+if __name__ == '__main__':
+    main()
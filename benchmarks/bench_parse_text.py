@@ -0,0 +1,66 @@
+"""
+GoBot - ResumeParser.parse_text throughput
+
+Usage:
+    python benchmarks/bench_parse_text.py [--resumes N] [--compare GIT_REV]
+
+--compare also loads server.py as it was at GIT_REV and reports both, e.g.
+--compare HEAD~1 to measure a parser change before and after.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import corpus  # noqa: E402
+
+
+def load_server(rev=None):
+    """Import server.py from the working tree, or from a git revision"""
+    if rev is None:
+        import server
+        return server
+    source = subprocess.check_output(['git', 'show', f'{rev}:server.py'], cwd=ROOT, text=True)
+    module = types.ModuleType(f'server_{rev}')
+    module.__file__ = os.path.join(ROOT, 'server.py')
+    exec(compile(source, module.__file__, 'exec'), module.__dict__)
+    return module
+
+
+def lines_per_second(server, texts, repeat):
+    total_lines = sum(len([line for line in text.split('\n') if line.strip()]) for text in texts)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            server.ResumeParser.parse_text(text)
+        best = min(best, time.perf_counter() - start)
+    return total_lines / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--resumes', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--compare', metavar='GIT_REV')
+    args = parser.parse_args()
+
+    texts = corpus.resume_texts(args.resumes, jobs=4, bullets=6)
+    current = lines_per_second(load_server(), texts, args.repeat)
+    print(f'working tree: {current:,.0f} lines/sec')
+
+    if args.compare:
+        before = lines_per_second(load_server(args.compare), texts, args.repeat)
+        print(f'{args.compare}: {before:,.0f} lines/sec')
+        print(f'speedup: {current / before:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+GoBot - HTTP serving throughput
+
+Starts the development server (server.py's app.run) and the production ASGI
+server (asgi.py), drives both with concurrent clients, and reports
+requests/sec and latency for each.
+
+Usage:
+    python benchmarks/bench_serving.py [--clients 32] [--duration 10] [--workers 1]
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import corpus  # noqa: E402
+
+SERVERS = {
+    'dev': lambda port, workers: [
+        sys.executable, '-c',
+        f'import server; server.app.run(debug=True, use_reloader=False, host="127.0.0.1", port={port})'
+    ],
+    'asgi': lambda port, workers: [
+        sys.executable, 'asgi.py', '--host', '127.0.0.1', '--port', str(port), '--workers', str(workers)
+    ]
+}
+
+
+def wait_until_up(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            connection.request('GET', '/api/health')
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'Server on port {port} did not start')
+
+
+def client(port, duration, seed, results):
+    """Send a mix of scoring and keyword requests until the deadline"""
+    resumes = corpus.resumes(20, seed=seed)
+    jobs = corpus.job_descriptions(20, seed=seed)
+    requests = [
+        ('/api/calculate-score', json.dumps({'resumeData': resume, 'jobDescription': job}))
+        for resume, job in zip(resumes, jobs)
+    ] + [('/api/extract-keywords', json.dumps({'jobDescription': job})) for job in jobs]
+
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    i = 0
+    while time.perf_counter() < deadline:
+        path, body = requests[i % len(requests)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            connection.request('POST', path, body, {'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+        latencies.append(time.perf_counter() - start)
+    results.put((latencies, errors))
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0
+
+
+def run(name, port, args):
+    server = subprocess.Popen(SERVERS[name](port, args.workers), cwd=ROOT,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_up(port)
+        results = multiprocessing.Queue()
+        clients = [multiprocessing.Process(target=client, args=(port, args.duration, i, results))
+                   for i in range(args.clients)]
+        for process in clients:
+            process.start()
+        collected = [results.get() for _ in clients]
+        for process in clients:
+            process.join()
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies = sorted(latency for batch, _ in collected for latency in batch)
+    return {
+        'server': name,
+        'requests': len(latencies),
+        'errors': sum(errors for _, errors in collected),
+        'rps': round(len(latencies) / args.duration, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--servers', nargs='+', default=list(SERVERS), choices=list(SERVERS))
+    parser.add_argument('--port', type=int, default=5601)
+    args = parser.parse_args()
+
+    for offset, name in enumerate(args.servers):
+        result = run(name, args.port + offset, args)
+        print(json.dumps(result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+GoBot - Worker startup time
+
+Imports server.py in fresh interpreters, as a new worker process does, and
+reports how long the import takes with the built-in taxonomy and with a large
+generated one, each compiled at import and loaded from a snapshot.
+
+Usage:
+    python benchmarks/bench_startup.py [--skills 25000] [--runs 10] [--json startup.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import corpus  # noqa: E402
+import report  # noqa: E402
+
+IMPORT_SCRIPT = 'import time; start = time.perf_counter(); import server; print(time.perf_counter() - start)'
+
+
+def import_times(env, runs):
+    """Seconds taken by 'import server' in each of several new interpreters"""
+    times = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT], cwd=ROOT, env=env, text=True)
+        times.append(float(output.strip().splitlines()[-1]))
+    return times
+
+
+def build_snapshot(path, taxonomy=None):
+    command = [sys.executable, os.path.join(ROOT, 'compile_taxonomy.py'), '-o', path]
+    subprocess.check_call(command + ([taxonomy] if taxonomy else []), cwd=ROOT, stderr=subprocess.DEVNULL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--skills', type=int, default=25000, help='Skills in the generated large taxonomy')
+    parser.add_argument('--runs', type=int, default=10, help='Imports timed per configuration')
+    parser.add_argument('--json', metavar='FILE', help='Save results as JSON')
+    parser.add_argument('--baseline', metavar='FILE', help='Compare against saved JSON results')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        large = os.path.join(tmp, 'taxonomy.json')
+        with open(large, 'w', encoding='utf-8') as file:
+            json.dump(corpus.taxonomy(args.skills), file)
+        build_snapshot(os.path.join(tmp, 'builtin.snapshot'))
+        build_snapshot(os.path.join(tmp, 'large.snapshot'), large)
+
+        base = {**os.environ, 'GOBOT_RESUME_INDEX_DB': os.path.join(tmp, 'index.db')}
+        base.pop('GOBOT_TAXONOMY', None)
+        base.pop('GOBOT_TAXONOMY_SNAPSHOT', None)
+        configurations = {
+            'import[builtin]': {},
+            'import[builtin,snapshot]': {'GOBOT_TAXONOMY_SNAPSHOT': os.path.join(tmp, 'builtin.snapshot')},
+            f'import[{args.skills} skills]': {'GOBOT_TAXONOMY': large},
+            f'import[{args.skills} skills,snapshot]': {
+                'GOBOT_TAXONOMY': large, 'GOBOT_TAXONOMY_SNAPSHOT': os.path.join(tmp, 'large.snapshot')
+            }
+        }
+
+        results = {}
+        for name, env in configurations.items():
+            start = time.perf_counter()
+            times = import_times({**base, **env}, args.runs)
+            results[name] = report.summarize(times, time.perf_counter() - start)
+
+    report.print_table(results, args.baseline)
+    if args.json:
+        report.write_results(args.json, 'startup', results, ROOT, vars(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""
+GoBot - Synthetic benchmark corpus
+Deterministic resumes and job descriptions for the benchmark scripts
+"""
+
+import random
+
+NAMES = ['Jane Doe', 'John Smith', 'Priya Patel', 'Wei Zhang', 'Maria Garcia', 'Alex Johnson']
+TITLES = ['Senior Software Engineer', 'Lead Developer', 'Data Analyst', 'Engineering Manager',
+          'Product Designer', 'Backend Developer', 'Director of Engineering']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries']
+DEGREES = ['Bachelor of Science in Computer Science', 'Master of Science in Data Science',
+           'MBA, Business Administration', 'Ph.D in Machine Learning']
+SKILLS = ['Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker', 'Kubernetes', 'PostgreSQL',
+          'MongoDB', 'Go', 'Rust', 'TypeScript', 'Terraform', 'GraphQL', 'Redis', 'Spark', 'Pandas',
+          'Machine Learning', 'CI/CD', 'Agile', 'Scrum', 'REST', 'Java', 'C++', 'SQL', 'Flask', 'Django']
+SOFT_SKILLS = ['Leadership', 'Communication', 'Teamwork', 'Problem solving', 'Mentoring',
+               'Stakeholder management', 'Time management', 'Critical thinking']
+VERBS = ['Built', 'Led', 'Designed', 'Implemented', 'Optimized', 'Migrated', 'Automated', 'Reduced',
+         'Worked on', 'Helped with', 'Responsible for', 'Scaled', 'Improved']
+OBJECTS = ['the payment service', 'a data pipeline', 'the React frontend', 'CI/CD for 12 services',
+           'the search cluster', 'onboarding flows', 'internal tooling', 'the reporting stack']
+RESULTS = ['cutting latency by 40%', 'serving 2,000,000 users', 'saving $120,000 a year',
+           'for 15 customers', 'with the platform team', 'across three regions', '']
+FILLER = ['collaborative', 'fast-paced', 'mission-driven', 'distributed', 'remote-first', 'growing']
+
+
+def make_bullet(rng):
+    """One experience bullet, sometimes without a verb or metric"""
+    return f'{rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(RESULTS)}'.strip()
+
+
+def make_resume_text(rng, jobs=3, bullets=5):
+    """Plain-text resume with the usual section headers"""
+    lines = [
+        rng.choice(NAMES),
+        f'{rng.choice(NAMES).split()[0].lower()}@example.com',
+        f'+1 (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}',
+        'linkedin.com/in/someone',
+        '',
+        'PROFESSIONAL SUMMARY',
+        f'{rng.choice(FILLER).capitalize()} engineer with {rng.randint(2, 15)} years of experience in '
+        f'{", ".join(rng.sample(SKILLS, 4))}.',
+        '',
+        'WORK EXPERIENCE',
+    ]
+    for _ in range(jobs):
+        lines.append(f'{rng.choice(TITLES)} | {rng.choice(COMPANIES)}')
+        lines.append(f'{rng.randint(2010, 2020)} - {rng.randint(2021, 2025)}')
+        lines.extend(f'• {make_bullet(rng)}' for _ in range(bullets))
+        lines.append('')
+    lines += ['EDUCATION', rng.choice(DEGREES), 'State University', '']
+    lines += ['TECHNICAL SKILLS', ', '.join(rng.sample(SKILLS, 10)), ', '.join(rng.sample(SOFT_SKILLS, 3)), '']
+    lines += ['PROJECTS', f'Side project using {rng.choice(SKILLS)} and {rng.choice(SKILLS)}']
+    return '\n'.join(lines)
+
+
+def make_resume_data(rng, jobs=3, bullets=5):
+    """Structured resume in the shape the API accepts"""
+    return {
+        'fullName': rng.choice(NAMES),
+        'email': 'someone@example.com',
+        'phone': '+1 555 123 4567' if rng.random() < 0.8 else '',
+        'summary': f'{rng.choice(FILLER).capitalize()} engineer experienced in {", ".join(rng.sample(SKILLS, 4))} '
+                   f'who enjoys building reliable systems and mentoring teammates across the organization.',
+        'experience': [
+            {
+                'title': rng.choice(TITLES),
+                'company': rng.choice(COMPANIES),
+                'bullets': [make_bullet(rng) for _ in range(bullets)]
+            }
+            for _ in range(jobs)
+        ],
+        'education': [{'degree': rng.choice(DEGREES), 'school': 'State University', 'graduationDate': '2015'}],
+        'technicalSkills': ', '.join(rng.sample(SKILLS, 10)),
+        'softSkills': ', '.join(rng.sample(SOFT_SKILLS, 3)),
+        'projects': [{'name': 'Side project', 'description': f'Built with {rng.choice(SKILLS)}', 'technologies': ''}]
+    }
+
+
+def make_job_description(rng, paragraphs=4):
+    """Job posting mentioning a random slice of the skill vocabulary"""
+    parts = [f'We are a {rng.choice(FILLER)} team hiring a {rng.choice(TITLES)}.']
+    for _ in range(paragraphs):
+        parts.append(
+            f'You will work with {", ".join(rng.sample(SKILLS, 5))} and bring strong '
+            f'{rng.choice(SOFT_SKILLS).lower()} skills. Requires {rng.randint(2, 10)}+ years of experience '
+            f'in a {rng.choice(FILLER)} environment, partnering with product and design.'
+        )
+    return '\n\n'.join(parts)
+
+
+def resume_texts(count, seed=0, **kwargs):
+    rng = random.Random(seed)
+    return [make_resume_text(rng, **kwargs) for _ in range(count)]
+
+
+def resumes(count, seed=0, **kwargs):
+    rng = random.Random(seed)
+    return [make_resume_data(rng, **kwargs) for _ in range(count)]
+
+
+def job_descriptions(count, seed=0, **kwargs):
+    rng = random.Random(seed)
+    return [make_job_description(rng, **kwargs) for _ in range(count)]
+
+
+def taxonomy(skills, seed=0):
+    """Taxonomy document (as for GOBOT_TAXONOMY) adding made-up skills to the built-in ones"""
+    rng = random.Random(seed)
+    suffixes = ['', '', ' js', ' db', '.io', ' cloud']
+    terms = set()
+    while len(terms) < skills:
+        length = rng.randint(3, 12)
+        terms.add(''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(length)) + rng.choice(suffixes))
+    return {'extend': True, 'technical': {'generated': sorted(terms)}}
+
+
+def resume_docx(text):
+    """Render a plain-text resume as .docx bytes, one paragraph per line"""
+    import io
+    from docx import Document
+
+    document = Document()
+    for line in text.split('\n'):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def resume_pdf(text, lines_per_page=50):
+    """Render a plain-text resume as a minimal text-only PDF"""
+    lines = [line.replace('•', '-').encode('latin-1', 'replace').decode('latin-1') for line in text.split('\n')]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    objects = ['<< /Type /Catalog /Pages 2 0 R >>', None,
+               '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    page_ids = []
+    for page in pages:
+        escaped = (line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') for line in page)
+        stream = 'BT /F1 10 Tf 14 TL 50 780 Td\n' + '\n'.join(f'({line}) Tj T*' for line in escaped) + '\nET'
+        objects.append(f'<< /Length {len(stream.encode("latin-1"))} >>\nstream\n{stream}\nendstream')
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>')
+        page_ids.append(len(objects))
+    objects[1] = f'<< /Type /Pages /Kids [{" ".join(f"{i} 0 R" for i in page_ids)}] /Count {len(page_ids)} >>'
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1')
+    xref = len(out)
+    out += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+    out += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode('latin-1')
+    out += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode('latin-1')
+    return bytes(out)
@@ -0,0 +1,71 @@
+"""
+GoBot - Benchmark reporting
+Latency summaries and JSON results that can be compared across commits
+"""
+
+import json
+import platform
+import subprocess
+import sys
+import time
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def summarize(latencies, elapsed, errors=0):
+    """Throughput and p50/p95/p99 latency (ms) for a list of per-call seconds"""
+    latencies = sorted(latencies)
+    return {
+        'calls': len(latencies),
+        'errors': errors,
+        'ops_per_sec': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3)
+    }
+
+
+def git_revision(root):
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=root, text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path, suite, results, root, settings):
+    """Save results with enough context to tell runs apart"""
+    document = {
+        'suite': suite,
+        'revision': git_revision(root),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': settings,
+        'results': results
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(document, file, indent=2)
+
+
+def print_table(results, baseline=None):
+    """Print one line per benchmark, with the change against a baseline file if given"""
+    previous = {}
+    if baseline:
+        with open(baseline, 'r', encoding='utf-8') as file:
+            previous = json.load(file)['results']
+
+    print(f'{"benchmark":<40} {"ops/s":>10} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"errors":>7}')
+    for name, result in results.items():
+        line = (f'{name:<40} {result["ops_per_sec"]:>10,.1f} {result["p50_ms"]:>9.3f} '
+                f'{result["p95_ms"]:>9.3f} {result["p99_ms"]:>9.3f} {result["errors"]:>7}')
+        before = previous.get(name)
+        if before and before['ops_per_sec']:
+            line += f'  {result["ops_per_sec"] / before["ops_per_sec"]:>6.2f}x'
+        print(line)
+    sys.stdout.flush()
@@ -0,0 +1,50 @@
+"""
+GoBot - Taxonomy Snapshot Builder
+Compile the skill taxonomy ahead of time so server workers start without compiling it
+
+Usage:
+    python compile_taxonomy.py -o taxonomy.snapshot
+    python compile_taxonomy.py skills.yaml -o taxonomy.snapshot
+
+Start the server with GOBOT_TAXONOMY_SNAPSHOT pointing at the output (and
+GOBOT_TAXONOMY at the same taxonomy file, if one was given). A snapshot only
+applies to the taxonomy it was built from; workers that find a mismatch log
+it and compile as before.
+"""
+
+import argparse
+import re
+import sys
+import time
+
+from server import Taxonomy, TaxonomySnapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompile the skill taxonomy into a snapshot file')
+    parser.add_argument('taxonomy', nargs='?', help='JSON or YAML taxonomy file (default: the built-in one)')
+    parser.add_argument('-o', '--output', required=True, help='Snapshot file to write')
+    args = parser.parse_args()
+
+    Taxonomy.SNAPSHOT = None  # Always compile from source
+    start = time.perf_counter()
+    try:
+        taxonomy = Taxonomy.load(args.taxonomy) if args.taxonomy else Taxonomy.builtin()
+    except (OSError, ValueError) as e:
+        sys.exit(f'Could not load {args.taxonomy}: {e}')
+    compile_time = time.perf_counter() - start
+    size = TaxonomySnapshot.write(taxonomy, args.output)
+
+    re.purge()  # Time the regex compilation a fresh worker does
+    start = time.perf_counter()
+    if TaxonomySnapshot(args.output).read(taxonomy.version) is None:
+        sys.exit(f'{args.output} could not be read back')
+    load_time = time.perf_counter() - start
+
+    print(f'Taxonomy {taxonomy.version}: {len(taxonomy.matcher.canonical)} terms, '
+          f'compiled in {compile_time * 1000:.0f}ms', file=sys.stderr)
+    print(f'Wrote {args.output} ({size / 1024:.0f} KB), loads in {load_time * 1000:.0f}ms', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
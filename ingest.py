@@ -0,0 +1,118 @@
+"""
+GoBot - Bulk Resume Ingestion
+Parse a directory or zip archive of resumes across worker processes
+
+Usage:
+    python ingest.py resumes/ -o parsed.jsonl
+    python ingest.py resumes.zip --job-description posting.txt --workers 8
+
+Each resume becomes one JSON line on stdout (or --output), written as soon
+as it is parsed, so output order follows completion rather than file order.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import zipfile
+
+from server import ALLOWED_EXTENSIONS, ATSScoring, KeywordExtractor, ResumeParser, allowed_file, to_json
+
+# Per-process state, set up by init_worker
+_job_keywords = None
+_archives = {}
+
+
+def find_resumes(path):
+    """List (archive, name) entries for every resume in a directory or zip file"""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            return [(path, info.filename) for info in archive.infolist()
+                    if not info.is_dir() and allowed_file(info.filename)]
+
+    entries = []
+    for root, _, files in os.walk(path):
+        for name in sorted(files):
+            if allowed_file(name):
+                entries.append((None, os.path.join(root, name)))
+    return entries
+
+
+def read_entry(archive_path, name):
+    """Read a resume's bytes, keeping one open handle per archive in each worker"""
+    if archive_path is None:
+        with open(name, 'rb') as file:
+            return file.read()
+    if archive_path not in _archives:
+        _archives[archive_path] = zipfile.ZipFile(archive_path)
+    return _archives[archive_path].read(name)
+
+
+def init_worker(job_keywords):
+    global _job_keywords
+    _job_keywords = job_keywords
+
+
+def ingest_one(entry):
+    """Parse, and optionally score, a single resume"""
+    archive_path, name = entry
+    record = {'file': name}
+    try:
+        parsed = ResumeParser.parse_file(read_entry(archive_path, name), name)
+    except Exception as e:
+        parsed = {'error': str(e)}
+
+    if parsed.get('error'):
+        record.update({'success': False, 'error': parsed['error']})
+        return record
+
+    record.update({'success': True, 'parsedResume': parsed})
+    if _job_keywords is not None:
+        record['score'] = ATSScoring.calculate_score(parsed, _job_keywords)
+    return record
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Parse a directory or zip archive of resumes into JSON Lines',
+        epilog=f'Supported file types: {", ".join(sorted(ALLOWED_EXTENSIONS))}'
+    )
+    parser.add_argument('source', help='Directory or .zip archive of resumes')
+    parser.add_argument('-o', '--output', help='Write JSON Lines here instead of stdout')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1, help='Worker processes')
+    parser.add_argument('-j', '--job-description', metavar='FILE',
+                        help='Score every resume against the job description in FILE')
+    parser.add_argument('--chunk-size', type=int, default=16, help='Resumes handed to a worker at a time')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        parser.error(f'{args.source} does not exist')
+
+    job_keywords = None
+    if args.job_description:
+        with open(args.job_description, 'r', encoding='utf-8') as file:
+            job_keywords = KeywordExtractor.extract_from_job_description(file.read())
+
+    entries = find_resumes(args.source)
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    start = time.perf_counter()
+    failed = 0
+
+    try:
+        with multiprocessing.Pool(args.workers, initializer=init_worker, initargs=(job_keywords,)) as pool:
+            for record in pool.imap_unordered(ingest_one, entries, chunksize=args.chunk_size):
+                failed += not record['success']
+                output.write(to_json(record) + '\n')
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    rate = len(entries) / elapsed if elapsed else 0
+    print(f'Ingested {len(entries)} resumes ({failed} failed) in {elapsed:.1f}s, {rate:.0f}/s',
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
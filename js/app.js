@@ -314,7 +314,7 @@ const App = {
             PreviewRenderer.updateScoreDisplay(score);
 
             // Get skill suggestions
-            const currentSkills = (formData.technicalSkills + ' ' + formData.softSkills).split(',').map(s => s.trim());
+            const currentSkills = (formData.technicalSkills + ',' + formData.softSkills).split(',').map(s => s.trim());
             const suggestions = KeywordExtractor.getSuggestions(currentSkills, keywords);
             PreviewRenderer.updateSuggestions(suggestions);
 
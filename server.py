@@ -3,26 +3,109 @@ GoBot - AI Resume Optimizer
 Python Flask Backend Server
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, abort, g, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import os
+import io
 import re
+import sys
+import copy
+import glob
+import gzip
 import json
-from werkzeug.utils import secure_filename
-
-app = Flask(__name__, static_folder='.', static_url_path='')
+import time
+import uuid
+import hashlib
+import sqlite3
+import threading
+import queue
+import heapq
+import random
+import bisect
+import cProfile
+import mimetypes
+import posixpath
+import multiprocessing
+from collections import Counter, OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, wraps
+from werkzeug.http import parse_accept_header, parse_etags
+
+try:
+    import numpy as np
+except ImportError:  # Optional: /api/score-matrix falls back to per-pair scoring
+    np = None
+
+try:
+    import orjson
+except ImportError:  # Optional: JSON falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # Optional: static assets are then precompressed with gzip only
+    brotli = None
+
+app = Flask(__name__, static_folder=None)  # The frontend is served by the AssetManifest below
 CORS(app)
 
 # Configuration
-UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc', 'txt'}
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+MAX_BATCH_SIZE = 5000  # Max items accepted by a batch endpoint
+BATCH_WORKERS = int(os.environ.get('GOBOT_BATCH_WORKERS', os.cpu_count() or 1))
+BATCH_CHUNK_SIZE = 50  # Items handed to a worker at a time
+STREAM_BLOCK_SIZE = 256  # Resumes scored at a time when streaming a score matrix
+MAX_PDF_PAGES = 20  # Pages read from a PDF before giving up on the rest
+MAX_PDF_CHARS = 200000  # Characters of extracted text kept from a PDF
+PARSE_WORKERS = int(os.environ.get('GOBOT_PARSE_WORKERS', os.cpu_count() or 1))  # 0 parses in the request thread
+PARSE_MAX_TASKS_PER_CHILD = 100  # Recycle parser processes to cap leaked memory
+PARSE_TIMEOUT = 30  # Seconds allowed per document
+PARSE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64MB of parsed resumes kept in memory
+PARSE_CACHE_DB = os.environ.get('GOBOT_PARSE_CACHE_DB')  # Optional SQLite file for a persistent tier
+PARSE_CACHE_DB_MAX_BYTES = 1024 * 1024 * 1024  # 1GB of parsed resumes kept in the SQLite tier
+RESUME_INDEX_DB = os.environ.get('GOBOT_RESUME_INDEX_DB', 'resume_index.db')  # Stored resume pool
+INDEX_CANDIDATE_FACTOR = 5  # Candidates fully scored per requested match
+JOB_PROFILE_CACHE_SIZE = 1024  # Compiled job profiles kept for reuse by ID
+BATCH_SCORER_CACHE_SIZE = 4  # Encoded resume pools kept for re-scoring against new jobs
+SCORE_SESSION_MAX = 10000  # Live-editing sessions kept server-side
+SCORE_SESSION_TTL = 60 * 60  # Seconds an idle session is kept
+TAXONOMY_FILE = os.environ.get('GOBOT_TAXONOMY')  # Optional JSON/YAML skill taxonomy replacing the built-in one
+TAXONOMY_CHECK_INTERVAL = 5  # Seconds between checks of the taxonomy file for changes
+TAXONOMY_SNAPSHOT = os.environ.get('GOBOT_TAXONOMY_SNAPSHOT')  # Optional precompiled taxonomy (compile_taxonomy.py)
+PROFILE_SAMPLE_RATE = float(os.environ.get('GOBOT_PROFILE_SAMPLE_RATE', 0))  # Fraction of requests run under cProfile
+PROFILE_DIR = os.environ.get('GOBOT_PROFILE_DIR', 'profiles')  # Where sampled .prof files are written
+STATIC_FILES = ('*.html', 'css/*.css', 'js/**/*.js')  # Frontend files served, relative to this file
+STATIC_MAX_AGE = 365 * 24 * 60 * 60  # Seconds browsers keep content-hashed assets
 
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
-
-# Create uploads folder if it doesn't exist
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+app.config['MAX_BATCH_SIZE'] = MAX_BATCH_SIZE
+app.config['BATCH_WORKERS'] = BATCH_WORKERS
+app.config['BATCH_CHUNK_SIZE'] = BATCH_CHUNK_SIZE
+app.config['STREAM_BLOCK_SIZE'] = STREAM_BLOCK_SIZE
+app.config['MAX_PDF_PAGES'] = MAX_PDF_PAGES
+app.config['MAX_PDF_CHARS'] = MAX_PDF_CHARS
+app.config['PARSE_WORKERS'] = PARSE_WORKERS
+app.config['PARSE_MAX_TASKS_PER_CHILD'] = PARSE_MAX_TASKS_PER_CHILD
+app.config['PARSE_TIMEOUT'] = PARSE_TIMEOUT
+app.config['PARSE_CACHE_MAX_BYTES'] = PARSE_CACHE_MAX_BYTES
+app.config['PARSE_CACHE_DB'] = PARSE_CACHE_DB
+app.config['PARSE_CACHE_DB_MAX_BYTES'] = PARSE_CACHE_DB_MAX_BYTES
+app.config['RESUME_INDEX_DB'] = RESUME_INDEX_DB
+app.config['INDEX_CANDIDATE_FACTOR'] = INDEX_CANDIDATE_FACTOR
+app.config['JOB_PROFILE_CACHE_SIZE'] = JOB_PROFILE_CACHE_SIZE
+app.config['BATCH_SCORER_CACHE_SIZE'] = BATCH_SCORER_CACHE_SIZE
+app.config['SCORE_SESSION_MAX'] = SCORE_SESSION_MAX
+app.config['SCORE_SESSION_TTL'] = SCORE_SESSION_TTL
+app.config['TAXONOMY_FILE'] = TAXONOMY_FILE
+app.config['TAXONOMY_CHECK_INTERVAL'] = TAXONOMY_CHECK_INTERVAL
+app.config['TAXONOMY_SNAPSHOT'] = TAXONOMY_SNAPSHOT
+app.config['PROFILE_SAMPLE_RATE'] = PROFILE_SAMPLE_RATE
+app.config['PROFILE_DIR'] = PROFILE_DIR
+app.config['STATIC_FILES'] = STATIC_FILES
+app.config['STATIC_MAX_AGE'] = STATIC_MAX_AGE
 
 
 def allowed_file(filename):
@@ -30,10 +113,586 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+# ============================================================================
+# Metrics
+# ============================================================================
+
+def format_labels(names, values):
+    return ','.join(f'{name}="{value}"' for name, value in zip(names, values))
+
+
+class Histogram:
+    """Prometheus-style histogram, one series per label set"""
+
+    BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help = help_text
+        self.label_names = label_names
+        self.series = {}  # label values -> [bucket counts..., sum]
+
+    def observe(self, labels, value):
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [0] * (len(self.BUCKETS) + 2)
+        series[bisect.bisect_left(self.BUCKETS, value)] += 1
+        series[-1] += value
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        for labels, series in sorted(self.series.items()):
+            label_text = format_labels(self.label_names, labels)
+            prefix = label_text + ',' if label_text else ''
+            cumulative = 0
+            for bound, count in zip(self.BUCKETS + ('+Inf',), series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{label_text}}} {series[-1]:.6f}')
+            lines.append(f'{self.name}_count{{{label_text}}} {cumulative}')
+        return lines
+
+
+class Metrics:
+    """Request counters, latency histograms and per-stage timings for /api/metrics
+
+    Stages record self time: a stage running inside another (parse_text
+    inside parse_docx, say) is subtracted from the outer one, so the stages
+    of a request add up to its total.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.requests = {}  # (method, route, status) -> count
+        self.request_seconds = Histogram('gobot_http_request_duration_seconds',
+                                         'Request latency by route', ('method', 'route'))
+        self.stage_seconds = Histogram('gobot_stage_duration_seconds',
+                                       'Self time spent in each pipeline stage', ('stage',))
+        self.histograms = [self.request_seconds, self.stage_seconds]
+        self.gauges = []  # (name, help, callback, label names, type)
+
+    def observe_request(self, method, route, status, seconds):
+        with self.lock:
+            key = (method, route, str(status))
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.request_seconds.observe((method, route), seconds)
+
+    def observe_stage(self, stage, seconds):
+        with self.lock:
+            self.stage_seconds.observe((stage,), seconds)
+        captured = getattr(self.local, 'captured', None)
+        if captured is not None:
+            captured.append((stage, seconds))
+
+    def stage(self, name):
+        """Context manager timing one stage"""
+        return StageTimer(self, name)
+
+    def timed(self, name):
+        """Decorator timing every call of a function as a stage"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with StageTimer(self, name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def capture(self, func, *args):
+        """Call func and also return the stages it recorded, for shipping out of a worker"""
+        self.local.captured = []
+        try:
+            return func(*args), self.local.captured
+        finally:
+            self.local.captured = None
+
+    def histogram(self, name, help_text, label_names):
+        """Add a histogram to the report; record into it with observe()"""
+        histogram = Histogram(name, help_text, label_names)
+        self.histograms.append(histogram)
+        return histogram
+
+    def observe(self, histogram, labels, value):
+        with self.lock:
+            histogram.observe(labels, value)
+
+    def gauge(self, name, help_text, callback, label_names=(), kind='gauge'):
+        """Report callback() on every scrape
+
+        With label_names, callback returns {label values: value}. kind may be
+        'counter' for a total the callback keeps itself.
+        """
+        self.gauges.append((name, help_text, callback, label_names, kind))
+
+    def render(self):
+        """Everything in the Prometheus text exposition format"""
+        with self.lock:
+            lines = ['# HELP gobot_http_requests_total Requests served by route and status',
+                     '# TYPE gobot_http_requests_total counter']
+            for (method, route, status), count in sorted(self.requests.items()):
+                lines.append(f'gobot_http_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+            for histogram in self.histograms:
+                lines += histogram.render()
+        for name, help_text, callback, label_names, kind in self.gauges:
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+            if label_names:
+                lines += [f'{name}{{{format_labels(label_names, labels)}}} {value}'
+                          for labels, value in sorted(callback().items())]
+            else:
+                lines.append(f'{name} {callback()}')
+        return '\n'.join(lines) + '\n'
+
+
+class StageTimer:
+    """Times a stage, excluding any stages nested inside it"""
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        local = self.metrics.local
+        self.parent = getattr(local, 'stage', None)
+        local.stage = self
+        self.nested = 0.0
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        self.metrics.local.stage = self.parent
+        if self.parent is not None:
+            self.parent.nested += elapsed
+        self.metrics.observe_stage(self.name, elapsed - self.nested)
+        return False
+
+
+metrics = Metrics()
+
+
+# ============================================================================
+# JSON
+# ============================================================================
+
+def json_default(obj):
+    """Serialize the resume model records; anything else unknown is an error"""
+    if isinstance(obj, Record):
+        return obj.fields()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def to_json(obj):
+    """Serialize to a JSON string, with orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which the stdlib handles
+    return json.dumps(obj, default=json_default)
+
+
+def from_json(text):
+    """Parse JSON text or bytes, with orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals, which the stdlib accepts
+    return json.loads(text)
+
+
 # ============================================================================
 # Keyword Extraction Module
 # ============================================================================
 
+def trie_pattern(words):
+    """Regex alternation of words shaped as a trie, preferring the longest match
+
+    Unlike a flat 'a|b|c' alternation, matching cost does not grow with the
+    number of words.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node):
+    branches = [re.escape(char) + _trie_node_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    return '(?:' + body + ')?' if '' in node else body
+
+
+class SkillMatcher:
+    """Find every skill of a fixed vocabulary in one pass over the text.
+
+    The vocabulary is compiled into a single trie-shaped regex, so the cost of
+    a scan depends on the text length rather than the number of skills. Skills
+    only match as whole words: 'r', 'go' and 'ai' no longer match inside
+    'react', 'google' or 'maintain'. A version number may follow a skill, so
+    'python3' and 'c++17' still count as python and c++.
+    """
+
+    # Digits straight after a term that does not itself end in one ('html5', not 's34')
+    VERSION_SUFFIX = r'(?:(?<!\d)\d+(?:\.\d+)*)?'
+
+    def __init__(self, groups, aliases=None):
+        # groups maps a group name (e.g. 'technical') to an ordered skill list
+        self.groups = {}
+        self.rank = {}
+        for group, skills in groups.items():
+            for skill in skills:
+                skill = skill.lower()
+                self.rank.setdefault(skill, len(self.rank))
+                self.groups.setdefault(skill, set()).add(group)
+        self.group_names = list(groups)
+
+        # Every term the text is searched for, mapped to the skill it reports;
+        # aliases ('k8s') are found like skills and reported as theirs ('kubernetes')
+        self.canonical = {skill: skill for skill in self.rank}
+        for alias, skill in (aliases or {}).items():
+            self.canonical.setdefault(alias.lower(), skill.lower())
+
+        # Shorter skills that a longer one starts with ('sql' in 'sql server')
+        # are reported alongside it, as the old substring scan did
+        self.prefixes = {}
+        for term in self.canonical:
+            self.prefixes[term] = [
+                self.canonical[term[:end]] for end in range(1, len(term))
+                if term[:end] in self.canonical and not self._is_word_char(term[end])
+            ]
+
+        # A zero-width lookahead lets matches overlap ('big data' and 'data science')
+        self.pattern = re.compile(
+            r'(?<!\w)(?=(' + trie_pattern(self.canonical) + ')' + self.VERSION_SUFFIX + r'(?!\w))'
+        )
+
+    def tables(self):
+        """The matcher as plain JSON-ready data, for storing in a snapshot"""
+        return {
+            'group_names': self.group_names,
+            'groups': {skill: sorted(groups) for skill, groups in self.groups.items()},
+            'rank': self.rank,
+            'canonical': self.canonical,
+            'prefixes': self.prefixes,
+            'pattern': self.pattern.pattern
+        }
+
+    @classmethod
+    def from_tables(cls, tables):
+        """Rebuild a matcher from tables(), compiling its regex but not building the trie"""
+        matcher = cls.__new__(cls)
+        matcher.group_names = list(tables['group_names'])
+        matcher.groups = {skill: set(groups) for skill, groups in tables['groups'].items()}
+        matcher.rank = dict(tables['rank'])
+        matcher.canonical = dict(tables['canonical'])
+        matcher.prefixes = {term: list(skills) for term, skills in tables['prefixes'].items()}
+        matcher.pattern = re.compile(tables['pattern'])
+        return matcher
+
+    @staticmethod
+    def _is_word_char(char):
+        return char.isalnum() or char == '_'
+
+    def match(self, text):
+        """Return matched skills per group, in vocabulary order"""
+        seen = set()
+        found = set()
+        for term in self.pattern.findall(text.lower()):
+            if term not in seen:
+                seen.add(term)
+                found.add(self.canonical[term])
+                found.update(self.prefixes[term])
+
+        result = {group: [] for group in self.group_names}
+        for skill in sorted(found, key=self.rank.__getitem__):
+            for group in self.groups[skill]:
+                result[group].append(skill)
+        return result
+
+
+class Taxonomy:
+    """A skill vocabulary compiled into the lookup structures matching runs on
+
+    Never modified once built: reloading compiles a new Taxonomy and swaps it
+    in with a single assignment to KeywordExtractor.TAXONOMY.
+    """
+
+    SNAPSHOT = None  # TaxonomySnapshot tried before compiling; set from TAXONOMY_SNAPSHOT
+
+    def __init__(self, technical, soft, action_verbs, normalization, aliases, source='builtin'):
+        self.technical = {category: list(skills) for category, skills in technical.items()}
+        self.soft = list(soft)
+        self.action_verbs = list(action_verbs)
+        self.normalization = {skill.lower(): name for skill, name in normalization.items()}
+        self.aliases = {alias.lower(): skill.lower() for alias, skill in aliases.items()}
+        self.source = source
+        self.version = hashlib.sha256(json.dumps(self.as_dict(), sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+        compiled = self.SNAPSHOT.read(self.version) if self.SNAPSHOT is not None else None
+        self.matcher, self.verb_pattern, self.display = compiled or self.compile()
+
+    def compile(self):
+        """Build the skill matcher, action verb pattern and display names"""
+        matcher = SkillMatcher({
+            'technical': [skill for skills in self.technical.values() for skill in skills],
+            'soft': self.soft
+        }, self.aliases)
+        # Bullets count as starting with an action verb if their first word begins with one
+        verb_pattern = re.compile(trie_pattern(verb.lower() for verb in self.action_verbs))
+        # Display names for the whole vocabulary, so every extraction shares the same strings
+        display = {skill: sys.intern(self.format_name(skill)) for skill in matcher.rank}
+        return matcher, verb_pattern, display
+
+    @classmethod
+    def builtin(cls):
+        """The vocabulary defined on KeywordExtractor"""
+        return cls(*cls.builtin_vocabulary())
+
+    @staticmethod
+    def builtin_vocabulary():
+        """(technical, soft, action_verbs, normalization, aliases) as defined on KeywordExtractor"""
+        return (KeywordExtractor.TECHNICAL_SKILLS, KeywordExtractor.SOFT_SKILLS, KeywordExtractor.ACTION_VERBS,
+                {skill.lower(): name for skill, name in KeywordExtractor.SKILL_NORMALIZATION.items()},
+                KeywordExtractor.SKILL_ALIASES)
+
+    @classmethod
+    def load(cls, path):
+        """Compile a taxonomy from a JSON or YAML file
+
+        Sections left out of the file keep their built-in values; with
+        "extend": true, the file's entries are added to the built-in ones
+        instead of replacing them.
+        """
+        ext = path.rsplit('.', 1)[-1].lower()
+        with open(path, 'r', encoding='utf-8') as file:
+            if ext == 'json':
+                data = json.load(file)
+            elif ext in ('yaml', 'yml'):
+                try:
+                    import yaml  # Imported here: it would add ~35ms to every worker's startup
+                except ImportError:
+                    raise ValueError('YAML taxonomies require PyYAML. Install with: pip install pyyaml')
+                try:
+                    data = yaml.safe_load(file)
+                except yaml.YAMLError as e:
+                    raise ValueError(str(e))
+            else:
+                raise ValueError(f'Unsupported taxonomy format: {ext}')
+        return cls.from_dict(data, source=path)
+
+    @classmethod
+    def from_dict(cls, data, source='builtin'):
+        """Validate and compile a taxonomy document"""
+        if not isinstance(data, dict):
+            raise ValueError('Taxonomy must be a mapping')
+        unknown = set(data) - {'technical', 'soft', 'actionVerbs', 'normalization', 'aliases', 'extend'}
+        if unknown:
+            raise ValueError(f'Unknown taxonomy sections: {", ".join(sorted(unknown))}')
+
+        technical = data.get('technical', {})
+        if not isinstance(technical, dict):
+            raise ValueError('technical must map categories to skill lists')
+        for category, skills in technical.items():
+            cls.check_terms(skills, f'technical.{category}')
+        soft = cls.check_terms(data.get('soft', []), 'soft')
+        action_verbs = cls.check_terms(data.get('actionVerbs', []), 'actionVerbs')
+        normalization = cls.check_mapping(data.get('normalization', {}), 'normalization')
+        aliases = cls.check_mapping(data.get('aliases', {}), 'aliases')
+
+        # Only the built-in word lists are needed here, not a compiled built-in taxonomy
+        builtin_technical, builtin_soft, builtin_verbs, builtin_normalization, builtin_aliases = \
+            cls.builtin_vocabulary()
+        if data.get('extend'):
+            technical = {**builtin_technical, **{
+                category: list(dict.fromkeys(builtin_technical.get(category, []) + skills))
+                for category, skills in technical.items()
+            }}
+            soft = list(dict.fromkeys(builtin_soft + soft))
+            action_verbs = list(dict.fromkeys(builtin_verbs + action_verbs))
+            normalization = {**builtin_normalization, **normalization}
+        else:
+            technical = technical if 'technical' in data else builtin_technical
+            soft = soft if 'soft' in data else builtin_soft
+            action_verbs = action_verbs if 'actionVerbs' in data else builtin_verbs
+            normalization = normalization if 'normalization' in data else builtin_normalization
+
+        skills = {skill.lower() for skill in soft} | {skill.lower() for s in technical.values() for skill in s}
+        for alias, skill in aliases.items():
+            if skill.lower() not in skills:
+                raise ValueError(f'Alias {alias!r} points at unknown skill {skill!r}')
+        if data.get('extend') or 'aliases' not in data:
+            # Built-in aliases are kept for whichever of their skills the taxonomy still has
+            aliases = {**{alias: skill for alias, skill in builtin_aliases.items() if skill in skills}, **aliases}
+
+        return cls(technical, soft, action_verbs, normalization, aliases, source)
+
+    @staticmethod
+    def check_terms(terms, name):
+        if not isinstance(terms, list) or not all(isinstance(term, str) and term.strip() for term in terms):
+            raise ValueError(f'{name} must be a list of non-empty strings')
+        return terms
+
+    @staticmethod
+    def check_mapping(mapping, name):
+        if not isinstance(mapping, dict) or not all(
+            isinstance(key, str) and key.strip() and isinstance(value, str) for key, value in mapping.items()
+        ):
+            raise ValueError(f'{name} must map strings to strings')
+        return mapping
+
+    def as_dict(self):
+        return {
+            'technical': self.technical,
+            'soft': self.soft,
+            'actionVerbs': self.action_verbs,
+            'normalization': self.normalization,
+            'aliases': self.aliases
+        }
+
+    def normalize(self, skill):
+        """Display name for a skill"""
+        name = self.display.get(skill)
+        return name if name is not None else self.format_name(skill)
+
+    def format_name(self, skill):
+        lower = skill.lower()
+        if lower in self.normalization:
+            return self.normalization[lower]
+        return ' '.join(word.capitalize() for word in skill.split())
+
+
+class TaxonomyWatcher:
+    """Reload a taxonomy file when it changes, looking at most every interval seconds
+
+    Checking only stats the file; compiling a changed one happens on a
+    background thread while requests keep using the current taxonomy.
+    """
+
+    def __init__(self, path, interval):
+        self.path = path
+        self.interval = interval
+        self.signature = None
+        self.next_check = 0
+        self.lock = threading.Lock()  # Held from a check that finds a change until its reload finishes
+        self.reloading = None  # The reload thread, while one runs
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def load(self):
+        """Load the file now, raising if it is missing or invalid"""
+        self.signature = self.stat()
+        KeywordExtractor.TAXONOMY = Taxonomy.load(self.path)
+        self.next_check = time.monotonic() + self.interval
+
+    def stat(self):
+        # Size and inode as well, since edits within one timestamp tick share an mtime
+        info = os.stat(self.path)
+        return info.st_mtime_ns, info.st_size, info.st_ino
+
+    def check(self):
+        """Start reloading the file in the background if it changed"""
+        if time.monotonic() < self.next_check or not self.lock.acquire(blocking=False):
+            return
+        try:
+            self.next_check = time.monotonic() + self.interval
+            signature = self.stat()
+            if signature != self.signature:
+                # Recorded first so a broken file is not retried until it changes again
+                self.signature = signature
+                self.reloading = threading.Thread(target=self.reload, name='taxonomy-reload', daemon=True)
+                self.reloading.start()
+                return  # The reload thread releases the lock
+        except OSError as e:
+            app.logger.warning(f'Keeping current taxonomy, could not load {self.path}: {e}')
+        self.lock.release()
+
+    def reload(self):
+        """Compile the file and swap it in; a broken file keeps the current taxonomy"""
+        try:
+            KeywordExtractor.TAXONOMY = Taxonomy.load(self.path)
+            app.logger.info(f'Loaded taxonomy {KeywordExtractor.TAXONOMY.version} from {self.path}')
+        except (OSError, ValueError) as e:
+            app.logger.warning(f'Keeping current taxonomy, could not load {self.path}: {e}')
+        finally:
+            self.reloading = None
+            self.lock.release()
+
+    def _after_fork(self):
+        # A reload running in the parent does not exist in a forked child, which redoes it itself
+        if self.reloading is not None:
+            self.reloading = None
+            self.signature = None
+            self.next_check = 0
+        self.lock = threading.Lock()
+
+
+class TaxonomySnapshot:
+    """A compiled taxonomy saved to a file that workers load instead of compiling
+
+    The file is JSON: a header line, then the matcher's lookup tables,
+    display names and the source of both regexes. Loading skips building the
+    trie and the tables; only the regexes are compiled again.
+
+    A snapshot is only used for the taxonomy version it was built from.
+    Anything else falls back to compiling.
+    """
+
+    FORMAT = 2
+
+    def __init__(self, path):
+        self.path = path
+
+    @classmethod
+    def write(cls, taxonomy, path):
+        """Save a compiled taxonomy; returns the snapshot size in bytes"""
+        body = to_json({
+            'tables': taxonomy.matcher.tables(),
+            'verbs': taxonomy.verb_pattern.pattern,
+            'display': taxonomy.display
+        }).encode('utf-8')
+        header = to_json({
+            'format': cls.FORMAT,
+            'taxonomy': taxonomy.version,
+            'checksum': hashlib.sha256(body).hexdigest()
+        }).encode('utf-8')
+
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(header + b'\n' + body)
+            size = file.tell()
+        os.replace(temp_path, path)  # Workers never see a half-written snapshot
+        return size
+
+    def read(self, version):
+        """(matcher, verb_pattern, display) for a taxonomy version, or None if this snapshot is not for it"""
+        try:
+            with open(self.path, 'rb') as file:
+                header = from_json(file.readline())
+                if header['format'] != self.FORMAT:
+                    raise ValueError('built by a different GoBot version, rebuild it')
+                if header['taxonomy'] != version:
+                    app.logger.info(f'Taxonomy snapshot {self.path} is for version {header["taxonomy"]}, '
+                                    f'compiling {version}')
+                    return None
+                body = file.read()
+            if hashlib.sha256(body).hexdigest() != header['checksum']:
+                raise ValueError('checksum mismatch, the file is damaged')
+            data = from_json(body)
+            matcher = SkillMatcher.from_tables(data['tables'])
+            verb_pattern = re.compile(data['verbs'])
+            display = {skill: sys.intern(name) for skill, name in data['display'].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, re.error) as e:
+            app.logger.warning(f'Ignoring taxonomy snapshot {self.path}: {e}')
+            return None
+        return matcher, verb_pattern, display
+
+
 class KeywordExtractor:
     """Extract relevant keywords from job descriptions"""
     
@@ -105,7 +764,23 @@ class KeywordExtractor:
         'fastapi': 'FastAPI'
     }
 
+    # Other spellings found in job descriptions, reported as the skill they stand for
+    SKILL_ALIASES = {
+        'reactjs': 'react',
+        'react.js': 'react',
+        'vuejs': 'vue',
+        'vue.js': 'vue',
+        'angularjs': 'angular',
+        'nodejs': 'node.js',
+        'nextjs': 'next.js',
+        'expressjs': 'express',
+        'golang': 'go',
+        'postgres': 'postgresql',
+        'k8s': 'kubernetes'
+    }
+
     @classmethod
+    @metrics.timed('extract_keywords')
     def extract_from_job_description(cls, job_description):
         """Extract keywords from job description"""
         if not job_description:
@@ -121,20 +796,14 @@ class KeywordExtractor:
             'all': []
         }
 
-        # Extract technical skills
-        for category, skills in cls.TECHNICAL_SKILLS.items():
-            for skill in skills:
-                if skill in text:
-                    normalized = cls.normalize_skill(skill)
-                    if normalized not in extracted['technical']:
-                        extracted['technical'].append(normalized)
-
-        # Extract soft skills
-        for skill in cls.SOFT_SKILLS:
-            if skill in text:
-                normalized = cls.normalize_skill(skill)
-                if normalized not in extracted['soft']:
-                    extracted['soft'].append(normalized)
+        # Extract technical and soft skills in a single pass over the text
+        taxonomy = cls.TAXONOMY
+        found = taxonomy.matcher.match(text)
+        for group in ('technical', 'soft'):
+            for skill in found[group]:
+                normalized = taxonomy.normalize(skill)
+                if normalized not in extracted[group]:
+                    extracted[group].append(normalized)
 
         # Extract experience requirements
         exp_patterns = [
@@ -145,42 +814,294 @@ class KeywordExtractor:
             matches = re.findall(pattern, job_description, re.IGNORECASE)
             extracted['experience'].extend(matches)
 
-        # Combine all keywords
-        extracted['all'] = list(set(extracted['technical'] + extracted['soft'] + extracted['requirements']))
+        # Combine all keywords, in a fixed order so every worker process returns the same list
+        extracted['all'] = list(dict.fromkeys(extracted['technical'] + extracted['soft'] + extracted['requirements']))
 
         return extracted
 
     @classmethod
     def normalize_skill(cls, skill):
         """Normalize skill name for display"""
-        lower = skill.lower()
-        if lower in cls.SKILL_NORMALIZATION:
-            return cls.SKILL_NORMALIZATION[lower]
-        return ' '.join(word.capitalize() for word in skill.split())
+        return cls.TAXONOMY.normalize(skill)
 
     @classmethod
-    def find_matches(cls, resume_text, job_keywords):
+    def find_matches(cls, resume_text, job_keywords, profile=None):
         """Find matching and missing keywords"""
         if not resume_text or not job_keywords:
             return {'matched': [], 'missing': []}
 
-        resume_lower = resume_text.lower()
+        profile = profile or JobProfile(job_keywords)
+        matched, missing = profile.split(profile.all, profile.all_lower, resume_text.lower())
+        return {'matched': matched, 'missing': missing}
+
+
+# Compiled (or loaded from a snapshot) once at import time and shared by every
+# request; replaced wholesale when a taxonomy file is configured and changes
+if app.config['TAXONOMY_SNAPSHOT']:
+    Taxonomy.SNAPSHOT = TaxonomySnapshot(app.config['TAXONOMY_SNAPSHOT'])
+taxonomy_watcher = None
+if app.config['TAXONOMY_FILE']:
+    taxonomy_watcher = TaxonomyWatcher(app.config['TAXONOMY_FILE'], app.config['TAXONOMY_CHECK_INTERVAL'])
+    taxonomy_watcher.load()
+else:
+    KeywordExtractor.TAXONOMY = Taxonomy.builtin()
+
+
+@app.before_request
+def refresh_taxonomy():
+    """Pick up taxonomy file changes; also called by batch worker processes"""
+    if taxonomy_watcher is not None:
+        taxonomy_watcher.check()
+
+
+class JobProfile:
+    """Job keywords prepared once and shared by every resume checked against them"""
+
+    __slots__ = ('keywords', 'id', 'all', 'technical', 'soft', 'all_lower', 'technical_lower', 'soft_lower',
+                 'technical_set')
+
+    def __init__(self, job_keywords, profile_id=None):
+        self.keywords = job_keywords or {}
+        self.id = profile_id or self.make_id(json.dumps(self.keywords, sort_keys=True))
+        self.all = list(self.keywords.get('all', []))
+        self.technical = list(self.keywords.get('technical', []))
+        self.soft = list(self.keywords.get('soft', []))
+        self.all_lower = [kw.lower() for kw in self.all]
+        self.technical_lower = [kw.lower() for kw in self.technical]
+        self.soft_lower = [kw.lower() for kw in self.soft]
+        self.technical_set = set(self.technical)
+
+    @staticmethod
+    def make_id(content):
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def split(keywords, keywords_lower, text_lower):
+        """Partition keywords into those found in already-lowercased text and the rest"""
         matched = []
         missing = []
+        for keyword, lower in zip(keywords, keywords_lower):
+            (matched if lower in text_lower else missing).append(keyword)
+        return matched, missing
+
+    def count_matches(self, text_lower):
+        return sum(1 for kw in self.all_lower if kw in text_lower)
+
+
+class JobProfileCache:
+    """LRU of job profiles, keyed by the hash of what they were built from"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.profiles = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, profile_id):
+        """Look up a profile by ID, or None if unknown or evicted"""
+        with self.lock:
+            profile = self.profiles.get(profile_id)
+            if profile is not None:
+                self.profiles.move_to_end(profile_id)
+            return profile
+
+    def for_description(self, job_description):
+        """Profile for a job description, extracting keywords only on a miss"""
+        # Extraction depends on the vocabulary, so a new taxonomy means new profiles
+        profile_id = JobProfile.make_id(f'description:{KeywordExtractor.TAXONOMY.version}:{job_description}')
+        profile = self.get(profile_id)
+        if profile is None:
+            keywords = KeywordExtractor.extract_from_job_description(job_description)
+            profile = self._store(JobProfile(keywords, profile_id))
+        return profile
+
+    def for_keywords(self, job_keywords):
+        """Profile for a keywords payload sent by the client"""
+        profile = JobProfile(job_keywords)
+        return self.get(profile.id) or self._store(profile)
+
+    def _store(self, profile):
+        with self.lock:
+            self.profiles[profile.id] = profile
+            self.profiles.move_to_end(profile.id)
+            while len(self.profiles) > self.max_entries:
+                self.profiles.popitem(last=False)
+        return profile
 
-        for keyword in job_keywords.get('all', []):
-            if keyword.lower() in resume_lower:
-                matched.append(keyword)
-            else:
-                missing.append(keyword)
 
-        return {'matched': matched, 'missing': missing}
+# ============================================================================
+# Resume Model
+# ============================================================================
+
+_MISSING = object()
+
+
+class Record(Mapping):
+    """Slotted, read-only record that reads like the dict it was built from
+
+    ATSScoring, ResumeOptimizer and jsonify take records and plain dicts
+    alike. Lists are stored as tuples, nested dicts as records, and the short
+    strings that repeat across a batch (titles, companies, schools) are
+    interned. Keys outside KEYS are kept in 'extra'.
+    """
+
+    __slots__ = ('extra',)
+    KEYS = ()  # Known keys, in output order
+    KEY_SET = frozenset()
+    NESTED = {}  # Key -> Record class for lists of sub-records
+    INTERNED = frozenset()  # Keys whose string values are interned
+
+    def __init__(self, data):
+        extra = None
+        for key, value in data.items():
+            if key not in self.KEY_SET:
+                extra = extra or {}
+                extra[key] = value
+                continue
+            if type(value) is str:
+                if key in self.INTERNED:
+                    value = sys.intern(value)
+            elif type(value) is list:
+                nested = self.NESTED.get(key)
+                value = tuple(nested(item) if nested and type(item) is dict else item for item in value)
+            setattr(self, key, value)
+        self.extra = extra
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.KEY_SET = frozenset(cls.KEYS)
+
+    def __getitem__(self, key):
+        if key in self.KEY_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self.extra is not None:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in self.KEY_SET:
+            return getattr(self, key, default)
+        return self.extra.get(key, default) if self.extra is not None else default
+
+    def __contains__(self, key):
+        if key in self.KEY_SET:
+            return hasattr(self, key)
+        return self.extra is not None and key in self.extra
+
+    def __iter__(self):
+        for key in self.KEYS:
+            if hasattr(self, key):
+                yield key
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __eq__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return self.to_dict() == (other.to_dict() if isinstance(other, Record) else other)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # Pickled as a plain dict: smaller and faster to send from the parse workers
+        return type(self), (self.fields(),)
+
+    def copy(self):
+        """Shallow, mutable dict copy, like dict.copy()"""
+        return self.fields()
+
+    def fields(self):
+        """Shallow dict of the keys that are set, values as stored; enough for a JSON encoder"""
+        result = {}
+        for key in self.KEYS:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                result[key] = value
+        if self.extra is not None:
+            result.update(self.extra)
+        return result
+
+    def to_dict(self):
+        """Plain dict, as the API sends and receives it"""
+        result = self.fields()
+        for key, value in result.items():
+            if type(value) is tuple:
+                if key in self.NESTED:
+                    result[key] = [item.to_dict() if isinstance(item, Record) else item for item in value]
+                else:
+                    result[key] = list(value)
+        return result
+
+
+class Experience(Record):
+    """One job: title and company strings, bullets a tuple of strings"""
+
+    KEYS = ('title', 'company', 'location', 'startDate', 'endDate', 'bullets')
+    __slots__ = KEYS
+    INTERNED = frozenset({'title', 'company', 'location', 'startDate', 'endDate'})
+
+
+class Education(Record):
+    KEYS = ('degree', 'school', 'field', 'graduationDate')
+    __slots__ = KEYS
+    INTERNED = frozenset(KEYS)
+
+
+class Project(Record):
+    KEYS = ('name', 'description', 'technologies')
+    __slots__ = KEYS
+    INTERNED = frozenset({'name', 'technologies'})
+
+
+class Resume(Record):
+    """A parsed resume; experience, education and projects are tuples of records"""
+
+    KEYS = ('fullName', 'email', 'phone', 'summary', 'experience', 'education', 'technicalSkills',
+            'softSkills', 'projects', 'certifications', 'rawText', 'truncated')
+    __slots__ = KEYS
+    NESTED = {'experience': Experience, 'education': Education, 'projects': Project}
 
 
 # ============================================================================
 # ATS Scoring Module
 # ============================================================================
 
+class ResumeFeatures:
+    """Everything ATSScoring needs from a resume, gathered in a single walk"""
+
+    __slots__ = ('text_lower', 'present', 'summary_length', 'total_bullets', 'good_bullets')
+
+    # Top-level fields whose presence the format and completeness scores check
+    FIELDS = ('fullName', 'email', 'phone', 'summary', 'experience', 'education',
+              'technicalSkills', 'softSkills', 'projects')
+
+    def __init__(self, resume_data):
+        self.refresh_fields(resume_data)
+        self.total_bullets = self.good_bullets = 0
+        self.text_lower = ATSScoring.get_full_resume_text(resume_data, self.add_bullet).lower()
+
+    def refresh_fields(self, resume_data):
+        """Recompute the cheap top-level field checks"""
+        self.present = frozenset(key for key in self.FIELDS if resume_data.get(key))
+        self.summary_length = len(resume_data.get('summary') or '')
+
+    def add_bullet(self, bullet, sign=1):
+        self.total_bullets += sign
+        if not bullet or len(bullet) < 20:
+            return
+        has_action_verb, has_metrics = ATSScoring.bullet_signals(bullet)
+        if (has_action_verb and has_metrics) or (has_action_verb and len(bullet) > 50) or has_metrics:
+            self.good_bullets += sign
+
+    def remove_bullet(self, bullet):
+        self.add_bullet(bullet, -1)
+
+
 class ATSScoring:
     """Calculate ATS compatibility score for resumes"""
     
@@ -191,16 +1112,30 @@ class ATSScoring:
         'completeness': 0.15
     }
 
+    # Finds a match exactly when r'\d+%?|\$[\d,]+|[\d,]+\s*(users?|customers?|clients?)' does
+    METRICS_PATTERN = re.compile(r'\d|\$,|,\s*(?:user|customer|client)', re.IGNORECASE)
+
     @classmethod
-    def calculate_score(cls, resume_data, job_keywords):
-        """Calculate overall ATS score"""
+    @metrics.timed('score')
+    def calculate_score(cls, resume_data, job_keywords, profile=None, features=None):
+        """Calculate overall ATS score
+
+        profile optionally holds job_keywords as a prepared JobProfile, so
+        callers scoring many resumes against one job build it only once.
+        features is the resume's ResumeFeatures, computed here if not given.
+        """
+        features = features or ResumeFeatures(resume_data)
         scores = {
-            'keywords': cls.calculate_keyword_score(resume_data, job_keywords),
-            'format': cls.calculate_format_score(resume_data),
-            'content': cls.calculate_content_score(resume_data),
-            'completeness': cls.calculate_completeness_score(resume_data)
+            'keywords': cls.calculate_keyword_score(resume_data, job_keywords, profile, features),
+            'format': cls.calculate_format_score(resume_data, features),
+            'content': cls.calculate_content_score(resume_data, features),
+            'completeness': cls.calculate_completeness_score(resume_data, features)
         }
+        return cls.combine_scores(scores, resume_data, job_keywords, features)
 
+    @classmethod
+    def combine_scores(cls, scores, resume_data, job_keywords, features=None):
+        """Blend the four sub-scores into the overall result with tips"""
         overall = int(
             scores['keywords'] * cls.WEIGHTS['keywords'] +
             scores['format'] * cls.WEIGHTS['format'] +
@@ -211,19 +1146,20 @@ class ATSScoring:
         return {
             'overall': min(100, max(0, overall)),
             'breakdown': scores,
-            'tips': cls.generate_tips(scores, resume_data, job_keywords)
+            'tips': cls.generate_tips(scores, resume_data, job_keywords, features)
         }
 
     @classmethod
-    def calculate_keyword_score(cls, resume_data, job_keywords):
+    def calculate_keyword_score(cls, resume_data, job_keywords, profile=None, features=None):
         """Calculate keyword matching score"""
         if not job_keywords or not job_keywords.get('all'):
             return 70
 
-        resume_text = cls.get_full_resume_text(resume_data).lower()
-        matched_count = sum(1 for kw in job_keywords['all'] if kw.lower() in resume_text)
+        profile = profile or JobProfile(job_keywords)
+        features = features or ResumeFeatures(resume_data)
+        matched_count = profile.count_matches(features.text_lower)
         
-        match_percentage = (matched_count / len(job_keywords['all'])) * 100 if job_keywords['all'] else 0
+        match_percentage = (matched_count / len(profile.all)) * 100
 
         if match_percentage >= 80:
             return 95
@@ -234,65 +1170,53 @@ class ATSScoring:
         return match_percentage * 1.67
 
     @classmethod
-    def calculate_format_score(cls, resume_data):
+    def calculate_format_score(cls, resume_data, features=None):
         """Calculate format score"""
+        present = (features or ResumeFeatures(resume_data)).present
         score = 100
 
-        if not resume_data.get('fullName'):
+        if 'fullName' not in present:
             score -= 15
-        if not resume_data.get('email'):
+        if 'email' not in present:
             score -= 15
-        if not resume_data.get('phone'):
+        if 'phone' not in present:
             score -= 5
-        if not resume_data.get('experience'):
+        if 'experience' not in present:
             score -= 10
 
         return max(0, score)
 
     @classmethod
-    def calculate_content_score(cls, resume_data):
+    def calculate_content_score(cls, resume_data, features=None):
         """Calculate content quality score"""
+        features = features or ResumeFeatures(resume_data)
         score = 0
-        total_bullets = 0
-        good_bullets = 0
-
-        for exp in resume_data.get('experience', []):
-            for bullet in exp.get('bullets', []):
-                total_bullets += 1
-                if cls.is_good_bullet_point(bullet):
-                    good_bullets += 1
 
-        if total_bullets > 0:
-            score += (good_bullets / total_bullets) * 60
+        if features.total_bullets > 0:
+            score += (features.good_bullets / features.total_bullets) * 60
         else:
             score += 30
 
-        summary = resume_data.get('summary', '')
-        if summary and 100 <= len(summary) <= 500:
+        if 100 <= features.summary_length <= 500:
             score += 20
-        elif summary and len(summary) > 50:
+        elif features.summary_length > 50:
             score += 10
 
-        if resume_data.get('technicalSkills') or resume_data.get('softSkills'):
+        if 'technicalSkills' in features.present or 'softSkills' in features.present:
             score += 20
 
         return min(100, score)
 
     @classmethod
-    def calculate_completeness_score(cls, resume_data):
+    def calculate_completeness_score(cls, resume_data, features=None):
         """Calculate completeness score"""
+        present = (features or ResumeFeatures(resume_data)).present
         sections = [
             ('fullName', 15), ('email', 15), ('phone', 5), ('summary', 15),
             ('experience', 20), ('education', 15), ('technicalSkills', 10), ('projects', 5)
         ]
 
-        score = 0
-        for key, weight in sections:
-            value = resume_data.get(key)
-            if value and (len(value) > 0 if isinstance(value, (list, str)) else True):
-                score += weight
-
-        return score
+        return sum(weight for key, weight in sections if key in present)
 
     @classmethod
     def is_good_bullet_point(cls, bullet):
@@ -300,19 +1224,20 @@ class ATSScoring:
         if not bullet or len(bullet) < 20:
             return False
 
-        words = bullet.lower().split()
-        if not words:
-            return False
-        
-        first_word = words[0]
-        has_action_verb = any(first_word.startswith(verb.lower()) for verb in KeywordExtractor.ACTION_VERBS)
-        has_metrics = bool(re.search(r'\d+%?|\$[\d,]+|[\d,]+\s*(users?|customers?|clients?)', bullet, re.IGNORECASE))
-
+        has_action_verb, has_metrics = cls.bullet_signals(bullet)
         return (has_action_verb and has_metrics) or (has_action_verb and len(bullet) > 50) or has_metrics
 
     @classmethod
-    def get_full_resume_text(cls, resume_data):
-        """Get full resume text for keyword matching"""
+    def bullet_signals(cls, bullet):
+        """Whether a bullet starts with an action verb, and whether it has metrics"""
+        words = bullet.lower().split(None, 1)
+        has_action_verb = bool(words) and KeywordExtractor.TAXONOMY.verb_pattern.match(words[0]) is not None
+        has_metrics = cls.METRICS_PATTERN.search(bullet) is not None
+        return has_action_verb, has_metrics
+
+    @classmethod
+    def get_full_resume_text(cls, resume_data, on_bullet=None):
+        """Get full resume text for keyword matching, calling on_bullet for every bullet on the way"""
         parts = []
         
         for key in ['fullName', 'summary', 'technicalSkills', 'softSkills', 'tools']:
@@ -321,7 +1246,11 @@ class ATSScoring:
 
         for exp in resume_data.get('experience', []):
             parts.extend([exp.get('title', ''), exp.get('company', '')])
-            parts.extend(exp.get('bullets', []))
+            bullets = exp.get('bullets') or []
+            parts.extend(bullets)
+            if on_bullet:
+                for bullet in bullets:
+                    on_bullet(bullet)
 
         for edu in resume_data.get('education', []):
             parts.extend([edu.get('degree', ''), edu.get('school', ''), edu.get('field', '')])
@@ -332,25 +1261,156 @@ class ATSScoring:
         return ' '.join(filter(None, parts))
 
     @classmethod
-    def generate_tips(cls, scores, resume_data, job_keywords):
+    def generate_tips(cls, scores, resume_data, job_keywords, features=None):
         """Generate improvement tips"""
+        features = features or ResumeFeatures(resume_data)
         tips = []
 
         if scores['keywords'] < 60:
             tips.append({'type': 'keywords', 'priority': 'high', 'text': 'Add more keywords from the job description'})
 
-        if not resume_data.get('phone'):
+        if 'phone' not in features.present:
             tips.append({'type': 'format', 'priority': 'medium', 'text': 'Add a phone number'})
 
         if scores['content'] < 70:
             tips.append({'type': 'content', 'priority': 'high', 'text': 'Use action verbs and include measurable achievements'})
 
-        if not resume_data.get('summary') or len(resume_data.get('summary', '')) < 50:
+        if features.summary_length < 50:
             tips.append({'type': 'content', 'priority': 'medium', 'text': 'Add a professional summary'})
 
         return tips[:5]
 
 
+class BatchScorer:
+    """Score many resumes against many jobs with matrix operations
+
+    Resumes are encoded once as a bit-packed skill-presence matrix over the
+    known vocabulary, so re-scoring the whole pool against new postings is a
+    matrix product. Results match ATSScoring.calculate_score exactly. Requires
+    NumPy. Safe to share between threads.
+    """
+
+    ROW_CHUNK = 4096  # Resumes unpacked at a time while scoring
+
+    def __init__(self, resumes, pool_id=None):
+        self.id = pool_id  # Set when cached in a BatchScorerCache
+        self.lock = threading.Lock()
+        features = [ResumeFeatures(resume) for resume in resumes]
+        self.texts = [feature.text_lower for feature in features]
+        self.columns = {}
+        self.packed = np.zeros((len(resumes), 0), dtype=np.uint8)
+
+        # Job-independent sub-scores are computed once per resume
+        self.format = np.array([ATSScoring.calculate_format_score(r, f) for r, f in zip(resumes, features)],
+                               dtype=np.float64)
+        self.content = np.array([ATSScoring.calculate_content_score(r, f) for r, f in zip(resumes, features)],
+                                dtype=np.float64)
+        self.completeness = np.array(
+            [ATSScoring.calculate_completeness_score(r, f) for r, f in zip(resumes, features)], dtype=np.float64
+        )
+
+        taxonomy = KeywordExtractor.TAXONOMY
+        self.add_columns(sorted({taxonomy.normalize(skill).lower() for skill in taxonomy.matcher.rank}))
+
+    def add_columns(self, keywords):
+        """Encode presence of keywords not yet in the vocabulary"""
+        new = [kw for kw in dict.fromkeys(keywords) if kw not in self.columns]
+        if not new:
+            return
+        # Same substring test as ATSScoring.calculate_keyword_score
+        block = np.array([[kw in text for kw in new] for text in self.texts], dtype=bool)
+        block = block.reshape(len(self.texts), len(new))
+        presence = np.hstack([self.unpack(0, len(self.texts)), block])
+        for kw in new:
+            self.columns[kw] = len(self.columns)
+        self.packed = np.packbits(presence, axis=1)
+
+    def unpack(self, start, end):
+        return np.unpackbits(self.packed[start:end], axis=1, count=len(self.columns)).astype(bool)
+
+    def score(self, profiles):
+        """Overall and keyword scores for every resume x job pair, plus per-resume sub-scores"""
+        # New jobs may add columns, which replaces the matrix being read
+        with self.lock:
+            self.add_columns(kw for profile in profiles for kw in profile.all_lower)
+
+            weights = np.zeros((len(self.columns), len(profiles)), dtype=np.float32)
+            for j, profile in enumerate(profiles):
+                for kw in profile.all_lower:
+                    weights[self.columns[kw], j] += 1
+
+            matched = np.empty((len(self.texts), len(profiles)), dtype=np.float64)
+            for start in range(0, len(self.texts), self.ROW_CHUNK):
+                end = start + self.ROW_CHUNK
+                matched[start:end] = self.unpack(start, end).astype(np.float32) @ weights
+
+        # Piecewise keyword curve from ATSScoring.calculate_keyword_score
+        totals = np.array([len(profile.all) for profile in profiles], dtype=np.float64)
+        percentage = (matched / np.where(totals > 0, totals, 1)) * 100
+        keywords = np.select(
+            [percentage >= 80, percentage >= 60, percentage >= 30],
+            [95, 75 + (percentage - 60), 50 + (percentage - 30) * 0.83],
+            percentage * 1.67
+        )
+        keywords = np.where(totals > 0, keywords, 70)
+
+        weights = ATSScoring.WEIGHTS
+        overall = np.trunc(
+            keywords * weights['keywords'] +
+            (self.format * weights['format'])[:, None] +
+            (self.content * weights['content'])[:, None] +
+            (self.completeness * weights['completeness'])[:, None]
+        )
+
+        return {
+            'overall': np.clip(overall, 0, 100).astype(int),
+            'keywords': keywords,
+            'format': self.format,
+            'content': self.content,
+            'completeness': self.completeness
+        }
+
+
+class BatchScorerCache:
+    """LRU of encoded resume pools, keyed by the hash of the resumes they were built from
+
+    Scoring a pool that was scored before, against the same jobs or new ones,
+    skips encoding it again; clients can also send a pool's ID in place of
+    its resumes.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.scorers = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, resumes):
+        """The BatchScorer for a list of resumes, encoding them only on a miss"""
+        # Encoding depends on the vocabulary, so a new taxonomy means new scorers
+        key = JobProfile.make_id(f'{KeywordExtractor.TAXONOMY.version}:{to_json(resumes)}')
+        scorer = self.lookup(key)
+        if scorer is not None:
+            return scorer
+
+        scorer = BatchScorer(resumes, key)
+        with self.lock:
+            self.scorers[key] = scorer
+            while len(self.scorers) > self.max_entries:
+                self.scorers.popitem(last=False)
+        return scorer
+
+    def lookup(self, pool_id):
+        """Look up a scorer by pool ID, or None if unknown or evicted"""
+        with self.lock:
+            scorer = self.scorers.get(pool_id)
+            if scorer is not None:
+                self.scorers.move_to_end(pool_id)
+            return scorer
+
+
+batch_scorers = BatchScorerCache(app.config['BATCH_SCORER_CACHE_SIZE'])
+
+
 # ============================================================================
 # Resume Parser Module
 # ============================================================================
@@ -358,31 +1418,84 @@ class ATSScoring:
 class ResumeParser:
     """Parse resume files into structured data"""
 
+    VERSION = 2  # Bump whenever a change alters parse output, so cached results are not reused
+
+    # Header synonyms per section, in priority order; see configure_headers
+    SECTION_HEADERS = {
+        'experience': ['experience', 'work'],
+        'education': ['education'],
+        'skills': ['skills', 'technical'],
+        'projects': ['projects'],
+        'summary': ['summary', 'objective']
+    }
+    MAX_HEADER_LENGTH = 50
+
+    TITLE_KEYWORDS = ['engineer', 'developer', 'manager', 'director', 'analyst', 'designer', 'lead', 'senior']
+    DEGREE_KEYWORDS = ['bachelor', 'master', 'ph.d', 'b.s', 'm.s', 'mba', 'associate']
+
+    NON_ALPHA_PATTERN = re.compile(r'[^a-z\s]')
+    EMAIL_PATTERN = re.compile(r'[\w.-]+@[\w.-]+\.\w+')
+    PHONE_PATTERN = re.compile(r'[\+]?[\d\s\-()]{10,}')
+    NUMBERED_BULLET_PATTERN = re.compile(r'^\d+\.')
+    BULLET_MARKER_PATTERN = re.compile(r'^[•\-*]\s*|\d+\.\s*')
+    TITLE_PATTERN = re.compile('|'.join(map(re.escape, TITLE_KEYWORDS)), re.IGNORECASE)
+    DEGREE_PATTERN = re.compile('|'.join(map(re.escape, DEGREE_KEYWORDS)), re.IGNORECASE)
+
     @classmethod
-    def parse_file(cls, filepath):
-        """Parse resume file based on extension"""
-        ext = filepath.rsplit('.', 1)[1].lower() if '.' in filepath else ''
+    def configure_headers(cls, headers):
+        """Compile a section -> header synonyms table into one lookup pattern"""
+        cls.SECTION_HEADERS = headers
+        cls.HEADER_SECTIONS = {}
+        for priority, (section, synonyms) in enumerate(headers.items()):
+            for synonym in synonyms:
+                cls.HEADER_SECTIONS.setdefault(synonym.lower(), (priority, section))
+        synonyms = sorted(cls.HEADER_SECTIONS, key=len, reverse=True)
+        # Lookahead so that overlapping synonyms are all found
+        cls.HEADER_PATTERN = re.compile('(?=(' + '|'.join(map(re.escape, synonyms)) + '))')
+
+    @classmethod
+    def parse_file(cls, source, filename=None):
+        """Parse resume file based on extension
+
+        source is a file path, a binary file object or raw bytes; for the
+        latter two, filename supplies the extension.
+        """
+        name = filename or (source if isinstance(source, str) else '')
+        ext = name.rsplit('.', 1)[1].lower() if '.' in name else ''
         
         if ext == 'pdf':
-            return cls.parse_pdf(filepath)
+            return cls.parse_pdf(source)
         elif ext in ['docx', 'doc']:
-            return cls.parse_docx(filepath)
+            return cls.parse_docx(source)
         elif ext == 'txt':
-            return cls.parse_txt(filepath)
+            return cls.parse_txt(source)
         else:
             raise ValueError(f"Unsupported file format: {ext}")
 
+    @staticmethod
+    def as_stream(source):
+        """Wrap raw bytes in a buffer; paths and file objects pass through"""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return io.BytesIO(source)
+        return source
+
     @classmethod
-    def parse_pdf(cls, filepath):
-        """Parse PDF file"""
+    def parse_pdf(cls, source, max_pages=None, max_chars=None):
+        """Parse PDF file, streaming pages into the parser
+
+        Text past max_pages pages or max_chars characters (MAX_PDF_PAGES and
+        MAX_PDF_CHARS by default) is left out, and the result is then marked
+        'truncated'.
+        """
         try:
             import PyPDF2
-            text = ""
-            with open(filepath, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
-            return cls.parse_text(text)
+            with metrics.stage('pdf_open'):
+                reader = PyPDF2.PdfReader(cls.as_stream(source))
+            return cls.parse_pages(PdfPages(
+                reader,
+                app.config['MAX_PDF_PAGES'] if max_pages is None else max_pages,
+                app.config['MAX_PDF_CHARS'] if max_chars is None else max_chars
+            ))
         except ImportError:
             # Fallback if PyPDF2 not installed
             return {'error': 'PDF parsing requires PyPDF2. Install with: pip install PyPDF2', 'rawText': ''}
@@ -390,11 +1503,12 @@ class ResumeParser:
             return {'error': str(e), 'rawText': ''}
 
     @classmethod
-    def parse_docx(cls, filepath):
+    @metrics.timed('docx_extract')
+    def parse_docx(cls, source):
         """Parse DOCX file"""
         try:
             from docx import Document
-            doc = Document(filepath)
+            doc = Document(cls.as_stream(source))
             text = "\n".join([para.text for para in doc.paragraphs])
             return cls.parse_text(text)
         except ImportError:
@@ -403,11 +1517,16 @@ class ResumeParser:
             return {'error': str(e), 'rawText': ''}
 
     @classmethod
-    def parse_txt(cls, filepath):
+    def parse_txt(cls, source):
         """Parse TXT file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                text = file.read()
+            if isinstance(source, str):
+                with open(source, 'r', encoding='utf-8') as file:
+                    text = file.read()
+            else:
+                text = cls.as_stream(source).read()
+                if not isinstance(text, str):
+                    text = text.decode('utf-8')
             return cls.parse_text(text)
         except Exception as e:
             return {'error': str(e), 'rawText': ''}
@@ -415,8 +1534,17 @@ class ResumeParser:
     @classmethod
     def parse_text(cls, text):
         """Parse resume text into structured data"""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        
+        return cls.parse_pages([text])
+
+    @classmethod
+    @metrics.timed('parse_text')
+    def parse_pages(cls, pages):
+        """Parse resume text delivered as an iterable of pages
+
+        pages may have a 'truncated' attribute, true once iterating it has
+        left part of the document out; the result then has 'truncated' set.
+        """
+        raw_pages = []
         parsed = {
             'fullName': '',
             'email': '',
@@ -428,66 +1556,75 @@ class ResumeParser:
             'softSkills': '',
             'projects': [],
             'certifications': [],
-            'rawText': text
+            'rawText': ''
         }
 
         current_section = 'header'
-        current_exp = None
 
-        for i, line in enumerate(lines):
-            lower_line = line.lower()
+        for page in pages:
+            raw_pages.append(page)
+            for line in page.split('\n'):
+                line = line.strip()
+                if line:
+                    current_section = cls.parse_line(line, current_section, parsed)
 
-            # Detect sections
-            if cls.is_section_header(line, 'experience') or cls.is_section_header(line, 'work'):
-                current_section = 'experience'
-                continue
-            elif cls.is_section_header(line, 'education'):
-                current_section = 'education'
-                continue
-            elif cls.is_section_header(line, 'skills') or cls.is_section_header(line, 'technical'):
-                current_section = 'skills'
-                continue
-            elif cls.is_section_header(line, 'projects'):
-                current_section = 'projects'
-                continue
-            elif cls.is_section_header(line, 'summary') or cls.is_section_header(line, 'objective'):
-                current_section = 'summary'
-                continue
+        parsed['rawText'] = ''.join(raw_pages)
+        if getattr(pages, 'truncated', False):
+            parsed['truncated'] = True
+        return Resume(parsed)
 
-            # Parse based on section
-            if current_section == 'header':
-                cls.parse_header_line(line, parsed)
-            elif current_section == 'summary':
-                parsed['summary'] += ' ' + line if parsed['summary'] else line
-            elif current_section == 'experience':
-                cls.parse_experience_line(line, parsed)
-            elif current_section == 'education':
-                cls.parse_education_line(line, parsed)
-            elif current_section == 'skills':
-                if parsed['technicalSkills']:
-                    parsed['technicalSkills'] += ', ' + line
-                else:
-                    parsed['technicalSkills'] = line
+    @classmethod
+    def parse_line(cls, line, current_section, parsed):
+        """Feed one non-empty line to the parser and return the new section"""
+        # Detect sections
+        section = cls.detect_section(line)
+        if section:
+            return section
+
+        # Parse based on section
+        if current_section == 'header':
+            cls.parse_header_line(line, parsed)
+        elif current_section == 'summary':
+            parsed['summary'] += ' ' + line if parsed['summary'] else line
+        elif current_section == 'experience':
+            cls.parse_experience_line(line, parsed)
+        elif current_section == 'education':
+            cls.parse_education_line(line, parsed)
+        elif current_section == 'skills':
+            if parsed['technicalSkills']:
+                parsed['technicalSkills'] += ', ' + line
+            else:
+                parsed['technicalSkills'] = line
 
-        return parsed
+        return current_section
+
+    @classmethod
+    def detect_section(cls, line):
+        """Return the section a header line starts, or None"""
+        if len(line) >= cls.MAX_HEADER_LENGTH:
+            return None
+        hits = cls.HEADER_PATTERN.findall(cls.NON_ALPHA_PATTERN.sub('', line.lower()))
+        if not hits:
+            return None
+        return min(cls.HEADER_SECTIONS[hit] for hit in hits)[1]
 
     @classmethod
     def is_section_header(cls, line, keyword):
         """Check if line is a section header"""
-        lower = re.sub(r'[^a-z\s]', '', line.lower())
-        return keyword in lower and len(line) < 50
+        lower = cls.NON_ALPHA_PATTERN.sub('', line.lower())
+        return keyword in lower and len(line) < cls.MAX_HEADER_LENGTH
 
     @classmethod
     def parse_header_line(cls, line, parsed):
         """Parse header line for contact info"""
         # Email
-        email_match = re.search(r'[\w.-]+@[\w.-]+\.\w+', line)
+        email_match = cls.EMAIL_PATTERN.search(line)
         if email_match:
             parsed['email'] = email_match.group()
             return
 
         # Phone
-        phone_match = re.search(r'[\+]?[\d\s\-()]{10,}', line)
+        phone_match = cls.PHONE_PATTERN.search(line)
         if phone_match:
             parsed['phone'] = phone_match.group().strip()
             return
@@ -501,8 +1638,8 @@ class ResumeParser:
     def parse_experience_line(cls, line, parsed):
         """Parse experience lines"""
         # Bullet points
-        if line.startswith(('•', '-', '*')) or re.match(r'^\d+\.', line):
-            bullet_text = re.sub(r'^[•\-*]\s*|\d+\.\s*', '', line)
+        if line.startswith(('•', '-', '*')) or cls.NUMBERED_BULLET_PATTERN.match(line):
+            bullet_text = cls.BULLET_MARKER_PATTERN.sub('', line)
             if parsed['experience']:
                 if 'bullets' not in parsed['experience'][-1]:
                     parsed['experience'][-1]['bullets'] = []
@@ -510,19 +1647,18 @@ class ResumeParser:
             return
 
         # Job title/company detection
-        title_keywords = ['engineer', 'developer', 'manager', 'director', 'analyst', 'designer', 'lead', 'senior']
-        if any(kw in line.lower() for kw in title_keywords):
+        if cls.TITLE_PATTERN.search(line):
+            parts = line.split('|')
             parsed['experience'].append({
-                'title': line.split('|')[0].strip() if '|' in line else line,
-                'company': line.split('|')[1].strip() if '|' in line and len(line.split('|')) > 1 else '',
+                'title': parts[0].strip() if len(parts) > 1 else line,
+                'company': parts[1].strip() if len(parts) > 1 else '',
                 'bullets': []
             })
 
     @classmethod
     def parse_education_line(cls, line, parsed):
         """Parse education lines"""
-        degree_patterns = ['bachelor', 'master', 'ph.d', 'b.s', 'm.s', 'mba', 'associate']
-        if any(p in line.lower() for p in degree_patterns):
+        if cls.DEGREE_PATTERN.search(line):
             parsed['education'].append({
                 'degree': line,
                 'school': '',
@@ -530,6 +1666,287 @@ class ResumeParser:
             })
 
 
+ResumeParser.configure_headers(ResumeParser.SECTION_HEADERS)
+
+
+class PdfPages:
+    """Extracted text of a PDF's pages, produced lazily within page and character limits
+
+    Every page is read up to the limits: with no closing header, a resume's
+    last section runs to the end of the document, so stopping any earlier
+    would cut it short.
+    """
+
+    def __init__(self, reader, max_pages, max_chars):
+        self.reader = reader
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.truncated = False  # Set once a limit has left text out
+
+    def __iter__(self):
+        remaining = self.max_chars
+        for index, page in enumerate(self.reader.pages):
+            if index >= self.max_pages:
+                self.truncated = True
+                return
+            with metrics.stage('pdf_page_extract'):
+                text = page.extract_text() + "\n"
+            if len(text) > remaining:
+                self.truncated = True
+                yield text[:remaining]
+                return
+            remaining -= len(text)
+            yield text
+
+
+# ============================================================================
+# Parse Worker Pool
+# ============================================================================
+
+def parse_file_with_stages(content, filename):
+    """Parse a file and return the stage timings with it"""
+    return metrics.capture(ResumeParser.parse_file, content, filename)
+
+
+def parse_worker(conn, parse):
+    """Worker process entry point: parse each (content, filename) sent until the pipe closes"""
+    while True:
+        try:
+            content, filename = conn.recv()
+        except EOFError:
+            return
+        try:
+            result = True, parse(content, filename)
+        except Exception as e:
+            result = False, e
+        conn.send(result)
+
+
+class ParseWorker:
+    """One parser process and the pipe it receives documents on"""
+
+    def __init__(self, context, parse):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=parse_worker, args=(child_conn, parse), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def stop(self):
+        """Let the process exit once it has finished, by closing its pipe"""
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ParsePool:
+    """Run ResumeParser.parse_file in worker processes with a per-document timeout
+
+    Each document goes to one idle worker. A worker that runs past the
+    timeout is killed and replaced on its own, so documents being parsed by
+    the other workers are unaffected. Workers are started with forkserver
+    (spawn where that is unavailable) rather than forked from the
+    multithreaded server.
+
+    parse is the module-level function workers call, returning the parse
+    result and its stage timings.
+    """
+
+    START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+    def __init__(self, workers, max_tasks_per_child, timeout, parse=parse_file_with_stages):
+        self.workers = workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.timeout = timeout
+        self.parse_function = parse
+        self.context = multiprocessing.get_context(self.START_METHOD)
+        if self.START_METHOD == 'forkserver':
+            # New workers then fork from a process that has already imported this module
+            self.context.set_forkserver_preload([__name__])
+        self.idle = None  # Queue of idle ParseWorkers, filled on first use
+        self.lock = threading.Lock()
+
+    def _get_idle(self):
+        with self.lock:
+            if self.idle is None:
+                idle = queue.Queue()
+                for _ in range(self.workers):
+                    idle.put(ParseWorker(self.context, self.parse_function))
+                self.idle = idle
+            return self.idle
+
+    def parse(self, content, filename):
+        """Parse uploaded bytes, returning a structured error on timeout"""
+        # parse_queue is the time spent waiting for and talking to a worker
+        with metrics.stage('parse_queue') as timer:
+            if self.workers <= 0:
+                return ResumeParser.parse_file(content, filename)
+
+            idle = self._get_idle()
+            try:
+                worker = idle.get(timeout=self.timeout)
+            except queue.Empty:
+                return self.timeout_error(f'No parser was free within {self.timeout} seconds')
+
+            try:
+                worker.conn.send((content, filename))
+                if not worker.conn.poll(self.timeout):
+                    # Only this document's worker is stopped; the others carry on
+                    worker = self._replace(worker)
+                    return self.timeout_error(f'Parsing timed out after {self.timeout} seconds')
+                ok, result = worker.conn.recv()
+                worker = self._recycle(worker)
+            except (OSError, EOFError):
+                worker = self._replace(worker)
+                raise RuntimeError('Parser process exited unexpectedly')
+            finally:
+                idle.put(worker)
+
+            if not ok:
+                raise result
+            parsed, stages = result
+
+            # Stage timings from the worker are merged into this process's metrics
+            for stage, seconds in stages:
+                metrics.observe_stage(stage, seconds)
+                timer.nested += seconds
+            return parsed
+
+    def _replace(self, worker):
+        """Kill a stuck or dead worker and start another in its place"""
+        worker.kill()
+        return ParseWorker(self.context, self.parse_function)
+
+    def _recycle(self, worker):
+        """The worker to put back: this one, or a new one once it has parsed max_tasks_per_child documents"""
+        worker.tasks += 1
+        if self.max_tasks_per_child and worker.tasks >= self.max_tasks_per_child:
+            worker.stop()
+            return ParseWorker(self.context, self.parse_function)
+        return worker
+
+    @staticmethod
+    def timeout_error(message):
+        return {'error': message, 'errorType': 'timeout', 'rawText': ''}
+
+    def close(self):
+        """Stop the idle workers; a later parse starts new ones"""
+        with self.lock:
+            idle, self.idle = self.idle, None
+        while idle is not None and not idle.empty():
+            idle.get_nowait().stop()
+
+
+parse_pool = ParsePool(
+    app.config['PARSE_WORKERS'], app.config['PARSE_MAX_TASKS_PER_CHILD'], app.config['PARSE_TIMEOUT']
+)
+
+
+# ============================================================================
+# Parse Cache
+# ============================================================================
+
+class ParseCache:
+    """LRU cache of parsed resumes keyed by the SHA-256 of the uploaded bytes
+
+    Both tiers are bounded: the memory tier by max_bytes, the optional SQLite
+    tier by db_max_bytes, evicting the entries least recently read from it.
+    """
+
+    DB_EVICT_FRACTION = 0.1  # Share of the SQLite tier freed at once when it is full
+
+    def __init__(self, max_bytes, db_path=None, db_max_bytes=None):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> serialized parse result
+        self.size = 0
+        self.lock = threading.Lock()
+        self.db = None
+        self.db_max_bytes = db_max_bytes
+        self.db_size = 0
+        if db_path:
+            self.db = sqlite3.connect(db_path, check_same_thread=False)
+            self.db.executescript('''
+                CREATE TABLE IF NOT EXISTS parsed_resumes (
+                    key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS parsed_resumes_by_use ON parsed_resumes (used);
+            ''')
+            self.db_size = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM parsed_resumes').fetchone()[0]
+
+    @staticmethod
+    def make_key(content, ext):
+        """Build the cache key; the extension selects the parser and the version its output"""
+        return f'{hashlib.sha256(content).hexdigest()}.{ext}.v{ResumeParser.VERSION}'
+
+    def get(self, key):
+        """Return a fresh copy of the cached result, or None"""
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            elif self.db is not None:
+                row = self.db.execute('SELECT value FROM parsed_resumes WHERE key = ?', (key,)).fetchone()
+                if row:
+                    value = row[0]
+                    self._store(key, value)
+                    with self.db:
+                        self.db.execute('UPDATE parsed_resumes SET used = ? WHERE key = ?', (time.time(), key))
+        return from_json(value) if value is not None else None
+
+    def put(self, key, parsed):
+        """Cache a successful parse result"""
+        value = to_json(parsed)
+        with self.lock:
+            self._store(key, value)
+            if self.db is not None:
+                self._store_db(key, value)
+
+    def _store_db(self, key, value):
+        """Add to the SQLite tier, evicting least recently used entries once it is full"""
+        size = len(value)
+        if self.db_max_bytes is not None and size > self.db_max_bytes:
+            return
+        with self.db:
+            row = self.db.execute('SELECT size FROM parsed_resumes WHERE key = ?', (key,)).fetchone()
+            self.db.execute('INSERT OR REPLACE INTO parsed_resumes (key, value, size, used) VALUES (?, ?, ?, ?)',
+                            (key, value, size, time.time()))
+            self.db_size += size - (row[0] if row else 0)
+            if self.db_max_bytes is None or self.db_size <= self.db_max_bytes:
+                return
+
+            # Free a little more than needed so the next puts do not each evict
+            target = self.db_size - self.db_max_bytes * (1 - self.DB_EVICT_FRACTION)
+            evicted = []
+            freed = 0
+            for evicted_key, evicted_size in self.db.execute('SELECT key, size FROM parsed_resumes ORDER BY used'):
+                if freed >= target:
+                    break
+                evicted.append((evicted_key,))
+                freed += evicted_size
+            self.db.executemany('DELETE FROM parsed_resumes WHERE key = ?', evicted)
+            self.db_size -= freed
+
+    def _store(self, key, value):
+        """Add to the memory tier, evicting least recently used entries"""
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key))
+        self.entries[key] = value
+        self.size += size
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+
+parse_cache = ParseCache(app.config['PARSE_CACHE_MAX_BYTES'], app.config['PARSE_CACHE_DB'],
+                         app.config['PARSE_CACHE_DB_MAX_BYTES'])
+
+
 # ============================================================================
 # Resume Optimizer Module
 # ============================================================================
@@ -538,32 +1955,78 @@ class ResumeOptimizer:
     """Optimize resumes for ATS compatibility"""
 
     @classmethod
-    def optimize(cls, resume_data, job_keywords):
-        """Optimize resume for specific job description"""
-        optimized = resume_data.copy()
+    def optimize(cls, resume_data, job_keywords, profile=None):
+        """Optimize resume for specific job description
+
+        resume_data is never modified; the result shares every section,
+        experience entry and bullet list that did not change with it.
+        """
+        patch, changes = cls.diff(resume_data, job_keywords, profile)
+        optimized = cls.apply_diff(resume_data, patch)
+        optimized['changes'] = changes
+        return optimized
+
+    @classmethod
+    @metrics.timed('optimize')
+    def diff(cls, resume_data, job_keywords, profile=None):
+        """Work out the optimizations as JSON-patch operations, plus the change notes"""
+        profile = profile or JobProfile(job_keywords)
+        patch = []
         changes = []
 
         # Optimize summary
-        if optimized.get('summary') and job_keywords.get('technical'):
-            result = cls.optimize_summary(optimized['summary'], job_keywords)
-            optimized['summary'] = result['text']
+        if resume_data.get('summary') and job_keywords.get('technical'):
+            result = cls.optimize_summary(resume_data['summary'], job_keywords)
+            patch += cls.field_operations(resume_data, 'summary', result['text'])
             changes.extend(result['changes'])
 
         # Optimize experience bullets
-        if optimized.get('experience'):
-            for i, exp in enumerate(optimized['experience']):
+        if resume_data.get('experience'):
+            for i, exp in enumerate(resume_data['experience']):
                 if exp.get('bullets'):
                     result = cls.optimize_bullets(exp['bullets'], job_keywords)
-                    optimized['experience'][i]['bullets'] = result['bullets']
+                    patch += cls.bullet_operations(i, exp['bullets'], result['bullets'])
                     changes.extend(result['changes'])
 
         # Optimize skills
-        result = cls.optimize_skills(optimized, job_keywords)
-        optimized['technicalSkills'] = result['technical']
-        optimized['softSkills'] = result['soft']
+        result = cls.optimize_skills(resume_data, job_keywords, profile)
+        patch += cls.field_operations(resume_data, 'technicalSkills', result['technical'])
+        patch += cls.field_operations(resume_data, 'softSkills', result['soft'])
         changes.extend(result['changes'])
 
-        optimized['changes'] = changes
+        return patch, changes
+
+    @staticmethod
+    def field_operations(resume_data, field, value):
+        """Patch setting a top-level field, empty if it already has that value"""
+        if field not in resume_data:
+            return [{'op': 'add', 'path': f'/{field}', 'value': value}]
+        if resume_data[field] != value:
+            return [{'op': 'replace', 'path': f'/{field}', 'value': value}]
+        return []
+
+    @staticmethod
+    def bullet_operations(index, bullets, optimized):
+        """Patch for one experience entry's bullets: each changed bullet, or the
+        whole list when empty bullets were dropped"""
+        path = f'/experience/{index}/bullets'
+        if len(optimized) != len(bullets):
+            return [{'op': 'replace', 'path': path, 'value': optimized}]
+        return [
+            {'op': 'replace', 'path': f'{path}/{i}', 'value': after}
+            for i, (before, after) in enumerate(zip(bullets, optimized)) if before != after
+        ]
+
+    @staticmethod
+    def apply_diff(resume_data, patch):
+        """Apply replace/add operations by copying only the containers on their paths"""
+        optimized = resume_data.copy()
+        copied = {id(optimized)}
+        for operation in patch:
+            tokens = parse_json_pointer(operation['path'])
+            node = copy_path(optimized, tokens, copied)
+            last = tokens[-1]
+            node[int(last) if isinstance(node, list) else last] = operation['value']
         return optimized
 
     @classmethod
@@ -601,11 +2064,11 @@ class ResumeOptimizer:
                 continue
 
             optimized = bullet.strip()
-            words = optimized.split()
+            words = optimized.split(None, 1)
             
             if words:
                 first_word = words[0].lower()
-                has_action_verb = any(first_word.startswith(v.lower()) for v in KeywordExtractor.ACTION_VERBS)
+                has_action_verb = KeywordExtractor.TAXONOMY.verb_pattern.match(first_word) is not None
 
                 if not has_action_verb and len(optimized) > 20:
                     verb = cls.select_action_verb(optimized)
@@ -617,8 +2080,9 @@ class ResumeOptimizer:
                         'keywords': [verb]
                     })
 
-            # Ensure proper capitalization and punctuation
-            optimized = optimized[0].upper() + optimized[1:] if optimized else ''
+            # Ensure proper capitalization and punctuation, building a new string only if needed
+            if optimized and optimized[0] != optimized[0].upper():
+                optimized = optimized[0].upper() + optimized[1:]
             if optimized and not optimized.endswith('.'):
                 optimized += '.'
 
@@ -651,16 +2115,17 @@ class ResumeOptimizer:
         return 'Executed'
 
     @classmethod
-    def optimize_skills(cls, resume_data, job_keywords):
+    def optimize_skills(cls, resume_data, job_keywords, profile=None):
         """Optimize skills section"""
         changes = []
         technical = resume_data.get('technicalSkills', '')
         soft = resume_data.get('softSkills', '')
 
         if job_keywords:
+            profile = profile or JobProfile(job_keywords)
+
             # Add missing technical skills
-            existing_technical = technical.lower()
-            missing_technical = [k for k in job_keywords.get('technical', []) if k.lower() not in existing_technical]
+            _, missing_technical = profile.split(profile.technical, profile.technical_lower, technical.lower())
 
             if missing_technical[:5]:
                 to_add = ', '.join(missing_technical[:5])
@@ -673,8 +2138,7 @@ class ResumeOptimizer:
                 })
 
             # Add missing soft skills
-            existing_soft = soft.lower()
-            missing_soft = [k for k in job_keywords.get('soft', []) if k.lower() not in existing_soft]
+            _, missing_soft = profile.split(profile.soft, profile.soft_lower, soft.lower())
 
             if missing_soft[:3]:
                 to_add = ', '.join(missing_soft[:3])
@@ -690,13 +2154,802 @@ class ResumeOptimizer:
 
 
 # ============================================================================
-# API Routes
+# Resume Index
 # ============================================================================
 
-@app.route('/')
-def serve_index():
-    """Serve the main application"""
-    return send_from_directory('.', 'index.html')
+class ResumeIndex:
+    """Persistent inverted index from normalized skill to stored resume IDs
+
+    Matching a job only fully scores the resumes sharing the most skills with
+    it, instead of every resume in the pool. Postings depend on the taxonomy
+    they were computed with; when it changes, they are rebuilt from the
+    stored resumes in the background.
+    """
+
+    REINDEX_BATCH = 200  # Resumes re-read and re-matched per hold of the lock while reindexing
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.db = None
+        self.lock = threading.Lock()
+        self.taxonomy = None  # Version of the taxonomy every stored posting was computed with
+        self.reindexing = None  # The reindex thread, while one runs
+
+    def _connect(self):
+        """Open the database on first use"""
+        if self.db is None:
+            self.db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.db.executescript('''
+                CREATE TABLE IF NOT EXISTS resumes (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS postings (
+                    skill TEXT NOT NULL, resume_id TEXT NOT NULL, PRIMARY KEY (skill, resume_id)
+                );
+                CREATE INDEX IF NOT EXISTS postings_by_resume ON postings (resume_id);
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            ''')
+            row = self.db.execute("SELECT value FROM meta WHERE key = 'taxonomy'").fetchone()
+            self.taxonomy = row[0] if row else None
+            if row is None and self.db.execute('SELECT 1 FROM resumes LIMIT 1').fetchone() is None:
+                # A new index has no postings to go stale: it starts on the current taxonomy
+                with self.db:
+                    self._record_taxonomy(self.db, KeywordExtractor.TAXONOMY.version)
+        return self.db
+
+    def _record_taxonomy(self, db, version):
+        db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('taxonomy', ?)", (version,))
+        self.taxonomy = version
+
+    @staticmethod
+    def skills_for(resume_data, taxonomy=None):
+        """Normalized skills mentioned anywhere in a resume"""
+        taxonomy = taxonomy or KeywordExtractor.TAXONOMY
+        found = taxonomy.matcher.match(ATSScoring.get_full_resume_text(resume_data))
+        return {taxonomy.normalize(skill) for skills in found.values() for skill in skills}
+
+    def add(self, resume_id, resume_data):
+        """Index a resume, replacing any earlier version with the same ID"""
+        resume_id = str(resume_id)
+        skills = self.skills_for(resume_data)
+        with self.lock:
+            db = self._connect()
+            with db:
+                db.execute('DELETE FROM postings WHERE resume_id = ?', (resume_id,))
+                db.execute('INSERT OR REPLACE INTO resumes (id, data) VALUES (?, ?)',
+                           (resume_id, to_json(resume_data)))
+                db.executemany('INSERT INTO postings (skill, resume_id) VALUES (?, ?)',
+                               [(skill, resume_id) for skill in skills])
+        return sorted(skills)
+
+    def remove(self, resume_id):
+        """Drop a resume from the index; returns False if it was not indexed"""
+        resume_id = str(resume_id)
+        with self.lock:
+            db = self._connect()
+            with db:
+                db.execute('DELETE FROM postings WHERE resume_id = ?', (resume_id,))
+                return db.execute('DELETE FROM resumes WHERE id = ?', (resume_id,)).rowcount > 0
+
+    def count(self):
+        with self.lock:
+            return self._connect().execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+
+    def candidates(self, skills, limit):
+        """IDs of the resumes sharing the most skills, best first"""
+        if not skills:
+            return []
+        skills = list(skills)
+        with self.lock:
+            rows = self._connect().execute(
+                f'''SELECT resume_id FROM postings WHERE skill IN ({', '.join('?' * len(skills))})
+                    GROUP BY resume_id ORDER BY COUNT(*) DESC, resume_id LIMIT ?''',
+                skills + [limit]
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def load(self, resume_ids):
+        """Stored resume data for the given IDs"""
+        if not resume_ids:
+            return {}
+        with self.lock:
+            rows = self._connect().execute(
+                f'SELECT id, data FROM resumes WHERE id IN ({", ".join("?" * len(resume_ids))})',
+                list(resume_ids)
+            ).fetchall()
+        return {resume_id: from_json(data) for resume_id, data in rows}
+
+    def refresh(self):
+        """Start a background reindex if the taxonomy changed; returns whether postings are stale
+
+        Until the reindex finishes, searches use the postings as stored,
+        some computed with the old taxonomy and some with the new one.
+        """
+        with self.lock:
+            self._connect()
+            if self.taxonomy == KeywordExtractor.TAXONOMY.version:
+                return False
+            if self.reindexing is None:
+                self.reindexing = threading.Thread(target=self.reindex, name='resume-reindex', daemon=True)
+                self.reindexing.start()
+            return True
+
+    def reindex(self):
+        """Recompute every stored resume's postings with the current taxonomy"""
+        taxonomy = KeywordExtractor.TAXONOMY
+        last_id = ''
+        try:
+            while True:
+                with self.lock:
+                    db = self._connect()
+                    rows = db.execute('SELECT id, data FROM resumes WHERE id > ? ORDER BY id LIMIT ?',
+                                      (last_id, self.REINDEX_BATCH)).fetchall()
+                    with db:
+                        if not rows:
+                            self._record_taxonomy(db, taxonomy.version)
+                            return
+                        for resume_id, data in rows:
+                            skills = self.skills_for(from_json(data), taxonomy)
+                            db.execute('DELETE FROM postings WHERE resume_id = ?', (resume_id,))
+                            db.executemany('INSERT INTO postings (skill, resume_id) VALUES (?, ?)',
+                                           [(skill, resume_id) for skill in skills])
+                last_id = rows[-1][0]
+        finally:
+            self.reindexing = None
+
+    def search(self, profile, top_k, candidate_factor):
+        """Top-K stored resumes for a job, fully scoring only the best candidates"""
+        stale = self.refresh()
+        candidate_ids = self.candidates(set(profile.technical + profile.soft), top_k * candidate_factor)
+        resumes = self.load(candidate_ids)
+
+        results = [
+            {'id': resume_id, 'score': ATSScoring.calculate_score(resumes[resume_id], profile.keywords, profile)}
+            for resume_id in candidate_ids if resume_id in resumes
+        ]
+        results.sort(key=lambda result: -result['score']['overall'])
+        return {'candidates': len(results), 'matches': results[:top_k], 'stale': stale}
+
+
+resume_index = ResumeIndex(app.config['RESUME_INDEX_DB'])
+job_profiles = JobProfileCache(app.config['JOB_PROFILE_CACHE_SIZE'])
+
+
+# ============================================================================
+# Score Sessions
+# ============================================================================
+
+def parse_json_pointer(path):
+    """Split a JSON pointer such as '/experience/0/bullets/2' into tokens"""
+    if not isinstance(path, str) or not path.startswith('/'):
+        raise ValueError(f'Invalid path: {path!r}')
+    return [token.replace('~1', '/').replace('~0', '~') for token in path[1:].split('/')]
+
+
+def copy_path(document, tokens, copied):
+    """Copy the containers on a JSON pointer's path, returning the target's parent
+
+    copied holds the ids of containers that are already copies and are left
+    as they are. Records and tuples come back as the plain dicts and lists
+    they stand for. Returns None if the path does not resolve, leaving the
+    error to apply_patch_operation.
+    """
+    node = document
+    for token in tokens[:-1]:
+        try:
+            key = int(token) if isinstance(node, list) else token
+            child = node[key]
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+        if isinstance(child, (Mapping, list, tuple)) and id(child) not in copied:
+            child = list(child) if type(child) is tuple else child.copy()
+            copied.add(id(child))
+            node[key] = child
+        node = child
+    return node
+
+
+# Fields of each list section that scoring reads
+RESUME_ENTRY_FIELDS = {
+    'experience': ('title', 'company', 'bullets'),
+    'education': ('degree', 'school', 'field'),
+    'projects': ('name', 'description', 'technologies')
+}
+
+
+def check_resume_field(key, value):
+    """Raise ValueError if a top-level resume field does not have the shape scoring reads"""
+    if key == 'summary':
+        if value is not None and not isinstance(value, str):
+            raise ValueError('summary must be a string')
+    elif key in RESUME_ENTRY_FIELDS:
+        if not isinstance(value, (list, tuple)) or not all(isinstance(entry, Mapping) for entry in value):
+            raise ValueError(f'{key} must be a list of objects')
+        for entry in value:
+            for field in RESUME_ENTRY_FIELDS[key]:
+                item = entry.get(field)
+                if field == 'bullets':
+                    if field in entry and (not isinstance(item, (list, tuple)) or not all(
+                            bullet is None or isinstance(bullet, str) for bullet in item)):
+                        raise ValueError(f'{key} bullets must be a list of strings')
+                elif item is not None and not isinstance(item, str):
+                    raise ValueError(f'{key} {field} must be a string')
+
+
+def apply_patch_operation(document, operation):
+    """Apply one JSON-patch style add/replace/remove operation in place"""
+    op = operation.get('op')
+    tokens = parse_json_pointer(operation.get('path'))
+    try:
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+
+        last = tokens[-1]
+        if isinstance(parent, list):
+            index = len(parent) if last == '-' and op == 'add' else int(last)
+            if not 0 <= index <= len(parent) - (op != 'add'):
+                raise IndexError(index)
+            if op == 'add':
+                parent.insert(index, operation['value'])
+            elif op == 'replace':
+                parent[index] = operation['value']
+            elif op == 'remove':
+                del parent[index]
+            else:
+                raise ValueError(f'Unsupported op: {op!r}')
+        elif isinstance(parent, dict):
+            if op in ('replace', 'remove') and last not in parent:
+                raise KeyError(last)
+            if op in ('add', 'replace'):
+                parent[last] = operation['value']
+            elif op == 'remove':
+                del parent[last]
+            else:
+                raise ValueError(f'Unsupported op: {op!r}')
+        else:
+            raise TypeError(type(parent).__name__)
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        raise ValueError(f'Cannot apply {op!r} at {operation.get("path")}: {e}')
+    return tokens
+
+
+class ScoreSession:
+    """Server-side copy of a resume being edited, rescored incrementally
+
+    Each patch only recomputes the sub-scores whose inputs it touched; an
+    edited bullet, for example, re-checks that job's bullets and reruns
+    calculate_content_score and the keyword match, nothing else.
+    """
+
+    # Sub-scores that read each top-level field
+    DEPENDENCIES = {
+        'fullName': {'keywords', 'format', 'completeness'},
+        'email': {'format', 'completeness'},
+        'phone': {'format', 'completeness'},
+        'summary': {'keywords', 'content', 'completeness'},
+        'experience': {'keywords', 'format', 'content', 'completeness'},
+        'education': {'keywords', 'completeness'},
+        'technicalSkills': {'keywords', 'content', 'completeness'},
+        'softSkills': {'keywords', 'content'},
+        'tools': {'keywords'},
+        'projects': {'keywords', 'completeness'}
+    }
+
+    def __init__(self, resume_data, profile):
+        for key, value in resume_data.items():
+            check_resume_field(key, value)
+        self.id = uuid.uuid4().hex
+        self.resume = copy.deepcopy(resume_data)
+        self.profile = profile
+        self.features = ResumeFeatures(self.resume)
+        self.taxonomy = KeywordExtractor.TAXONOMY
+        self.scores = {}
+        self.lock = threading.Lock()
+        self.touched = time.time()
+        self.result = self._rescore(set(self.DEPENDENCIES['experience']))
+
+    def apply(self, operations):
+        """Apply patch operations atomically; returns the names of recomputed sub-scores
+
+        Raises ValueError, leaving the session as it was, if an operation
+        does not apply or leaves a field in a shape scoring cannot read.
+        """
+        with self.lock:
+            # Only the containers on each operation's path are copied
+            resume = dict(self.resume)
+            copied = {id(resume)}
+            features = copy.copy(self.features)
+            affected = set()
+
+            for operation in operations:
+                tokens = parse_json_pointer(operation.get('path'))
+                copy_path(resume, tokens, copied)
+                before = self._experience_bullets(resume, tokens, operation.get('op'), before=True)
+                apply_patch_operation(resume, operation)
+                if tokens[0] in resume:
+                    check_resume_field(tokens[0], resume[tokens[0]])
+                after = self._experience_bullets(resume, tokens, operation.get('op'), before=False)
+                for bullet in before:
+                    features.remove_bullet(bullet)
+                for bullet in after:
+                    features.add_bullet(bullet)
+                affected |= self._affected_scores(tokens)
+
+            features.refresh_fields(resume)
+            if 'keywords' in affected:
+                features.text_lower = ATSScoring.get_full_resume_text(resume).lower()
+            if self.taxonomy is not KeywordExtractor.TAXONOMY:
+                # Bullet counts taken with the previous action verbs are redone from scratch
+                features = ResumeFeatures(resume)
+                affected |= self.DEPENDENCIES['experience']
+                self.taxonomy = KeywordExtractor.TAXONOMY
+
+            self.resume, self.features = resume, features
+            self.touched = time.time()
+            self.result = self._rescore(affected)
+            return sorted(affected)
+
+    @classmethod
+    def _affected_scores(cls, tokens):
+        if tokens[0] in ('experience', 'education', 'projects') and len(tokens) >= 3:
+            if tokens[0] == 'experience' and tokens[2] == 'bullets':
+                return {'keywords', 'content'}
+            return {'keywords'}
+        return cls.DEPENDENCIES.get(tokens[0], set())
+
+    @staticmethod
+    def _experience_bullets(resume, tokens, op, before):
+        """Bullets in the part of the experience list an operation touches"""
+        if tokens[0] != 'experience':
+            return []
+        experience = resume.get('experience')
+        if not isinstance(experience, list):
+            return []
+        if len(tokens) == 1:
+            return [bullet for exp in experience for bullet in exp.get('bullets') or ()]
+        # Adding or removing a whole entry has no old or no new bullets
+        if len(tokens) == 2 and op == ('add' if before else 'remove'):
+            return []
+        if tokens[1] == '-':
+            index = len(experience) - 1
+        else:
+            try:
+                index = int(tokens[1])
+            except ValueError:
+                return []
+        if 0 <= index < len(experience) and isinstance(experience[index], dict):
+            return list(experience[index].get('bullets') or ())
+        return []
+
+    def _rescore(self, affected):
+        resume, profile, features = self.resume, self.profile, self.features
+        if 'keywords' in affected:
+            self.scores['keywords'] = ATSScoring.calculate_keyword_score(resume, profile.keywords, profile, features)
+        if 'format' in affected:
+            self.scores['format'] = ATSScoring.calculate_format_score(resume, features)
+        if 'content' in affected:
+            self.scores['content'] = ATSScoring.calculate_content_score(resume, features)
+        if 'completeness' in affected:
+            self.scores['completeness'] = ATSScoring.calculate_completeness_score(resume, features)
+        return ATSScoring.combine_scores(dict(self.scores), resume, profile.keywords, features)
+
+
+class ScoreSessionStore:
+    """Bounded, expiring map of session ID to ScoreSession"""
+
+    def __init__(self, max_sessions, ttl):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.sessions = OrderedDict()
+        self.lock = threading.Lock()
+
+    def add(self, session):
+        with self.lock:
+            self.sessions[session.id] = session
+            while len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+        return session
+
+    def get(self, session_id):
+        """Look up a live session, or None if unknown or expired"""
+        with self.lock:
+            session = self.sessions.get(session_id)
+            if session is None:
+                return None
+            if time.time() - session.touched > self.ttl:
+                del self.sessions[session_id]
+                return None
+            self.sessions.move_to_end(session_id)
+            return session
+
+    def remove(self, session_id):
+        with self.lock:
+            return self.sessions.pop(session_id, None) is not None
+
+
+score_sessions = ScoreSessionStore(app.config['SCORE_SESSION_MAX'], app.config['SCORE_SESSION_TTL'])
+
+
+# ============================================================================
+# Batch Processing
+# ============================================================================
+
+_batch_executor = None
+
+
+def get_batch_executor():
+    """Get the shared worker pool, creating it on first use
+
+    Like the parse workers, batch workers are not forked from the
+    multithreaded server: a lock another request thread held at fork time,
+    such as metrics.lock, would stay locked in the child forever.
+    """
+    global _batch_executor
+    if _batch_executor is None:
+        _batch_executor = ProcessPoolExecutor(max_workers=app.config['BATCH_WORKERS'],
+                                              mp_context=multiprocessing.get_context(ParsePool.START_METHOD))
+    return _batch_executor
+
+
+def run_batch(func, items):
+    """Apply func to every item, fanning out to the worker pool in chunks"""
+    chunk_size = app.config['BATCH_CHUNK_SIZE']
+    # Small batches are cheaper to run inline than to ship to another process
+    if app.config['BATCH_WORKERS'] <= 1 or len(items) <= chunk_size:
+        return [func(item) for item in items]
+    chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+    return [result for results in get_batch_executor().map(partial(apply_to_chunk, func), chunks)
+            for result in results]
+
+
+def apply_to_chunk(func, chunk):
+    refresh_taxonomy()
+    return [func(item) for item in chunk]
+
+
+def iter_batch(func, items):
+    """Like run_batch, but yield results in order as they complete
+
+    At most two chunks per worker are in flight, so a slow reader holds the
+    workers back instead of finished results piling up in memory.
+    """
+    chunk_size = app.config['BATCH_CHUNK_SIZE']
+    if app.config['BATCH_WORKERS'] <= 1 or len(items) <= chunk_size:
+        for item in items:
+            yield func(item)
+        return
+
+    executor = get_batch_executor()
+    window = 2 * app.config['BATCH_WORKERS']
+    pending = deque()
+    try:
+        for start in range(0, len(items), chunk_size):
+            pending.append(executor.submit(apply_to_chunk, func, items[start:start + chunk_size]))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # The client went away mid-stream
+        for future in pending:
+            future.cancel()
+
+
+def score_resume(profile, resume_data):
+    """Score one resume against a shared job profile"""
+    return ATSScoring.calculate_score(resume_data, profile.keywords, profile)
+
+
+def score_matrix(resumes, profiles, scorer=None):
+    """Score every resume against every job, vectorized when NumPy is available
+
+    scorer is the resumes' BatchScorer when the caller already has one.
+    """
+    if np is not None:
+        result = (scorer or BatchScorer(resumes)).score(profiles)
+        return {key: value.tolist() for key, value in result.items()}
+
+    features = [ResumeFeatures(resume) for resume in resumes]
+    return {
+        'overall': [[ATSScoring.calculate_score(r, p.keywords, p, f)['overall'] for p in profiles]
+                    for r, f in zip(resumes, features)],
+        'keywords': [[ATSScoring.calculate_keyword_score(r, p.keywords, p, f) for p in profiles]
+                     for r, f in zip(resumes, features)],
+        'format': [ATSScoring.calculate_format_score(r, f) for r, f in zip(resumes, features)],
+        'content': [ATSScoring.calculate_content_score(r, f) for r, f in zip(resumes, features)],
+        'completeness': [ATSScoring.calculate_completeness_score(r, f) for r, f in zip(resumes, features)]
+    }
+
+
+def get_job_profile(data):
+    """Resolve a request's jobProfileId, jobDescription or jobKeywords to a JobProfile
+
+    Returns None when the given jobProfileId is unknown or has been evicted.
+    """
+    if data.get('jobProfileId'):
+        return job_profiles.get(data['jobProfileId'])
+    if data.get('jobKeywords') or not data.get('jobDescription'):
+        return job_profiles.for_keywords(data.get('jobKeywords', {}))
+    return job_profiles.for_description(data['jobDescription'])
+
+
+def unknown_profile_response():
+    return jsonify({
+        'success': False,
+        'error': 'Unknown jobProfileId. Extract keywords again to get a new one'
+    }), 404
+
+
+def wants_stream():
+    """Whether the client asked for NDJSON rather than a single JSON document"""
+    return 'application/x-ndjson' in request.accept_mimetypes.values()
+
+
+def ndjson_response(records):
+    """Stream records as newline-delimited JSON, each sent as soon as it is produced"""
+    lines = (app.json.dumps(record) + '\n' for record in records)
+    return Response(lines, mimetype='application/x-ndjson')
+
+
+def get_batch_items(data, key, item_type=str, type_name='strings'):
+    """Read a list of items from the request body, or return an error message"""
+    items = data.get(key)
+    if not isinstance(items, list) or not all(isinstance(item, item_type) for item in items):
+        return None, f'{key} must be a list of {type_name}'
+    if len(items) > app.config['MAX_BATCH_SIZE']:
+        return None, f'Batch too large. Maximum {app.config["MAX_BATCH_SIZE"]} items per request'
+    return items, None
+
+
+# ============================================================================
+# Request Metrics
+# ============================================================================
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider, on orjson when installed, with serialization timed as a stage"""
+
+    if orjson is not None:
+        # Sorted keys as Flask does; dates and dataclasses still go through Flask's default()
+        ORJSON_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME |
+                          orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    @staticmethod
+    def default(obj):
+        if isinstance(obj, Record):
+            return obj.fields()
+        return DefaultJSONProvider.default(obj)
+
+    def dumps(self, obj, **kwargs):
+        with metrics.stage('serialize'):
+            # Extra arguments (indentation in debug mode) need the stdlib encoder
+            if orjson is not None and not kwargs:
+                try:
+                    return orjson.dumps(obj, default=self.default, option=self.ORJSON_OPTIONS).decode('utf-8')
+                except TypeError:
+                    pass
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return from_json(s)
+
+
+app.json = TimedJSONProvider(app)
+
+metrics.gauge('gobot_parse_cache_bytes', 'Bytes of parsed resumes held in memory', lambda: parse_cache.size)
+metrics.gauge('gobot_parse_cache_entries', 'Parsed resumes held in memory', lambda: len(parse_cache.entries))
+metrics.gauge('gobot_job_profiles', 'Job profiles cached for reuse', lambda: len(job_profiles.profiles))
+metrics.gauge('gobot_score_sessions', 'Live scoring sessions', lambda: len(score_sessions.sessions))
+metrics.gauge('gobot_batch_scorer_pools', 'Encoded resume pools cached for re-scoring',
+              lambda: len(batch_scorers.scorers))
+
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    g.profiler = None
+    if app.config['PROFILE_SAMPLE_RATE'] and random.random() < app.config['PROFILE_SAMPLE_RATE']:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            return  # another request's profiler is running
+        g.profiler = profiler
+
+
+@app.after_request
+def record_request(response):
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.observe_request(request.method, route, response.status_code,
+                            time.perf_counter() - g.get('request_start', time.perf_counter()))
+
+    profiler = g.get('profiler')
+    if profiler is not None:
+        profiler.disable()
+        os.makedirs(app.config['PROFILE_DIR'], exist_ok=True)
+        name = re.sub(r'[^\w]+', '_', route).strip('_') or 'index'
+        profiler.dump_stats(os.path.join(
+            app.config['PROFILE_DIR'], f'{time.strftime("%Y%m%d-%H%M%S")}-{name}-{uuid.uuid4().hex[:8]}.prof'
+        ))
+        g.profiler = None
+    return response
+
+
+# ============================================================================
+# Static Assets
+# ============================================================================
+
+class StaticAsset:
+    """One frontend file held in memory with its precompressed variants"""
+
+    ENCODINGS = ('br', 'gzip')  # Preferred first
+
+    def __init__(self, path, body):
+        self.path = path
+        self.digest = hashlib.sha256(body).hexdigest()[:12]
+        stem, extension = posixpath.splitext(path)
+        self.hashed_path = f'{stem}.{self.digest}{extension}'
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type.endswith('javascript'):
+            content_type += '; charset=utf-8'
+        self.content_type = content_type
+
+        # encoding -> (body, ETag); a variant is only kept if it is smaller
+        self.variants = {'identity': (body, f'"{self.digest}"')}
+        # Maximum compression: it is paid once per file, at load time
+        compressed = {'gzip': gzip.compress(body, 9, mtime=0)}
+        if brotli is not None:
+            compressed['br'] = brotli.compress(body, quality=11)
+        for encoding, data in compressed.items():
+            if len(data) < len(body):
+                self.variants[encoding] = (data, f'"{self.digest}-{encoding}"')
+
+    def negotiate(self, accept_encoding):
+        """Best encoding we hold that the client accepts"""
+        if accept_encoding:
+            accepted = parse_accept_header(accept_encoding)
+            for encoding in self.ENCODINGS:
+                if encoding in self.variants and accepted[encoding] > 0:
+                    return encoding
+        return 'identity'
+
+
+class AssetManifest:
+    """The frontend files, loaded once and served from memory
+
+    Every asset is also served under a content-hashed path
+    (js/app.<sha256>.js) and cached by browsers for good; the HTML pages are
+    rewritten to reference those paths, and are themselves revalidated by
+    ETag on each load. Only files matching the patterns are served. Files
+    are read and compressed on first use, so importing server.py stays cheap.
+    """
+
+    REFERENCE_PATTERN = re.compile(r'(?<=\s)(src|href)="([^"?#:]+)"')
+
+    def __init__(self, root, patterns, max_age):
+        self.root = root
+        self.patterns = patterns
+        self.immutable = f'public, max-age={max_age}, immutable'
+        self.assets = {}  # URL path -> (StaticAsset, immutable)
+        self.signature = None  # None until loaded
+        self.lock = threading.Lock()
+
+    def files(self):
+        paths = set()
+        for pattern in self.patterns:
+            for path in glob.glob(os.path.join(self.root, pattern), recursive=True):
+                if os.path.isfile(path):
+                    paths.add(os.path.relpath(path, self.root).replace(os.sep, '/'))
+        return sorted(paths)
+
+    def stat(self, files):
+        """Signature of the files on disk, to notice edits"""
+        signature = []
+        for path in files:
+            info = os.stat(os.path.join(self.root, path))
+            signature.append((path, info.st_mtime_ns, info.st_size))
+        return signature
+
+    def ensure_loaded(self):
+        if self.signature is None:
+            with self.lock:
+                if self.signature is None:
+                    self.load()
+
+    def load(self):
+        files = self.files()
+        signature = self.stat(files)
+        assets = {}
+        pages = []
+        for path in files:
+            with open(os.path.join(self.root, path), 'rb') as file:
+                body = file.read()
+            if path.endswith('.html'):
+                pages.append((path, body))
+                continue
+            asset = StaticAsset(path, body)
+            assets[path] = (asset, False)
+            assets[asset.hashed_path] = (asset, True)
+
+        # Pages last, once every asset they reference has its hash
+        for path, body in pages:
+            assets[path] = (StaticAsset(path, self.link(path, body.decode('utf-8'), assets).encode('utf-8')), False)
+
+        self.assets = assets
+        self.signature = signature
+
+    def link(self, page, html, assets):
+        """Point a page's references to known assets at their hashed paths"""
+        directory = posixpath.dirname(page)
+
+        def replace(match):
+            reference = match.group(2)
+            entry = assets.get(posixpath.normpath(posixpath.join(directory, reference)))
+            if entry is None:
+                return match.group(0)
+            hashed_name = posixpath.basename(entry[0].hashed_path)
+            return f'{match.group(1)}="{reference[:len(reference) - len(posixpath.basename(reference))]}{hashed_name}"'
+
+        return self.REFERENCE_PATTERN.sub(replace, html)
+
+    def refresh(self):
+        """Reload if any file changed on disk (used while developing)"""
+        if self.lock.acquire(blocking=False):
+            try:
+                if self.stat(self.files()) != self.signature:
+                    self.load()
+            finally:
+                self.lock.release()
+
+    def respond(self, path, accept_encoding=None, if_none_match=None):
+        """Return (status, headers, body) for a URL path, or None if it is not an asset"""
+        self.ensure_loaded()
+        entry = self.assets.get(path)
+        if entry is None:
+            return None
+        asset, immutable = entry
+        encoding = asset.negotiate(accept_encoding)
+        body, etag = asset.variants[encoding]
+        headers = [
+            ('Content-Type', asset.content_type),
+            ('ETag', etag),
+            ('Cache-Control', self.immutable if immutable else 'no-cache'),
+            ('Vary', 'Accept-Encoding')
+        ]
+        if encoding != 'identity':
+            headers.append(('Content-Encoding', encoding))
+        if if_none_match and parse_etags(if_none_match).contains_weak(etag.strip('"')):
+            return 304, headers, b''
+        return 200, headers, body
+
+    @property
+    def size(self):
+        return sum(sum(len(body) for body, _ in asset.variants.values())
+                   for asset, immutable in self.assets.values() if not immutable)
+
+
+static_assets = AssetManifest(os.path.dirname(os.path.abspath(__file__)), STATIC_FILES, STATIC_MAX_AGE)
+metrics.gauge('gobot_static_asset_bytes', 'Bytes of frontend files and their compressed variants held in memory',
+              lambda: static_assets.size)
+
+
+@app.route('/', defaults={'path': 'index.html'})
+@app.route('/<path:path>')
+def serve_frontend(path):
+    """Serve the main application and its css/js from memory"""
+    if app.debug:
+        static_assets.refresh()
+    result = static_assets.respond(path, request.headers.get('Accept-Encoding'),
+                                   request.headers.get('If-None-Match'))
+    if result is None:
+        abort(404)
+    status, headers, body = result
+    return Response(body, status, headers)
+
+
+# ============================================================================
+# API Routes
+# ============================================================================
 
 
 @app.route('/api/health', methods=['GET'])
@@ -705,14 +2958,71 @@ def health_check():
     return jsonify({'status': 'ok', 'message': 'GoBot API is running'})
 
 
+@app.route('/api/taxonomy', methods=['GET'])
+def get_taxonomy():
+    """Describe the skill taxonomy currently in use"""
+    taxonomy = KeywordExtractor.TAXONOMY
+    return jsonify({
+        'success': True,
+        'version': taxonomy.version,
+        'source': taxonomy.source,
+        'skills': len(taxonomy.matcher.rank),
+        'aliases': len(taxonomy.aliases),
+        'actionVerbs': len(taxonomy.action_verbs)
+    })
+
+
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Request and pipeline stage metrics in Prometheus text format"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+
 @app.route('/api/extract-keywords', methods=['POST'])
 def extract_keywords():
     """Extract keywords from job description"""
     data = request.get_json()
     job_description = data.get('jobDescription', '')
     
-    keywords = KeywordExtractor.extract_from_job_description(job_description)
-    return jsonify({'success': True, 'keywords': keywords})
+    # The profile ID can be sent in place of the keywords on later calls
+    profile = job_profiles.for_description(job_description)
+    return jsonify({'success': True, 'keywords': profile.keywords, 'profileId': profile.id})
+
+
+@app.route('/api/extract-keywords/batch', methods=['POST'])
+def extract_keywords_batch():
+    """Extract keywords from many job descriptions at once"""
+    data = request.get_json()
+    job_descriptions, error = get_batch_items(data, 'jobDescriptions')
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
+
+    # Repeated postings are only extracted once
+    unique = list(dict.fromkeys(job_descriptions))
+    if wants_stream():
+        return ndjson_response(stream_keywords(job_descriptions, unique))
+    results = dict(zip(unique, run_batch(KeywordExtractor.extract_from_job_description, unique)))
+
+    return jsonify({
+        'success': True,
+        'results': [results[description] for description in job_descriptions]
+    })
+
+
+def stream_keywords(job_descriptions, unique):
+    """Yield one keywords record per description, in request order"""
+    extracted = iter_batch(KeywordExtractor.extract_from_job_description, unique)
+    remaining = Counter(job_descriptions)
+    results = {}  # only descriptions that repeat later in the batch
+    for i, description in enumerate(job_descriptions):
+        if description in results:
+            keywords = results.pop(description)
+        else:
+            keywords = next(extracted)
+        remaining[description] -= 1
+        if remaining[description]:
+            results[description] = keywords
+        yield {'index': i, 'keywords': keywords}
 
 
 @app.route('/api/calculate-score', methods=['POST'])
@@ -720,22 +3030,240 @@ def calculate_score():
     """Calculate ATS score for resume"""
     data = request.get_json()
     resume_data = data.get('resumeData', {})
-    job_keywords = data.get('jobKeywords', {})
+    profile = get_job_profile(data)
+    if profile is None:
+        return unknown_profile_response()
     
-    score = ATSScoring.calculate_score(resume_data, job_keywords)
+    score = ATSScoring.calculate_score(resume_data, profile.keywords, profile)
     return jsonify({'success': True, 'score': score})
 
 
+@app.route('/api/score-sessions', methods=['POST'])
+def create_score_session():
+    """Start an incremental scoring session for a resume being edited"""
+    data = request.get_json()
+    profile = get_job_profile(data)
+    if profile is None:
+        return unknown_profile_response()
+
+    resume_data = data.get('resumeData', {})
+    if not isinstance(resume_data, dict):
+        return jsonify({'success': False, 'error': 'resumeData must be an object'}), 400
+    try:
+        session = score_sessions.add(ScoreSession(resume_data, profile))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    return jsonify({'success': True, 'sessionId': session.id, 'score': session.result})
+
+
+@app.route('/api/score-sessions/<session_id>', methods=['PATCH'])
+def patch_score_session(session_id):
+    """Apply JSON-patch style edits to a session's resume and rescore"""
+    session = score_sessions.get(session_id)
+    if session is None:
+        return jsonify({'success': False, 'error': 'Unknown or expired session'}), 404
+
+    data = request.get_json()
+    operations = data.get('patch')
+    if not isinstance(operations, list) or not all(isinstance(op, dict) for op in operations):
+        return jsonify({'success': False, 'error': 'patch must be a list of operations'}), 400
+
+    try:
+        recomputed = session.apply(operations)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    return jsonify({'success': True, 'score': session.result, 'recomputed': recomputed})
+
+
+@app.route('/api/score-sessions/<session_id>', methods=['DELETE'])
+def delete_score_session(session_id):
+    """End a scoring session"""
+    if not score_sessions.remove(session_id):
+        return jsonify({'success': False, 'error': 'Unknown or expired session'}), 404
+    return jsonify({'success': True})
+
+
+@app.route('/api/rank', methods=['POST'])
+def rank_resumes():
+    """Rank many resumes against one job description"""
+    data = request.get_json()
+    resumes, error = get_batch_items(data, 'resumes', dict, 'objects')
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
+    top_k = data.get('topK', 10)
+    if not isinstance(top_k, int) or top_k < 1:
+        return jsonify({'success': False, 'error': 'topK must be a positive integer'}), 400
+
+    # Job-level work happens once and is shared by every candidate
+    profile = get_job_profile(data)
+    if profile is None:
+        return unknown_profile_response()
+    if wants_stream():
+        return ndjson_response(stream_ranking(resumes, profile, top_k))
+    scores = run_batch(partial(score_resume, profile), resumes)
+
+    results = [
+        {'index': i, 'id': resume.get('id', i), 'score': score}
+        for i, (resume, score) in enumerate(zip(resumes, scores))
+    ]
+    ranked = sorted(results, key=lambda result: (-result['score']['overall'], result['index']))
+
+    return jsonify({
+        'success': True,
+        'keywords': profile.keywords,
+        'ranking': [
+            {'index': result['index'], 'id': result['id'], 'overall': result['score']['overall']}
+            for result in ranked[:top_k]
+        ],
+        'results': results
+    })
+
+
+def stream_ranking(resumes, profile, top_k):
+    """Yield each resume's score as it is ready, then the top_k ranking"""
+    best = []  # min-heap of the top_k (overall, -index, id) seen so far
+    for i, (resume, score) in enumerate(zip(resumes, iter_batch(partial(score_resume, profile), resumes))):
+        resume_id = resume.get('id', i)
+        yield {'index': i, 'id': resume_id, 'score': score}
+        entry = (score['overall'], -i, resume_id)
+        if len(best) < top_k:
+            heapq.heappush(best, entry)
+        elif entry[:2] > best[0][:2]:
+            heapq.heapreplace(best, entry)
+
+    ranked = sorted(best, key=lambda entry: entry[:2], reverse=True)
+    yield {
+        'keywords': profile.keywords,
+        'ranking': [{'index': -neg_index, 'id': resume_id, 'overall': overall}
+                    for overall, neg_index, resume_id in ranked]
+    }
+
+
+@app.route('/api/score-matrix', methods=['POST'])
+def score_resume_matrix():
+    """Score many resumes against many job descriptions at once
+
+    With NumPy, the response carries a poolId that later requests can send
+    in place of the same resumes, skipping their upload and encoding.
+    """
+    data = request.get_json()
+    resumes = scorer = None
+    if data.get('poolId'):
+        scorer = batch_scorers.lookup(data['poolId'])
+        if scorer is None:
+            return jsonify({'success': False, 'error': 'Unknown poolId. Send the resumes again'}), 404
+        job_descriptions, error = get_batch_items(data, 'jobDescriptions')
+    else:
+        resumes, error = get_batch_items(data, 'resumes', dict, 'objects')
+        if not error:
+            job_descriptions, error = get_batch_items(data, 'jobDescriptions')
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
+
+    profiles = [job_profiles.for_description(description) for description in job_descriptions]
+    if wants_stream():
+        return ndjson_response(stream_score_matrix(resumes, profiles, scorer))
+    if scorer is None and np is not None:
+        scorer = batch_scorers.get(resumes)
+    result = {
+        'success': True,
+        'profileIds': [profile.id for profile in profiles],
+        'scores': score_matrix(resumes, profiles, scorer)
+    }
+    if scorer is not None:
+        result['poolId'] = scorer.id
+    return jsonify(result)
+
+
+def stream_score_matrix(resumes, profiles, scorer=None):
+    """Yield the profile IDs, then one row of scores per resume, a block at a time
+
+    Blocks of streamed resumes are encoded without being cached; a cached
+    pool given as scorer is scored in one go.
+    """
+    yield {'profileIds': [profile.id for profile in profiles]}
+    if scorer is not None:
+        blocks = [score_matrix(None, profiles, scorer)]
+    else:
+        block_size = app.config['STREAM_BLOCK_SIZE']
+        blocks = (score_matrix(resumes[start:start + block_size], profiles)
+                  for start in range(0, len(resumes), block_size))
+    index = 0
+    for scores in blocks:
+        for offset in range(len(scores['overall'])):
+            row = {key: values[offset] for key, values in scores.items()}
+            yield {'index': index, **row}
+            index += 1
+
+
+def stream_indexing(entries):
+    """Index resumes one by one, yielding each as it is stored, then the pool size"""
+    for i, entry in enumerate(entries):
+        yield {'index': i, 'id': str(entry['id']), 'skills': resume_index.add(entry['id'], entry['resumeData'])}
+    yield {'total': resume_index.count()}
+
+
+@app.route('/api/index/resumes', methods=['POST'])
+def index_resumes():
+    """Add or replace resumes in the stored pool"""
+    data = request.get_json()
+    entries, error = get_batch_items(data, 'resumes', dict, 'objects')
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
+    if not all('id' in entry and isinstance(entry.get('resumeData'), dict) for entry in entries):
+        return jsonify({'success': False, 'error': 'Each resume needs an id and resumeData'}), 400
+
+    if wants_stream():
+        return ndjson_response(stream_indexing(entries))
+    indexed = [
+        {'id': str(entry['id']), 'skills': resume_index.add(entry['id'], entry['resumeData'])}
+        for entry in entries
+    ]
+    return jsonify({'success': True, 'indexed': indexed, 'total': resume_index.count()})
+
+
+@app.route('/api/index/resumes/<resume_id>', methods=['DELETE'])
+def remove_indexed_resume(resume_id):
+    """Remove a resume from the stored pool"""
+    if not resume_index.remove(resume_id):
+        return jsonify({'success': False, 'error': 'Resume not found'}), 404
+    return jsonify({'success': True, 'total': resume_index.count()})
+
+
+@app.route('/api/index/match', methods=['POST'])
+def match_indexed_resumes():
+    """Find the best stored resumes for a job description"""
+    data = request.get_json()
+    top_k = data.get('topK', 10)
+    if not isinstance(top_k, int) or top_k < 1:
+        return jsonify({'success': False, 'error': 'topK must be a positive integer'}), 400
+
+    profile = get_job_profile(data)
+    if profile is None:
+        return unknown_profile_response()
+    result = resume_index.search(profile, top_k, app.config['INDEX_CANDIDATE_FACTOR'])
+    return jsonify({'success': True, 'keywords': profile.keywords, **result})
+
+
 @app.route('/api/optimize-resume', methods=['POST'])
 def optimize_resume():
     """Optimize resume for job description"""
     data = request.get_json()
     resume_data = data.get('resumeData', {})
-    job_keywords = data.get('jobKeywords', {})
-    
-    optimized = ResumeOptimizer.optimize(resume_data, job_keywords)
-    score = ATSScoring.calculate_score(optimized, job_keywords)
+    profile = get_job_profile(data)
+    if profile is None:
+        return unknown_profile_response()
     
+    patch, changes = ResumeOptimizer.diff(resume_data, profile.keywords, profile)
+    optimized = ResumeOptimizer.apply_diff(resume_data, patch)
+    score = ATSScoring.calculate_score(optimized, profile.keywords, profile)
+
+    # diffOnly returns just the edits, as JSON-patch operations against resumeData
+    if data.get('diffOnly'):
+        return jsonify({'success': True, 'patch': patch, 'changes': changes, 'score': score})
+
+    optimized['changes'] = changes
     return jsonify({
         'success': True,
         'optimizedResume': optimized,
@@ -746,38 +3274,57 @@ def optimize_resume():
 @app.route('/api/upload-resume', methods=['POST'])
 def upload_resume():
     """Upload and parse resume file"""
+    parsed, cached, error = parse_upload()
+    if error:
+        return error
+    return jsonify({'success': True, 'parsedResume': parsed, 'cached': cached})
+
+
+def parse_upload():
+    """Parse the request's uploaded file, through the parse cache and worker pool
+
+    Returns (parsed, cached, error_response); error_response is None on success.
+    """
     if 'file' not in request.files:
-        return jsonify({'success': False, 'error': 'No file uploaded'}), 400
+        return None, False, (jsonify({'success': False, 'error': 'No file uploaded'}), 400)
 
     file = request.files['file']
     
     if file.filename == '':
-        return jsonify({'success': False, 'error': 'No file selected'}), 400
+        return None, False, (jsonify({'success': False, 'error': 'No file selected'}), 400)
 
     if not allowed_file(file.filename):
-        return jsonify({
+        return None, False, (jsonify({
             'success': False, 
             'error': f'Invalid file type. Allowed types: {", ".join(ALLOWED_EXTENSIONS)}'
-        }), 400
+        }), 400)
 
     try:
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
+        # Uploads are parsed straight from memory, never written to disk
+        with metrics.stage('upload_read'):
+            content = file.read()
 
-        # Parse the resume
-        parsed = ResumeParser.parse_file(filepath)
+        # Identical uploads are served from the cache without re-parsing
+        cache_key = ParseCache.make_key(content, file.filename.rsplit('.', 1)[1].lower())
+        parsed = parse_cache.get(cache_key)
+        if parsed is not None:
+            return parsed, True, None
 
-        # Clean up uploaded file
-        os.remove(filepath)
+        # Parse the resume off the request thread
+        parsed = parse_pool.parse(content, file.filename)
 
         if 'error' in parsed and parsed['error']:
-            return jsonify({'success': False, 'error': parsed['error']}), 500
+            if parsed.get('errorType') == 'timeout':
+                return None, False, (
+                    jsonify({'success': False, 'error': parsed['error'], 'errorType': 'timeout'}), 504
+                )
+            return None, False, (jsonify({'success': False, 'error': parsed['error']}), 500)
 
-        return jsonify({'success': True, 'parsedResume': parsed})
+        parse_cache.put(cache_key, parsed)
+        return parsed, False, None
 
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return None, False, (jsonify({'success': False, 'error': str(e)}), 500)
 
 
 @app.route('/api/parse-text', methods=['POST'])
@@ -793,25 +3340,114 @@ def parse_text():
     return jsonify({'success': True, 'parsedResume': parsed})
 
 
+@app.route('/api/parse-text/batch', methods=['POST'])
+def parse_text_batch():
+    """Parse many resumes from text at once"""
+    data = request.get_json()
+    texts, error = get_batch_items(data, 'texts')
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
+
+    if wants_stream():
+        parsed = iter_batch(ResumeParser.parse_text, texts)
+        return ndjson_response({'index': i, 'parsedResume': result} for i, result in enumerate(parsed))
+    return jsonify({'success': True, 'results': run_batch(ResumeParser.parse_text, texts)})
+
+
 @app.route('/api/suggestions', methods=['POST'])
 def get_suggestions():
     """Get skill suggestions based on job description"""
     data = request.get_json()
     resume_skills = data.get('resumeSkills', [])
-    job_keywords = data.get('jobKeywords', {})
-    
+    profile = get_job_profile(data)
+    if profile is None:
+        return unknown_profile_response()
+
+    return jsonify({'success': True, 'suggestions': skill_suggestions(resume_skills, profile)})
+
+
+def listed_skills(resume_data):
+    """The skills in a resume's comma-separated technicalSkills and softSkills"""
+    return [skill.strip() for key in ('technicalSkills', 'softSkills')
+            for skill in str(resume_data.get(key) or '').split(',') if skill.strip()]
+
+
+def skill_suggestions(resume_skills, profile):
+    """Up to ten of the job's skills that resume_skills does not list"""
     suggestions = []
-    resume_skills_lower = [s.lower() for s in resume_skills]
+    resume_skills_lower = {s.lower() for s in resume_skills}
 
-    for skill in job_keywords.get('technical', []) + job_keywords.get('soft', []):
-        if skill.lower() not in resume_skills_lower:
+    for skill, lower in zip(profile.technical + profile.soft, profile.technical_lower + profile.soft_lower):
+        if lower not in resume_skills_lower:
             suggestions.append({
                 'skill': skill,
-                'type': 'technical' if skill in job_keywords.get('technical', []) else 'soft',
+                'type': 'technical' if skill in profile.technical_set else 'soft',
                 'priority': 'high'
             })
 
-    return jsonify({'success': True, 'suggestions': suggestions[:10]})
+    return suggestions[:10]
+
+
+@app.route('/api/analyze', methods=['POST'])
+def analyze_resume():
+    """Parse, score, optimize and suggest skills for a resume in one request
+
+    Takes a multipart upload ('file' plus form fields) or JSON with 'text' or
+    'resumeData', and the job as jobDescription, jobKeywords or jobProfileId.
+    """
+    cached = False
+    upload = request.mimetype == 'multipart/form-data'
+    if upload:
+        data = request.form.to_dict()
+        if data.get('jobKeywords'):
+            try:
+                data['jobKeywords'] = json.loads(data['jobKeywords'])
+            except ValueError:
+                return jsonify({'success': False, 'error': 'jobKeywords must be JSON'}), 400
+        resume_data, cached, error = parse_upload()
+        if error:
+            return error
+    else:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({'success': False, 'error': 'Send a multipart upload or a JSON object'}), 400
+        if data.get('text'):
+            resume_data = ResumeParser.parse_text(data['text'])
+        elif isinstance(data.get('resumeData'), dict):
+            resume_data = data['resumeData']
+        else:
+            return jsonify({'success': False, 'error': 'Provide a file, text or resumeData'}), 400
+
+    profile = get_job_profile(data)
+    if profile is None:
+        return unknown_profile_response()
+
+    # Every step works on the same in-memory resume and job profile
+    score = ATSScoring.calculate_score(resume_data, profile.keywords, profile)
+    patch, changes = ResumeOptimizer.diff(resume_data, profile.keywords, profile)
+    optimized = ResumeOptimizer.apply_diff(resume_data, patch)
+    optimized_score = ATSScoring.calculate_score(optimized, profile.keywords, profile)
+    suggestions = skill_suggestions(listed_skills(resume_data), profile)
+
+    result = {
+        'success': True,
+        'parsedResume': resume_data,
+        'keywords': profile.keywords,
+        'profileId': profile.id,
+        'score': score,
+        'changes': changes,
+        'optimizedScore': optimized_score,
+        'suggestions': suggestions
+    }
+    if upload:
+        result['cached'] = cached
+    # diffOnly sends the optimizations as JSON-patch operations against parsedResume
+    if str(data.get('diffOnly')).lower() == 'true':
+        result['patch'] = patch
+    else:
+        optimized['changes'] = changes
+        result['optimizedResume'] = optimized
+    return jsonify(result)
 
 
 # ============================================================================
@@ -823,16 +3459,27 @@ if __name__ == '__main__':
     print("GoBot - AI Resume Optimizer")
     print("=" * 60)
     print(f"Server starting at: http://localhost:5000")
-    print(f"Upload folder: {os.path.abspath(UPLOAD_FOLDER)}")
     print("-" * 60)
     print("API Endpoints:")
     print("  GET  /api/health          - Health check")
+    print("  GET  /api/metrics         - Request and stage metrics (Prometheus)")
+    print("  GET  /api/taxonomy        - Skill taxonomy in use")
     print("  POST /api/extract-keywords - Extract keywords from job description")
+    print("  POST /api/extract-keywords/batch - Extract keywords from many job descriptions")
     print("  POST /api/calculate-score  - Calculate ATS score")
+    print("  POST /api/score-sessions   - Start an incremental scoring session")
+    print("  PATCH /api/score-sessions/<id> - Apply edits and rescore")
+    print("  POST /api/rank             - Rank many resumes against one job description")
+    print("  POST /api/score-matrix     - Score many resumes against many jobs")
+    print("  POST /api/index/resumes    - Add resumes to the stored pool")
+    print("  DELETE /api/index/resumes/<id> - Remove a stored resume")
+    print("  POST /api/index/match      - Find the best stored resumes for a job")
     print("  POST /api/optimize-resume  - Optimize resume")
     print("  POST /api/upload-resume    - Upload and parse resume file")
     print("  POST /api/parse-text       - Parse resume from text")
+    print("  POST /api/parse-text/batch - Parse many resumes from text")
     print("  POST /api/suggestions      - Get skill suggestions")
+    print("  POST /api/analyze          - Parse, score, optimize and suggest in one call")
     print("=" * 60)
     
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,15 @@
+"""
+Shared test setup: server.py is imported from the project root, with the
+stored resume pool in a temporary directory instead of the working tree.
+"""
+
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ['GOBOT_RESUME_INDEX_DB'] = os.path.join(tempfile.mkdtemp(prefix='gobot-tests-'), 'index.db')
+os.environ.pop('GOBOT_TAXONOMY', None)
+os.environ.pop('GOBOT_TAXONOMY_SNAPSHOT', None)
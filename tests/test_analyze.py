@@ -0,0 +1,65 @@
+"""/api/analyze: suggestions leave out skills the resume lists, and malformed requests get 400"""
+
+import io
+
+import pytest
+
+import server
+
+JOB = {'all': ['Python', 'Docker', 'Kubernetes', 'Leadership', 'Communication'],
+       'technical': ['Python', 'Docker', 'Kubernetes'], 'soft': ['Leadership', 'Communication']}
+
+
+@pytest.fixture
+def client():
+    return server.app.test_client()
+
+
+def suggested(response):
+    return {suggestion['skill'] for suggestion in response.get_json()['suggestions']}
+
+
+def test_suggestions_skip_listed_skills(client):
+    resume = {'fullName': 'Ada', 'technicalSkills': 'Python, Docker', 'softSkills': 'Leadership'}
+    response = client.post('/api/analyze', json={'resumeData': resume, 'jobKeywords': JOB})
+
+    assert response.status_code == 200
+    # Docker and Leadership sit next to each other once both lists are joined
+    assert suggested(response) == {'Kubernetes', 'Communication'}
+
+
+def test_suggestions_match_the_suggestions_route(client):
+    resume = {'technicalSkills': 'python,  kubernetes ', 'softSkills': ''}
+    analyzed = client.post('/api/analyze', json={'resumeData': resume, 'jobKeywords': JOB})
+    direct = client.post('/api/suggestions', json={'resumeSkills': ['python', 'kubernetes'], 'jobKeywords': JOB})
+
+    assert analyzed.get_json()['suggestions'] == direct.get_json()['suggestions']
+
+
+def test_upload_suggestions(client):
+    text = b'Ada Lovelace\nada@example.com\n\nTECHNICAL SKILLS\nPython, Docker, Leadership\n'
+    response = client.post('/api/analyze', data={'file': (io.BytesIO(text), 'resume.txt'),
+                                                  'jobKeywords': server.to_json(JOB)},
+                           content_type='multipart/form-data')
+
+    assert response.status_code == 200
+    assert 'cached' in response.get_json()
+    assert not suggested(response) & {'Python', 'Docker', 'Leadership'}
+
+
+def test_multipart_without_a_file(client):
+    response = client.post('/api/analyze', data={'jobDescription': 'Python developer'},
+                           content_type='multipart/form-data')
+
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'No file uploaded'
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'data': 'text=hello', 'content_type': 'application/x-www-form-urlencoded'},
+    {'data': 'not json', 'content_type': 'application/json'},
+    {'json': ['a list']},
+    {'json': {'jobDescription': 'Python developer'}},
+])
+def test_bad_requests(client, kwargs):
+    assert client.post('/api/analyze', **kwargs).status_code == 400
@@ -0,0 +1,243 @@
+"""GoBotASGI: the WSGI bridge, client disconnects, per-route limits and traffic class admission"""
+
+import asyncio
+import sys
+
+import pytest
+
+from asgi import GoBotASGI, TrafficClass, traffic_classes
+
+TRAFFIC_CLASSES = {'interactive': (4, 64), 'bulk': (2, 64)}
+
+
+class WSGIApp:
+    """A WSGI app built from a function, with the config GoBotASGI reads"""
+
+    config = {'MAX_CONTENT_LENGTH': 1024}
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, environ, start_response):
+        return self.func(environ, start_response)
+
+
+def make_server(func, endpoint_limits=None):
+    return GoBotASGI(WSGIApp(func), 4, 16, TRAFFIC_CLASSES, {'/bulk'}, endpoint_limits)
+
+
+def scope(path='/api/test'):
+    return {'type': 'http', 'method': 'POST', 'path': path, 'query_string': b'', 'headers': [],
+            'http_version': '1.1'}
+
+
+class Client:
+    """Feeds a request body, then reports disconnect when told to"""
+
+    def __init__(self, messages=None):
+        self.messages = list(messages or [{'type': 'http.request', 'body': b'{}'}])
+        self.gone = asyncio.Event()
+        self.sent = []
+
+    async def receive(self):
+        self.loop = asyncio.get_running_loop()
+        if self.messages:
+            return self.messages.pop(0)
+        await self.gone.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    @property
+    def body(self):
+        return b''.join(message.get('body', b'') for message in self.sent if message['type'] == 'http.response.body')
+
+
+def test_relays_status_headers_and_written_body():
+    def app(environ, start_response):
+        write = start_response('201 Created', [('Content-Type', 'text/plain')])
+        write(b'written ')
+        return [b'then ', b'returned']
+
+    client = Client()
+    asyncio.run(make_server(app)(scope(), client.receive, client.send))
+
+    assert client.sent[0] == {'type': 'http.response.start', 'status': 201,
+                              'headers': [(b'content-type', b'text/plain')]}
+    assert client.body == b'written then returned'
+
+
+def test_exc_info_replaces_an_unsent_response():
+    def app(environ, start_response):
+        start_response('200 OK', [])
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            start_response('500 Internal Server Error', [], sys.exc_info())
+        return [b'error page']
+
+    client = Client()
+    asyncio.run(make_server(app)(scope(), client.receive, client.send))
+
+    assert client.sent[0]['status'] == 500
+    assert client.body == b'error page'
+
+
+def test_exc_info_after_headers_were_sent_reraises():
+    def app(environ, start_response):
+        start_response('200 OK', [])
+
+        def body():
+            yield b'partial'
+            try:
+                raise ValueError('boom')
+            except ValueError:
+                start_response('500 Internal Server Error', [], sys.exc_info())
+            yield b'never'
+        return body()
+
+    client = Client()
+    with pytest.raises(ValueError, match='boom'):
+        asyncio.run(make_server(app)(scope(), client.receive, client.send))
+    assert client.body == b'partial'
+
+
+def test_disconnect_while_reading_the_body():
+    calls = []
+    client = Client([{'type': 'http.request', 'body': b'{', 'more_body': True}, {'type': 'http.disconnect'}])
+    asyncio.run(make_server(lambda environ, start_response: calls.append(1))(scope(), client.receive, client.send))
+
+    assert client.sent == [] and calls == []
+
+
+def test_disconnect_stops_a_streaming_response():
+    pulled = []
+
+    def app(environ, start_response):
+        start_response('200 OK', [])
+
+        def body():
+            for i in range(1000):
+                pulled.append(i)
+                if i == 2:
+                    client.loop.call_soon_threadsafe(client.gone.set)
+                yield b'chunk'
+        return body()
+
+    client = Client()
+    asyncio.run(make_server(app)(scope(), client.receive, client.send))
+
+    assert len(pulled) < 1000
+    assert client.sent[-1].get('more_body')  # The response was abandoned, not finished
+
+
+def test_endpoint_limit_caps_a_route():
+    running = []
+    peak = []
+
+    async def main():
+        server = make_server(lambda environ, start_response: None, {'/bulk': 1})
+
+        async def handle(*args):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+        server.handle = handle
+
+        for path in ('/bulk', '/api/other'):
+            clients = [Client() for _ in range(4)]
+            await asyncio.gather(*(server(scope(path), client.receive, client.send) for client in clients))
+
+    asyncio.run(main())
+    assert peak[:4] == [1, 1, 1, 1]
+    assert max(peak[4:]) > 1
+
+
+def test_requests_waiting_for_a_route_count_against_the_queue():
+    async def main():
+        server = GoBotASGI(WSGIApp(None), 4, 64, {'interactive': (4, 64), 'bulk': (2, 4)}, {'/bulk'}, {'/bulk': 1})
+        bulk = server.classes['bulk']
+        depth = []
+
+        async def handle(scope, body, send, disconnected):
+            depth.append(bulk.queued_cost)
+            await asyncio.sleep(0.01)
+            await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        server.handle = handle
+
+        clients = [Client() for _ in range(20)]
+        await asyncio.gather(*(server(scope('/bulk'), client.receive, client.send) for client in clients))
+        return bulk, depth, [client.sent[0]['status'] for client in clients]
+
+    bulk, depth, statuses = asyncio.run(main())
+    # One runs at once and four wait, each costing one unit; the rest are shed
+    assert statuses.count(200) == 5
+    assert statuses.count(429) == 15
+    assert bulk.rejected == 15
+    assert max(depth) <= 4
+    assert (bulk.running, bulk.queued, bulk.queued_cost) == (0, 0, 0)
+
+
+@pytest.mark.parametrize('threads, bulk_share, expected', [
+    (32, 0.125, (28, 4)),
+    (32, 0.9, (16, 16)),  # Bulk is capped at half
+    (64, 0.25, (48, 16)),
+    (3, 0.125, (2, 1)),  # Each class gets at least one
+    (1, 0.5, (1, 1)),
+])
+def test_traffic_class_shares(threads, bulk_share, expected):
+    classes = traffic_classes(threads, bulk_share)
+    assert (classes['interactive'][0], classes['bulk'][0]) == expected
+
+
+def test_interactive_keeps_at_least_half():
+    for threads in range(2, 129):
+        for bulk_share in (0, 0.1, 0.5, 0.75, 1):
+            classes = traffic_classes(threads, bulk_share)
+            assert classes['interactive'][0] >= threads / 2
+            assert classes['interactive'][0] + classes['bulk'][0] == threads
+
+
+def test_traffic_class_admits_in_order_and_sheds_when_full():
+    async def main():
+        traffic_class = TrafficClass('bulk', 1, 3)
+        assert await traffic_class.acquire(1)
+
+        order = []
+
+        async def wait(name, cost):
+            assert await traffic_class.acquire(cost)
+            order.append(name)
+            traffic_class.release()
+
+        waiters = [asyncio.ensure_future(wait(name, 1)) for name in 'ab']
+        await asyncio.sleep(0)
+        assert traffic_class.queued_cost == 2
+        assert not traffic_class.has_room(2)
+        assert not await traffic_class.acquire(2)
+        assert traffic_class.rejected == 1
+
+        traffic_class.release()
+        await asyncio.gather(*waiters)
+        return traffic_class, order
+
+    traffic_class, order = asyncio.run(main())
+    assert order == ['a', 'b']
+    assert (traffic_class.running, traffic_class.queued_cost) == (0, 0)
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def main():
+        traffic_class = TrafficClass('interactive', 1, 8)
+        await traffic_class.acquire(1)
+        waiter = asyncio.ensure_future(traffic_class.acquire(5))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        assert (len(traffic_class.waiting), traffic_class.queued, traffic_class.queued_cost) == (0, 0, 0)
+        traffic_class.release()
+        return traffic_class
+
+    assert asyncio.run(main()).running == 0
@@ -0,0 +1,78 @@
+"""BatchScorer: the NumPy score matrix matches per-pair scoring, and encoded pools are reused"""
+
+import os
+import sys
+
+import pytest
+
+import server
+from server import ATSScoring, BatchScorerCache, job_profiles, score_matrix
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+import corpus  # noqa: E402
+
+pytestmark = pytest.mark.skipif(server.np is None, reason='requires NumPy')
+
+
+@pytest.fixture(scope='module')
+def pool():
+    resumes = corpus.resumes(60, seed=11) + [{}, {'summary': 'x' * 120, 'experience': [{'bullets': ['', 'ok']}]}]
+    profiles = [job_profiles.for_description(jd) for jd in corpus.job_descriptions(6, seed=12)]
+    profiles.append(job_profiles.for_keywords({'all': ['Python', 'Underwater Basket Weaving'],
+                                               'technical': ['Python'], 'soft': []}))
+    profiles.append(job_profiles.for_keywords({}))
+    return resumes, profiles
+
+
+def test_numpy_matches_the_fallback(pool, monkeypatch):
+    resumes, profiles = pool
+    vectorized = score_matrix(resumes, profiles)
+    monkeypatch.setattr(server, 'np', None)
+    fallback = score_matrix(resumes, profiles)
+
+    for key in ('overall', 'keywords', 'format', 'content', 'completeness'):
+        assert vectorized[key] == fallback[key]
+
+
+def test_matches_calculate_score(pool):
+    resumes, profiles = pool
+    overall = score_matrix(resumes, profiles)['overall']
+    for i, resume in enumerate(resumes):
+        for j, profile in enumerate(profiles):
+            assert overall[i][j] == ATSScoring.calculate_score(resume, profile.keywords, profile)['overall']
+
+
+def test_pool_is_encoded_once(pool):
+    resumes, profiles = pool
+    cache = BatchScorerCache(2)
+    scorer = cache.get(resumes)
+
+    assert cache.get([dict(resume) for resume in resumes]) is scorer
+    assert cache.get(resumes[:10]) is not scorer
+    # Scoring new jobs on a cached pool gives the same results as a fresh one
+    assert scorer.score(profiles[:3])['overall'].tolist() == server.BatchScorer(resumes).score(
+        profiles[:3])['overall'].tolist()
+
+
+def test_cache_is_bounded():
+    cache = BatchScorerCache(2)
+    first = cache.get([{'summary': 'one'}])
+    cache.get([{'summary': 'two'}])
+    cache.get([{'summary': 'three'}])
+
+    assert len(cache.scorers) == 2
+    assert cache.get([{'summary': 'one'}]) is not first
+
+
+def test_score_matrix_pool_id(pool):
+    resumes, _ = pool
+    jobs = corpus.job_descriptions(3, seed=13)
+    client = server.app.test_client()
+
+    first = client.post('/api/score-matrix', json={'resumes': resumes, 'jobDescriptions': jobs}).get_json()
+    again = client.post('/api/score-matrix', json={'poolId': first['poolId'], 'jobDescriptions': jobs}).get_json()
+    unknown = client.post('/api/score-matrix', json={'poolId': 'unknown', 'jobDescriptions': jobs})
+
+    assert again['scores'] == first['scores']
+    assert again['poolId'] == first['poolId']
+    assert unknown.status_code == 404
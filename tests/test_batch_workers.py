@@ -0,0 +1,34 @@
+"""Batch worker pool: workers start cleanly while another thread holds a server lock"""
+
+import os
+import sys
+
+import pytest
+
+import server
+from server import KeywordExtractor, app, metrics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+import corpus  # noqa: E402
+
+
+@pytest.fixture
+def batch_pool(monkeypatch):
+    monkeypatch.setitem(app.config, 'BATCH_WORKERS', 2)
+    monkeypatch.setitem(app.config, 'BATCH_CHUNK_SIZE', 10)
+    monkeypatch.setattr(server, '_batch_executor', None)
+    yield
+    if server._batch_executor is not None:
+        server._batch_executor.shutdown(cancel_futures=True)
+
+
+def test_workers_do_not_inherit_held_locks(batch_pool):
+    jobs = corpus.job_descriptions(60, seed=41)
+    with metrics.lock:
+        # Workers start while the lock is held; forked ones would wait on their copy of it forever
+        futures = [server.get_batch_executor().submit(
+            server.apply_to_chunk, KeywordExtractor.extract_from_job_description, jobs[start:start + 10])
+            for start in range(0, len(jobs), 10)]
+        results = [result for future in futures for result in future.result(timeout=60)]
+
+    assert results == [KeywordExtractor.extract_from_job_description(job) for job in jobs]
@@ -0,0 +1,88 @@
+"""ParsePool: per-document timeouts that only stop the stuck document's worker"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from server import ParsePool
+
+
+def sleepy_parse(content, filename):
+    """Stand-in parser taking as many seconds as the content says, or hanging on 'stuck'"""
+    text = content.decode('utf-8')
+    time.sleep(3600 if text == 'stuck' else float(text))
+    return {'rawText': text, 'pid': os.getpid()}, [('parse_text', 0.0)]
+
+
+def failing_parse(content, filename):
+    raise ValueError(f'Unsupported file format: {filename}')
+
+
+def parse_all(pool, documents):
+    """Parse documents concurrently, one thread each; results in the same order"""
+    results = [None] * len(documents)
+
+    def run(i):
+        results[i] = pool.parse(documents[i].encode('utf-8'), 'resume.txt')
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(documents))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.fixture
+def pool():
+    pool = ParsePool(2, 100, 3, parse=sleepy_parse)
+    parse_all(pool, ['0', '0'])  # Both workers started before anything is timed
+    yield pool
+    pool.close()
+
+
+def test_parses_in_a_worker_process(pool):
+    parsed = pool.parse(b'0', 'resume.txt')
+    assert parsed['rawText'] == '0'
+    assert parsed['pid'] != os.getpid()
+
+
+def test_timeout_only_stops_the_stuck_document(pool):
+    slow, stuck = parse_all(pool, ['2', 'stuck'])
+
+    assert slow['rawText'] == '2'
+    assert stuck['errorType'] == 'timeout'
+    assert 'error' not in slow
+
+
+def test_stuck_worker_is_replaced(pool):
+    pids = {result['pid'] for result in parse_all(pool, ['0.2', '0.2'])}
+    assert len(pids) == 2
+
+    start = time.monotonic()
+    assert pool.parse(b'stuck', 'resume.txt')['errorType'] == 'timeout'
+    assert time.monotonic() - start < 10
+
+    after = {result['pid'] for result in parse_all(pool, ['0.2', '0.2'])}
+    assert len(after) == 2
+    assert len(after & pids) == 1  # The worker that was not stuck kept running
+
+
+def test_workers_are_recycled_after_max_tasks():
+    pool = ParsePool(1, 2, 10, parse=sleepy_parse)
+    try:
+        pids = [pool.parse(b'0', 'resume.txt')['pid'] for _ in range(4)]
+    finally:
+        pool.close()
+    assert pids[0] == pids[1] != pids[2] == pids[3]
+
+
+def test_worker_exceptions_are_raised_in_the_caller():
+    pool = ParsePool(1, 100, 10, parse=failing_parse)
+    try:
+        with pytest.raises(ValueError, match='resume.xyz'):
+            pool.parse(b'', 'resume.xyz')
+    finally:
+        pool.close()
@@ -0,0 +1,89 @@
+"""PDF pages are parsed to the end, within the page and character limits"""
+
+import PyPDF2
+import pytest
+
+from server import ResumeParser, app
+
+
+class FakePage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        return self.text
+
+
+class FakeReader:
+    pages = []
+
+    def __init__(self, stream):
+        pass
+
+
+def experience_pages(jobs, jobs_per_page):
+    """A resume whose last section, Experience, spans several pages"""
+    first = '\n'.join(['Jane Doe', 'jane@example.com', 'Summary', 'Engineer with ten years of experience.',
+                       'Skills', 'Python, SQL', 'Education', 'B.S. Computer Science', 'Projects', 'GoBot',
+                       'Experience'])
+    lines = [f'Software Engineer {i} | Company {i}\n- Built system {i} serving 1000 users' for i in range(jobs)]
+    return [first] + ['\n'.join(lines[start:start + jobs_per_page]) for start in range(0, jobs, jobs_per_page)]
+
+
+@pytest.fixture
+def pdf_pages(monkeypatch):
+    """Make parse_pdf read the given page texts"""
+    def use(pages):
+        monkeypatch.setattr(FakeReader, 'pages', [FakePage(text) for text in pages])
+    monkeypatch.setattr(PyPDF2, 'PdfReader', FakeReader)
+    return use
+
+
+def test_long_last_section_is_read_to_the_end(pdf_pages):
+    pages = experience_pages(20, 2)
+    pdf_pages(pages)
+
+    parsed = ResumeParser.parse_pdf(b'')
+    text = ResumeParser.parse_text(''.join(page + '\n' for page in pages))
+
+    assert len(parsed['experience']) == 20
+    assert parsed == text
+    assert 'truncated' not in parsed
+
+
+def test_page_limit_marks_the_result_truncated(pdf_pages):
+    pdf_pages(experience_pages(20, 2))
+
+    parsed = ResumeParser.parse_pdf(b'', max_pages=3)
+
+    assert len(parsed['experience']) == 4
+    assert parsed['truncated'] is True
+
+
+def test_character_limit_marks_the_result_truncated(pdf_pages):
+    pages = experience_pages(4, 2)
+    pdf_pages(pages)
+
+    parsed = ResumeParser.parse_pdf(b'', max_chars=len(pages[0]) + 1)
+
+    assert parsed['rawText'] == pages[0] + '\n'
+    assert parsed['truncated'] is True
+
+
+def test_limits_default_to_the_app_config(pdf_pages, monkeypatch):
+    pdf_pages(experience_pages(20, 2))
+    monkeypatch.setitem(app.config, 'MAX_PDF_PAGES', 2)
+
+    parsed = ResumeParser.parse_pdf(b'')
+
+    assert len(parsed['experience']) == 2
+    assert parsed['truncated'] is True
+
+
+def test_explicit_zero_limit_is_not_the_default(pdf_pages):
+    pdf_pages(experience_pages(4, 2))
+
+    parsed = ResumeParser.parse_pdf(b'', max_pages=0)
+
+    assert parsed['rawText'] == ''
+    assert parsed['truncated'] is True
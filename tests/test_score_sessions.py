@@ -0,0 +1,104 @@
+"""ScoreSession: incremental rescoring matches a full calculate_score, bad patches are rejected"""
+
+import copy
+import os
+import random
+import sys
+
+import pytest
+
+import server
+from server import ATSScoring, ScoreSession, job_profiles
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+import corpus  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def profile():
+    return job_profiles.for_description(corpus.job_descriptions(1, seed=21)[0])
+
+
+def random_operation(rng, resume):
+    """A valid add/replace/remove somewhere in the resume"""
+    experience = resume.get('experience') or []
+    bullet = corpus.make_bullet(rng)
+    choice = rng.randrange(7)
+    if choice == 0:
+        return {'op': 'replace', 'path': '/summary', 'value': ' '.join(corpus.make_bullet(rng) for _ in range(3))}
+    if choice == 1:
+        return {'op': 'replace', 'path': '/technicalSkills', 'value': rng.choice(['Python, SQL', '', 'Go, Docker'])}
+    if choice == 2:
+        return {'op': 'remove' if resume.get('phone') else 'add', 'path': '/phone', 'value': '555-0100'}
+    if choice == 3 or not experience:
+        return {'op': 'add', 'path': '/experience/-',
+                'value': {'title': 'Engineer', 'company': 'Acme', 'bullets': [bullet]}}
+    index = rng.randrange(len(experience))
+    bullets = experience[index].get('bullets') or []
+    if choice == 4 and bullets:
+        return {'op': 'replace', 'path': f'/experience/{index}/bullets/{rng.randrange(len(bullets))}',
+                'value': bullet}
+    if choice == 5:
+        return {'op': 'add', 'path': f'/experience/{index}/bullets/-', 'value': bullet}
+    return {'op': 'remove', 'path': f'/experience/{index}'}
+
+
+def test_patches_match_a_full_score(profile):
+    rng = random.Random(22)
+    for resume in corpus.resumes(5, seed=23):
+        session = ScoreSession(resume, profile)
+        for _ in range(30):
+            operations = [random_operation(rng, session.resume) for _ in range(rng.randint(1, 2))]
+            try:
+                session.apply(operations)
+            except ValueError:
+                # Two operations on the same entry can invalidate each other's paths
+                continue
+            assert session.result == ATSScoring.calculate_score(session.resume, profile.keywords, profile)
+
+
+def test_patches_leave_the_input_alone(profile):
+    resume = corpus.resumes(1, seed=24)[0]
+    original = copy.deepcopy(resume)
+    session = ScoreSession(resume, profile)
+    before = session.resume
+    snapshot = copy.deepcopy(before)
+
+    session.apply([{'op': 'replace', 'path': '/experience/0/bullets/0', 'value': 'Led a team of 5'},
+                   {'op': 'replace', 'path': '/summary', 'value': 'Changed'}])
+
+    assert resume == original
+    # The previous state is copied on write, not edited in place
+    assert before == snapshot
+    assert session.resume['experience'][1] is before['experience'][1]
+
+
+@pytest.mark.parametrize('operation', [
+    {'op': 'replace', 'path': '/experience', 'value': [1, 2]},
+    {'op': 'replace', 'path': '/experience/0', 'value': 'text'},
+    {'op': 'add', 'path': '/experience/0/bullets/-', 'value': 5},
+    {'op': 'replace', 'path': '/experience/0/title', 'value': {'a': 1}},
+    {'op': 'replace', 'path': '/experience/0/bullets', 'value': None},
+    {'op': 'replace', 'path': '/summary', 'value': ['a']},
+    {'op': 'add', 'path': '/projects', 'value': {'name': 'x'}},
+    {'op': 'replace', 'path': '/experience/9/title', 'value': 'x'},
+])
+def test_bad_values_are_rejected(profile, operation):
+    resume = corpus.resumes(1, seed=25)[0]
+    client = server.app.test_client()
+    created = client.post('/api/score-sessions', json={'resumeData': resume, 'jobKeywords': profile.keywords})
+    session_id = created.get_json()['sessionId']
+    session = server.score_sessions.get(session_id)
+    state = copy.deepcopy(session.resume), session.result
+
+    response = client.patch(f'/api/score-sessions/{session_id}', json={'patch': [operation]})
+
+    assert response.status_code == 400
+    assert (session.resume, session.result) == state
+
+
+def test_bad_resume_is_rejected(profile):
+    client = server.app.test_client()
+    for resume_data in ([], {'experience': [1, 2]}, {'experience': [{'bullets': None}]}):
+        response = client.post('/api/score-sessions', json={'resumeData': resume_data, 'jobKeywords': profile.keywords})
+        assert response.status_code == 400
@@ -0,0 +1,76 @@
+"""TaxonomyWatcher reloads in the background, and ResumeIndex reindexes after a taxonomy change"""
+
+import json
+import os
+
+import pytest
+
+import server
+from server import KeywordExtractor, ResumeIndex, Taxonomy, TaxonomyWatcher, job_profiles
+
+
+@pytest.fixture
+def builtin_taxonomy(monkeypatch):
+    monkeypatch.setattr(KeywordExtractor, 'TAXONOMY', Taxonomy.builtin())
+    return KeywordExtractor.TAXONOMY
+
+
+def write_taxonomy(path, data):
+    path.write_text(json.dumps(data), encoding='utf-8')
+    # Make sure the change is seen even within one timestamp tick
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def join(thread):
+    if thread is not None:
+        thread.join(30)
+
+
+def test_watcher_reloads_in_the_background(tmp_path, builtin_taxonomy):
+    path = tmp_path / 'skills.json'
+    write_taxonomy(path, {'extend': True, 'technical': {'custom': ['Zig']}})
+    watcher = TaxonomyWatcher(str(path), 0)
+    watcher.load()
+    loaded = KeywordExtractor.TAXONOMY
+
+    write_taxonomy(path, {'extend': True, 'technical': {'custom': ['Zig', 'Crystal']}})
+    watcher.check()
+    join(watcher.reloading)
+    assert KeywordExtractor.TAXONOMY is not loaded
+    assert 'crystal' in KeywordExtractor.TAXONOMY.matcher.rank
+
+    # A broken file keeps the current taxonomy
+    current = KeywordExtractor.TAXONOMY
+    path.write_text('{not json', encoding='utf-8')
+    watcher.check()
+    join(watcher.reloading)
+    assert KeywordExtractor.TAXONOMY is current
+    assert not watcher.lock.locked()
+
+
+def test_index_reindexes_after_a_taxonomy_change(tmp_path, builtin_taxonomy):
+    index = ResumeIndex(str(tmp_path / 'index.db'))
+    index.add('a', {'summary': 'Built services in Python and Zig'})
+    index.add('b', {'summary': 'Built services in Python'})
+    profile = job_profiles.for_keywords({'all': ['Zig'], 'technical': ['Zig'], 'soft': []})
+
+    # A new index starts on the current taxonomy, so its first search has nothing to rebuild
+    assert index.search(profile, 5, 5)['stale'] is False
+    assert index.reindexing is None
+    assert index.candidates({'Zig'}, 5) == []
+
+    KeywordExtractor.TAXONOMY = Taxonomy.from_dict({'extend': True, 'technical': {'custom': ['Zig']}})
+    assert index.search(profile, 5, 5)['stale'] is True
+    join(index.reindexing)
+
+    assert index.candidates({'Zig'}, 5) == ['a']
+    assert index.search(profile, 5, 5)['stale'] is False
+    # The version is stored, so a fresh process does not reindex again
+    assert ResumeIndex(index.db_path).refresh() is False
+
+
+def test_index_match_reports_staleness(builtin_taxonomy):
+    client = server.app.test_client()
+    response = client.post('/api/index/match', json={'jobKeywords': {'all': ['Python'], 'technical': ['Python']}})
+    assert 'stale' in response.get_json()
@@ -0,0 +1,57 @@
+"""TaxonomySnapshot: a JSON snapshot loads into a taxonomy that matches exactly like a fresh compile"""
+
+import json
+import os
+import random
+import sys
+
+import pytest
+
+from server import Taxonomy, TaxonomySnapshot
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+import corpus  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def taxonomy():
+    return Taxonomy.from_dict(corpus.taxonomy(500, seed=31))
+
+
+@pytest.fixture
+def snapshot(tmp_path, taxonomy):
+    path = str(tmp_path / 'taxonomy.snapshot')
+    TaxonomySnapshot.write(taxonomy, path)
+    return path
+
+
+def test_round_trip_matches_a_fresh_compile(snapshot, taxonomy):
+    matcher, verb_pattern, display = TaxonomySnapshot(snapshot).read(taxonomy.version)
+
+    rng = random.Random(32)
+    vocabulary = list(taxonomy.matcher.canonical)
+    texts = corpus.resume_texts(20, seed=33) + [' '.join(rng.sample(vocabulary, 30)) for _ in range(50)]
+    for text in texts:
+        assert matcher.match(text) == taxonomy.matcher.match(text)
+    assert verb_pattern.pattern == taxonomy.verb_pattern.pattern
+    assert display == taxonomy.display
+
+
+def test_snapshot_is_plain_json(snapshot, taxonomy):
+    with open(snapshot, 'rb') as file:
+        header = json.loads(file.readline())
+        body = json.loads(file.read())
+    assert header['taxonomy'] == taxonomy.version
+    assert body['tables']['pattern'] == taxonomy.matcher.pattern.pattern
+
+
+def test_other_versions_and_damaged_files_are_ignored(snapshot, taxonomy):
+    assert TaxonomySnapshot(snapshot).read('other') is None
+    assert TaxonomySnapshot(snapshot + '.missing').read(taxonomy.version) is None
+
+    with open(snapshot, 'rb') as file:
+        content = file.read()
+    for damaged in (content[:len(content) // 2], content[:-10] + b'X' + content[-9:], b'', b'not json\n{}'):
+        with open(snapshot, 'wb') as file:
+            file.write(damaged)
+        assert TaxonomySnapshot(snapshot).read(taxonomy.version) is None